@@ -0,0 +1,113 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+_read_from_replica: ContextVar[bool] = ContextVar('read_from_replica', default=False)
+
+STICKY_CACHE_KEY = 'read_replica:sticky:{user_id}'
+
+
+@contextmanager
+def read_from_replica():
+    """
+    Envia as leituras feitas dentro do bloco para as réplicas (DATABASE_REPLICAS).
+
+    Fora do bloco (escritas, tasks do Celery, comandos) tudo vai para o primário.
+    """
+    token = _read_from_replica.set(True)
+    try:
+        yield
+    finally:
+        _read_from_replica.reset(token)
+
+
+def mark_user_as_sticky(user_id) -> None:
+    cache.set(STICKY_CACHE_KEY.format(user_id=user_id), True, timeout=settings.READ_REPLICA_STICKY_SECONDS)
+
+
+def is_user_sticky(user_id) -> bool:
+    return cache.get(STICKY_CACHE_KEY.format(user_id=user_id), False)
+
+
+class ReadReplicaRouter:
+    """
+    Router que distribui as leituras das requisições seguras entre as réplicas.
+
+    Configurações:
+    - DATABASE_REPLICAS: aliases de DATABASES usados para leitura (vazio desativa o router)
+    - as leituras só vão para uma réplica dentro de `read_from_replica()` (ReadReplicaMiddleware)
+    - dentro de uma transação no primário a leitura fica no primário, que já vê as escritas dela
+    - escritas e migrations sempre no primário
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        if not replicas or not _read_from_replica.get() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Réplicas têm os mesmos dados do primário, então objetos de qualquer alias podem se relacionar.
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReadReplicaMiddleware:
+    """
+    Lê das réplicas em requisições GET/HEAD/OPTIONS.
+
+    Depois de uma escrita bem-sucedida o usuário (claim `user_id` do JWT) fica
+    READ_REPLICA_STICKY_SECONDS lendo do primário, para enxergar as próprias
+    alterações mesmo com atraso de replicação.
+    """
+
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        self.authentication = JWTAuthentication()
+
+    def __get_user_id(self, request):
+        header = self.authentication.get_header(request)
+        raw_token = self.authentication.get_raw_token(header) if header else None
+        if raw_token is None:
+            return None
+
+        try:
+            return self.authentication.get_validated_token(raw_token).get(api_settings.USER_ID_CLAIM)
+        except (InvalidToken, TokenError):
+            return None
+
+    def __call__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        user_id = self.__get_user_id(request)
+
+        if request.method not in self.SAFE_METHODS:
+            response = self.get_response(request)
+            if user_id is not None and response.status_code < 400:
+                mark_user_as_sticky(user_id)
+            return response
+
+        if user_id is not None and is_user_sticky(user_id):
+            return self.get_response(request)
+
+        with read_from_replica():
+            return self.get_response(request)
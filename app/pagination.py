@@ -1,4 +1,171 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from uuid import UUID
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Classe de paginação por cursor (keyset).
+
+    A posição de cada página é guardada em um cursor opaco com os valores dos
+    campos de ordenação do último registro retornado. A próxima página é
+    filtrada a partir desses valores (``WHERE (title, uuid) > (...)``), então
+    páginas profundas custam o mesmo que a primeira e nenhum COUNT(*) é feito.
+
+    Configurações:
+    - ordering: `keyset_ordering` da view, ordenação da queryset ou `Meta.ordering` do model
+    - desempate: a primary key do model (`uuid`) é sempre adicionada ao final da ordenação
+    - page_size: 10 registros por página (padrão), customizável via `page_size`, máximo de 50
+    """
+
+    page_size = 10
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset, view)
+
+        position, reverse = self.decode_cursor(request)
+        ordering = self.__reverse_ordering(self.ordering) if reverse else self.ordering
+
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.__build_keyset_filter(ordering, position))
+
+        results = list(queryset[: self.page_size + 1])
+        has_following = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        if reverse:
+            results.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_following
+        else:
+            self.has_next = has_following
+            self.has_previous = position is not None
+
+        self.page = results
+        return results
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, queryset, view) -> list[str]:
+        ordering = getattr(view, 'keyset_ordering', None) or queryset.query.order_by or queryset.model._meta.ordering
+        ordering = list(ordering)
+
+        tiebreaker = queryset.model._meta.pk.name
+        if tiebreaker not in {field.lstrip('-') for field in ordering}:
+            ordering.append(tiebreaker)
+
+        return ordering
+
+    def get_next_link(self) -> str | None:
+        if not self.has_next:
+            return None
+
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> str | None:
+        if not self.has_previous:
+            return None
+
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def encode_cursor(self, instance, reverse: bool) -> str:
+        position = [self.__encode_value(getattr(instance, field.lstrip('-'))) for field in self.ordering]
+        payload = json.dumps({'p': position, 'r': reverse}, separators=(',', ':'))
+        cursor = base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def decode_cursor(self, request) -> tuple[list | None, bool]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            position = payload['p']
+            reverse = bool(payload['r'])
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, reverse
+
+    def __encode_value(self, value):
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, UUID):
+            return str(value)
+        return value
+
+    def __reverse_ordering(self, ordering: list[str]) -> list[str]:
+        return [field[1:] if field.startswith('-') else f'-{field}' for field in ordering]
+
+    def __build_keyset_filter(self, ordering: list[str], position: list) -> Q:
+        keyset_filter = Q(pk__in=[])
+        previous_fields_equal = Q()
+
+        for field, value in zip(ordering, position):
+            field_name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+
+            keyset_filter |= previous_fields_equal & Q(**{f'{field_name}__{lookup}': value})
+            previous_fields_equal &= Q(**{field_name: value})
+
+        # Limite redundante na primeira coluna: vira condição do índice (ex.: title >= x), então o
+        # index scan começa na posição do cursor em vez de filtrar todas as linhas anteriores.
+        first_field = ordering[0]
+        first_lookup = 'lte' if first_field.startswith('-') else 'gte'
+        keyset_filter &= Q(**{f'{first_field.lstrip("-")}__{first_lookup}': position[0]})
+
+        return keyset_filter
 
 
 class CustomPageNumberPagination(PageNumberPagination):
@@ -9,8 +176,34 @@ class CustomPageNumberPagination(PageNumberPagination):
     - page_size: 10 registros por página (padrão)
     - page_size_query_param: permite customizar o tamanho da página via query param
     - max_page_size: máximo de 50 registros por página
+
+    O cliente pode optar pela paginação por cursor (KeysetPagination) em cada
+    requisição enviando `?pagination=cursor` ou um `?cursor=` recebido nos links.
     """
 
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 50
+    pagination_query_param = 'pagination'
+    keyset_pagination_class = KeysetPagination
+
+    keyset_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.__wants_keyset_pagination(request):
+            self.keyset_paginator = self.keyset_pagination_class()
+            return self.keyset_paginator.paginate_queryset(queryset, request, view=view)
+
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data):
+        if self.keyset_paginator is not None:
+            return self.keyset_paginator.get_paginated_response(data)
+
+        return super().get_paginated_response(data)
+
+    def __wants_keyset_pagination(self, request) -> bool:
+        query_params = request.query_params
+        cursor_query_param = self.keyset_pagination_class.cursor_query_param
+
+        return cursor_query_param in query_params or query_params.get(self.pagination_query_param) == 'cursor'
@@ -1,20 +1,25 @@
 from rest_framework import permissions
 
+from apps.authentication.services.permission_cache import user_permission_cache
+
 
 class GlobalDefaultPermission(permissions.BasePermission):
+    # Codenames resolvidos por (classe da view, método HTTP), calculados uma única vez por processo.
+    _codenames_by_view = {}
+
     def has_object_permission(self, request, view, obj):
         model_permission_codename = self.__get_model_permission_codename(method=request.method, view=view)
 
         if not model_permission_codename:
             return False
 
-        return request.user.has_perm(model_permission_codename)
+        return self.__user_has_perm(request.user, model_permission_codename)
 
     def has_permission(self, request, view):
         model_permission_codename = self.__get_model_permission_codename(method=request.method, view=view)
         if not model_permission_codename:
             return False
-        return request.user.has_perm(model_permission_codename)
+        return self.__user_has_perm(request.user, model_permission_codename)
 
     def __get_action_suffix(self, method):
         method_actions = {
@@ -30,6 +35,13 @@ class GlobalDefaultPermission(permissions.BasePermission):
         return method_actions.get(method, '')
 
     def __get_model_permission_codename(self, method, view):
+        key = (type(view), method)
+        if key not in self._codenames_by_view:
+            self._codenames_by_view[key] = self.__build_model_permission_codename(method=method, view=view)
+
+        return self._codenames_by_view[key]
+
+    def __build_model_permission_codename(self, method, view):
         try:
             model_name = view.queryset.model._meta.model_name
             app_label = view.queryset.model._meta.app_label
@@ -39,3 +51,16 @@ class GlobalDefaultPermission(permissions.BasePermission):
             return None
 
         return f'{app_label}.{action}_{model_name}'
+
+    def __user_has_perm(self, user, codename):
+        # Mesma semântica do ModelBackend.has_perm, mas lendo as permissões do cache compartilhado.
+        if not user.is_authenticated or not user.is_active:
+            return user.has_perm(codename)
+
+        if user.is_superuser:
+            return True
+
+        if not hasattr(user, '_global_permission_cache'):
+            user._global_permission_cache = user_permission_cache.get(user)
+
+        return codename in user._global_permission_cache
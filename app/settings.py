@@ -51,6 +51,11 @@ EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD')
 EMAIL_TIMEOUT = int(os.environ.get('EMAIL_TIMEOUT', 30))
 DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', EMAIL_HOST_USER)
 
+# Review notifications
+# 'immediate' sends one e-mail per review on commit; 'digest' groups pending reviews per recipient every interval (seconds)
+REVIEW_NOTIFICATION_DELIVERY = os.environ.get('REVIEW_NOTIFICATION_DELIVERY', 'immediate')
+REVIEW_NOTIFICATION_DIGEST_INTERVAL = int(os.environ.get('REVIEW_NOTIFICATION_DIGEST_INTERVAL', 900))
+
 
 # Application definition
 
@@ -75,6 +80,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
 ]
 
@@ -89,6 +95,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'app.db_routers.ReadReplicaMiddleware',
 ]
 
 
@@ -107,10 +114,13 @@ LOGGING = {
             'formatter': 'default',
         },
         # 'mongo': {
-        #     '()': 'logs.handlers.create_mongo_handler',
+        #     '()': 'apps.logs.handlers.create_mongo_handler',
         #     'mongo_uri': MONGO_URI,
         #     'db_name': os.environ.get('MONGO_INITDB_DATABASE'),
         #     'collection': 'logs',
+        #     'batch_size': int(os.environ.get('MONGO_LOG_BATCH_SIZE', 100)),
+        #     'flush_interval': float(os.environ.get('MONGO_LOG_FLUSH_INTERVAL', 1.0)),
+        #     'max_queue_size': int(os.environ.get('MONGO_LOG_MAX_QUEUE_SIZE', 10000)),
         #     'formatter': 'default',
         # },
     },
@@ -151,17 +161,59 @@ WSGI_APPLICATION = 'app.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Persistent connections: seconds a connection is reused across requests (0 closes it at the end of each request)
+POSTGRES_CONN_MAX_AGE = int(os.environ.get('POSTGRES_CONN_MAX_AGE', 60))
+# Checks a reused connection before the request (drops connections closed by the server or a restart)
+POSTGRES_CONN_HEALTH_CHECKS = os.environ.get('POSTGRES_CONN_HEALTH_CHECKS', 'True').lower() == 'true'
+# psycopg 3 connection pool per process (replaces persistent connections, which Django disables when pooling)
+POSTGRES_POOL = os.environ.get('POSTGRES_POOL', 'False').lower() == 'true'
+POSTGRES_POOL_MIN_SIZE = int(os.environ.get('POSTGRES_POOL_MIN_SIZE', 2))
+POSTGRES_POOL_MAX_SIZE = int(os.environ.get('POSTGRES_POOL_MAX_SIZE', 10))
+# Seconds a request waits for a free pooled connection before failing
+POSTGRES_POOL_TIMEOUT = float(os.environ.get('POSTGRES_POOL_TIMEOUT', 10))
+
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql_psycopg2',
+        'ENGINE': 'django.db.backends.postgresql',
         'NAME': os.environ.get('POSTGRES_DB'),
         'USER': os.environ.get('POSTGRES_USER'),
         'PASSWORD': os.environ.get('POSTGRES_PASSWORD'),
         'HOST': os.environ.get('POSTGRES_HOST'),
         'PORT': int(os.environ.get('POSTGRES_PORT')),
+        'CONN_MAX_AGE': 0 if POSTGRES_POOL else POSTGRES_CONN_MAX_AGE,
+        'CONN_HEALTH_CHECKS': POSTGRES_CONN_HEALTH_CHECKS,
+        'OPTIONS': {},
     }
 }
 
+if POSTGRES_POOL:
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': POSTGRES_POOL_MIN_SIZE,
+        'max_size': POSTGRES_POOL_MAX_SIZE,
+        'timeout': POSTGRES_POOL_TIMEOUT,
+    }
+
+# Read replicas
+# Comma-separated replica hosts (host or host:port); reads of GET/HEAD/OPTIONS requests go to them (see app.db_routers)
+POSTGRES_REPLICA_HOSTS = [host.strip() for host in os.environ.get('POSTGRES_REPLICA_HOSTS', '').split(',') if host.strip()]
+DATABASE_REPLICAS = []
+
+for index, replica_host in enumerate(POSTGRES_REPLICA_HOSTS, start=1):
+    replica_host, _, replica_port = replica_host.partition(':')
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'HOST': replica_host,
+        'PORT': int(replica_port) if replica_port else DATABASES['default']['PORT'],
+        'OPTIONS': {**DATABASES['default']['OPTIONS']},
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['app.db_routers.ReadReplicaRouter']
+# Seconds a user keeps reading from the primary after a write, so replication lag never hides their own changes
+READ_REPLICA_STICKY_SECONDS = int(os.environ.get('READ_REPLICA_STICKY_SECONDS', 5))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -201,10 +253,69 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    'send-review-notification-digest': {
+        'task': 'apps.reviews.tasks.send_review_notification_digest',
+        'schedule': REVIEW_NOTIFICATION_DIGEST_INTERVAL,
+    },
+}
 
 
 # OpenAI Configuration
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
+# Seconds per request attempt and retries (with exponential backoff) made by the SDK
+OPENAI_TIMEOUT = float(os.environ.get('OPENAI_TIMEOUT', 30))
+OPENAI_MAX_RETRIES = int(os.environ.get('OPENAI_MAX_RETRIES', 2))
+# Connection pool shared by every OpenAI call in the process
+OPENAI_MAX_CONNECTIONS = int(os.environ.get('OPENAI_MAX_CONNECTIONS', 20))
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get('OPENAI_MAX_KEEPALIVE_CONNECTIONS', 10))
+
+
+# AI adapters
+# Adapters are imported and instantiated on first use (see apps.core.adapters.ai_adapters.factory)
+AI_ADAPTERS = {
+    'openai': 'apps.core.adapters.ai_adapters.open_ai_adapter.OpenAIAdapter',
+    'local': 'apps.core.adapters.ai_adapters.local_adapter.LocalAIAdapter',
+}
+AI_ADAPTER = os.environ.get('AI_ADAPTER', 'openai')
+# Offline 'local' adapter: synthetic latency (seconds) and optional answer template ({digest} is the prompt hash)
+AI_LOCAL_LATENCY = float(os.environ.get('AI_LOCAL_LATENCY', 0.5))
+AI_LOCAL_RESPONSE = os.environ.get('AI_LOCAL_RESPONSE', '')
+# Answers cached in memory by a hash of model + prompt (seconds, 0 disables the cache)
+AI_RESPONSE_CACHE_TTL = int(os.environ.get('AI_RESPONSE_CACHE_TTL', 86400))
+AI_RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get('AI_RESPONSE_CACHE_MAX_ENTRIES', 1024))
+
+
+# Cache
+# Shared cache (Redis) when CACHE_URL is set; otherwise a per-process in-memory cache
+CACHE_URL = os.environ.get('CACHE_URL')
+
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Seconds each user's permission set stays cached (it is also invalidated on group/permission changes)
+PERMISSION_CACHE_TIMEOUT = int(os.environ.get('PERMISSION_CACHE_TIMEOUT', 300))
+
+
+# Movie stats snapshot
+# Seconds the GET /movies/stats/ payload is served from the shared cache (0 disables the snapshot)
+MOVIE_STATS_SNAPSHOT_TTL = int(os.environ.get('MOVIE_STATS_SNAPSHOT_TTL', 30))
+
+
+# Movie search
+# PostgreSQL text search configuration of Movie.search_vector (run rebuild_movie_search_vectors after changing it)
+MOVIE_SEARCH_CONFIG = os.environ.get('MOVIE_SEARCH_CONFIG', 'portuguese')
 
 
 # Static files (CSS, JavaScript, Images)
@@ -8,7 +8,7 @@ faker_gen = faker.Faker(locale='en_US')
 
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql_psycopg2',
+        'ENGINE': 'django.db.backends.postgresql',
         'NAME': os.environ.get('POSTGRES_DB'),
         'USER': os.environ.get('POSTGRES_USER'),
         'PASSWORD': os.environ.get('POSTGRES_PASSWORD'),
@@ -16,6 +16,10 @@ DATABASES = {
         'PORT': int(os.environ.get('POSTGRES_PORT')),
     }
 }
+
+# Reads always go to the primary (tests enable replicas with override_settings)
+DATABASE_REPLICAS = []
+
 EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
 
 # Disable celery
@@ -24,6 +28,13 @@ CELERY_TASK_EAGER_PROPAGATES = True
 CELERY_BROKER_URL = 'memory://'
 CELERY_RESULT_BACKEND = 'cache'
 CELERY_CACHE_BACKEND = 'memory'
+CELERY_TASK_STORE_EAGER_RESULT = True
+
+# Disable the movie stats snapshot so each test reads the database
+MOVIE_STATS_SNAPSHOT_TTL = 0
+
+# Disable the AI response cache so each test calls the (mocked) adapter
+AI_RESPONSE_CACHE_TTL = 0
 
 
 # Disable logging
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:30
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+from apps.core.utils.trigram import create_trigram_index, drop_trigram_index
+
+
+def create_name_trigram_index(apps, schema_editor):
+    create_trigram_index(schema_editor, table='actors_actor', column='name', index_name='actor_name_trgm_idx')
+
+
+def drop_name_trigram_index(apps, schema_editor):
+    drop_trigram_index(schema_editor, index_name='actor_name_trgm_idx')
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY não bloqueia escritas na tabela, mas não pode rodar dentro de uma transação.
+    atomic = False
+
+    dependencies = [
+        ('actors', '0002_list_ordering_indexes'),
+    ]
+
+    operations = [
+        # O índice só existe quando o servidor tem pg_trgm (pacote contrib do PostgreSQL); sem ele as
+        # buscas aproximadas caem para comparações sem diferenciar maiúsculas (apps.core.utils.trigram).
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(create_name_trigram_index, drop_name_trigram_index),
+            ],
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='actor',
+                    index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='actor_name_trgm_idx', opclasses=['gin_trgm_ops']),
+                ),
+            ],
+        ),
+    ]
@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models.functions import Lower
 
 from apps.core.models import BaseModel
 
@@ -16,6 +18,14 @@ class Actor(BaseModel):
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            # Listagem ordenada por nome (a paginação por cursor desempata pelo uuid)
+            models.Index(fields=['name', 'uuid'], name='actor_name_uuid_idx'),
+            # Buscas sem diferenciar maiúsculas/minúsculas (lower(name) = lower(%s))
+            models.Index(Lower('name'), name='actor_name_lower_idx'),
+            # Busca aproximada por nome (?q= e importação com --fuzzy); criado só quando o servidor tem pg_trgm
+            GinIndex(fields=['name'], opclasses=['gin_trgm_ops'], name='actor_name_trgm_idx'),
+        ]
 
     def __str__(self):
         return self.name
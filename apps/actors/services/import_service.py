@@ -76,7 +76,7 @@ class ActorImportService:
         }
         logger.info(logger_data)
 
-        rows = self.file_reader.read(self.file_path)
+        rows = self.file_reader.iter_rows(self.file_path)
         for row_num, row in enumerate(rows):
             self.__process_row(row, row_num)
 
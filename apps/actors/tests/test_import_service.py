@@ -43,7 +43,7 @@ class TestActorImportService:
     def test_import_actors_valid_data(self, dataframe_actor_valid):
         # Arrange
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = dataframe_actor_valid.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = dataframe_actor_valid.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -63,7 +63,7 @@ class TestActorImportService:
     def test_import_actors_empty_file(self, dataframe_actor_empty):
         # Arrange
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = dataframe_actor_empty.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = dataframe_actor_empty.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -78,7 +78,7 @@ class TestActorImportService:
     def test_import_actors_multiple_actors(self, dataframe_actor_multiple):
         # Arrange
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = dataframe_actor_multiple.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = dataframe_actor_multiple.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -98,7 +98,7 @@ class TestActorImportService:
             'nationality': ['USA'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = actor_without_name.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = actor_without_name.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -119,7 +119,7 @@ class TestActorImportService:
             'nationality': ['USA'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = actor_without_birthday.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = actor_without_birthday.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -140,7 +140,7 @@ class TestActorImportService:
             'nationality': ['USA'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = actor_invalid_birthday_format.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = actor_invalid_birthday_format.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -162,7 +162,7 @@ class TestActorImportService:
             'nationality': ['USA'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = actor_birthday_future.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = actor_birthday_future.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -183,7 +183,7 @@ class TestActorImportService:
             'nationality': ['INVALID'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = actor_invalid_nationality.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = actor_invalid_nationality.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -206,7 +206,7 @@ class TestActorImportService:
             'nationality': [''],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = actor_nationality_empty.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = actor_nationality_empty.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -230,7 +230,7 @@ class TestActorImportService:
             'nationality': ['USA', 'INVALID'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = actors_multiple_errors.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = actors_multiple_errors.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -252,7 +252,7 @@ class TestActorImportService:
             'nationality': ['USA', 'USA'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = actors_mixed.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = actors_mixed.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -275,7 +275,7 @@ class TestActorImportService:
             'nationality': ['USA'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = actor_name_with_spaces.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = actor_name_with_spaces.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -298,7 +298,7 @@ class TestActorImportService:
             'nationality': ['USA'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = actor_birthday_with_spaces.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = actor_birthday_with_spaces.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -321,7 +321,7 @@ class TestActorImportService:
             'nationality': ['  USA  '],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = actor_nationality_with_spaces.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = actor_nationality_with_spaces.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -344,7 +344,7 @@ class TestActorImportService:
             'nationality': ['BRA'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = actor_bra.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = actor_bra.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -367,7 +367,7 @@ class TestActorImportService:
             'nationality': ['USA'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = actor_usa.to_dict(orient='records')
+        mock_file_reader.iter_rows.return_value = actor_usa.to_dict(orient='records')
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
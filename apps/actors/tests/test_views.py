@@ -41,6 +41,19 @@ class TestActorAPI(BaseAPITest):
         assert response.status_code == status.HTTP_200_OK
         assert response.data['count'] == Actor.objects.count()
 
+    def test_list_actors_filtered_by_name(self):
+        # Arrange
+        ActorFactory(name='Keanu Reeves')
+        ActorFactory(name='Laurence Fishburne')
+        self.give_permissions(model=Actor)
+
+        # Act
+        response = self.client.get(reverse('actor-create-list'), {'q': 'Reeves'})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert [actor['name'] for actor in response.data['results']] == ['Keanu Reeves']
+
     def test_list_actors_without_permissions(self):
         url = reverse('actor-create-list')
         response = self.client.get(url)
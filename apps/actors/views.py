@@ -5,9 +5,10 @@ from app.decorators import log_request
 from app.permissions import GlobalDefaultPermission
 from apps.actors.models import Actor
 from apps.actors.serializers import ActorSerializer
+from apps.core.mixins.fuzzy_name_search_mixin import FuzzyNameSearchQuerysetMixin
 
 
-class ActorCreateListView(generics.ListCreateAPIView):
+class ActorCreateListView(FuzzyNameSearchQuerysetMixin, generics.ListCreateAPIView):
     permission_classes = (IsAuthenticated, GlobalDefaultPermission)
     queryset = Actor.objects.all()
     serializer_class = ActorSerializer
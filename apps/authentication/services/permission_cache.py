@@ -0,0 +1,60 @@
+import time
+from typing import FrozenSet
+
+from django.conf import settings
+from django.core.cache import cache
+
+from app.settings import logger
+
+
+class UserPermissionCache:
+    """
+    Shared cache of each user's permission set ('app_label.codename' strings).
+
+    Entries are namespaced by a global version that is bumped whenever groups,
+    group permissions or user permissions change (see apps.authentication.signals),
+    so a single write invalidates every cached set across all processes sharing
+    the cache backend.
+    """
+
+    VERSION_KEY = 'permissions:version'
+
+    def __get_version(self) -> int:
+        version = cache.get(self.VERSION_KEY)
+        if version is None:
+            # Uma versão nova (e não 1) evita reaproveitar entradas antigas se a chave de versão for removida do cache.
+            version = time.time_ns()
+            if not cache.add(self.VERSION_KEY, version, timeout=None):
+                version = cache.get(self.VERSION_KEY, version)
+
+        return version
+
+    def __get_key(self, user_pk, version: int) -> str:
+        return f'permissions:{version}:{user_pk}'
+
+    def get(self, user) -> FrozenSet[str]:
+        key = self.__get_key(user.pk, self.__get_version())
+
+        permissions = cache.get(key)
+        if permissions is None:
+            logger_data = {
+                'service': 'UserPermissionCache',
+                'method': 'get',
+                'action': 'load',
+                'user': str(user.pk),
+            }
+            logger.debug(logger_data)
+
+            permissions = frozenset(user.get_all_permissions())
+            cache.set(key, permissions, timeout=settings.PERMISSION_CACHE_TIMEOUT)
+
+        return permissions
+
+    def invalidate(self) -> None:
+        try:
+            cache.incr(self.VERSION_KEY)
+        except ValueError:
+            cache.set(self.VERSION_KEY, time.time_ns(), timeout=None)
+
+
+user_permission_cache = UserPermissionCache()
@@ -0,0 +1,31 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete
+from django.dispatch import receiver
+
+from apps.authentication.services.permission_cache import user_permission_cache
+
+User = get_user_model()
+
+M2M_ACTIONS = {'post_add', 'post_remove', 'post_clear'}
+
+
+def invalidate_permission_cache():
+    # Invalida já (para a própria transação) e de novo no commit, descartando sets recarregados com os dados antigos nesse meio tempo.
+    user_permission_cache.invalidate()
+    transaction.on_commit(user_permission_cache.invalidate)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+@receiver(m2m_changed, sender=Group.permissions.through)
+def invalidate_permission_cache_on_m2m_change_signal(sender, action, **kwargs):
+    if action in M2M_ACTIONS:
+        invalidate_permission_cache()
+
+
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Permission)
+def invalidate_permission_cache_on_delete_signal(sender, **kwargs):
+    invalidate_permission_cache()
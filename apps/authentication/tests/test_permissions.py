@@ -0,0 +1,105 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+
+from app.permissions import GlobalDefaultPermission
+from apps.authentication.services.permission_cache import user_permission_cache
+from apps.genres.models import Genre
+
+User = get_user_model()
+
+
+class MockGenreView:
+    queryset = Genre.objects.all()
+
+
+@pytest.mark.django_db
+class TestGlobalDefaultPermissionCache:
+    def setup_method(self):
+        self.permission = GlobalDefaultPermission()
+        self.factory = APIRequestFactory()
+        self.view = MockGenreView()
+
+    def __build_request(self, user, method='get'):
+        request = getattr(self.factory, method)('/genres/')
+        # Simula a autenticação JWT, que recarrega o usuário a cada requisição.
+        request.user = User.objects.get(pk=user.pk)
+        return request
+
+    def test_cached_permissions_cost_no_queries(self, user_with_permissions):
+        # Arrange
+        self.permission.has_permission(self.__build_request(user_with_permissions), self.view)
+        request = self.__build_request(user_with_permissions)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            has_permission = self.permission.has_permission(request, self.view)
+            has_object_permission = self.permission.has_object_permission(request, self.view, obj=None)
+
+        # Assert
+        assert has_permission is True
+        assert has_object_permission is True
+        assert len(queries) == 0
+
+    def test_removing_user_from_group_invalidates_cache(self, user_with_permissions):
+        # Arrange
+        assert self.permission.has_permission(self.__build_request(user_with_permissions), self.view) is True
+        group = Group.objects.get(name='TestGroup')
+
+        # Act
+        user_with_permissions.groups.remove(group)
+
+        # Assert
+        assert self.permission.has_permission(self.__build_request(user_with_permissions), self.view) is False
+
+    def test_group_permission_change_invalidates_cache(self, user_with_permissions):
+        # Arrange
+        request = self.__build_request(user_with_permissions, method='delete')
+        assert self.permission.has_permission(request, self.view) is True
+        group = Group.objects.get(name='TestGroup')
+
+        # Act
+        group.permissions.remove(Permission.objects.get(codename='delete_genre'))
+
+        # Assert
+        assert self.permission.has_permission(self.__build_request(user_with_permissions, method='delete'), self.view) is False
+        assert self.permission.has_permission(self.__build_request(user_with_permissions), self.view) is True
+
+    def test_direct_user_permission_invalidates_cache(self, user_without_permissions):
+        # Arrange
+        assert self.permission.has_permission(self.__build_request(user_without_permissions), self.view) is False
+
+        # Act
+        user_without_permissions.user_permissions.add(Permission.objects.get(codename='view_genre'))
+
+        # Assert
+        assert self.permission.has_permission(self.__build_request(user_without_permissions), self.view) is True
+
+    def test_superuser_skips_permission_lookup(self, mocker):
+        # Arrange
+        superuser = User.objects.create_superuser(username='root', email='root@flix.com', password='password')
+        cache_get = mocker.spy(user_permission_cache, 'get')
+
+        # Act
+        has_permission = self.permission.has_permission(self.__build_request(superuser), self.view)
+
+        # Assert
+        assert has_permission is True
+        cache_get.assert_not_called()
+
+    def test_codename_is_resolved_once_per_view_class(self, user_with_permissions, mocker):
+        # Arrange
+        class OtherGenreView:
+            queryset = Genre.objects.all()
+
+        build_codename = mocker.spy(GlobalDefaultPermission, '_GlobalDefaultPermission__build_model_permission_codename')
+
+        # Act
+        for _ in range(3):
+            self.permission.has_permission(self.__build_request(user_with_permissions), OtherGenreView())
+
+        # Assert
+        assert build_codename.call_count == 1
@@ -1,7 +1,21 @@
+import asyncio
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class AIAgentAdapter(ABC):
     @abstractmethod
-    def answer(self, prompt: str) -> str:
+    def answer(self, prompt: str, timeout: Optional[float] = None) -> str:
+        """
+        Answers `prompt`. Raises TimeoutError (or the client's own timeout error)
+        when `timeout` seconds pass without an answer; None keeps the adapter default.
+        """
         raise NotImplementedError('Subclasses must implement this method')
+
+    async def aanswer(self, prompt: str, timeout: Optional[float] = None) -> str:
+        """
+        Coroutine counterpart of answer(). By default the sync call runs in a
+        worker thread; adapters with a native async client should override it.
+        Raises TimeoutError when `timeout` seconds pass without an answer.
+        """
+        return await asyncio.wait_for(asyncio.to_thread(self.answer, prompt, timeout=timeout), timeout=timeout)
@@ -0,0 +1,108 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from app.settings import logger
+from apps.core.adapters.ai_adapters.base import AIAgentAdapter
+
+
+class CachedAIAgentAdapter(AIAgentAdapter):
+    """
+    Wraps an AIAgentAdapter and caches its answers in memory.
+
+    Answers are keyed by a sha256 of the wrapped model name and the prompt, kept
+    for `ttl` seconds and evicted least-recently-used once `max_entries` is
+    reached. Hits and misses are counted and logged.
+    """
+
+    def __init__(self, adapter: AIAgentAdapter, ttl: int, max_entries: int) -> None:
+        self.adapter = adapter
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self.hits = 0
+        self.misses = 0
+
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    @property
+    def model(self) -> str:
+        return getattr(self.adapter, 'model', self.adapter.__class__.__name__)
+
+    def __build_key(self, prompt: str) -> str:
+        return hashlib.sha256(f'{self.model}\n{prompt}'.encode('utf-8')).hexdigest()
+
+    def __get(self, key: str):
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, answer = entry
+            if time.monotonic() >= expires_at:
+                del self.__entries[key]
+                return None
+
+            self.__entries.move_to_end(key)
+            return answer
+
+    def __set(self, key: str, answer: str) -> None:
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + self.ttl, answer)
+            self.__entries.move_to_end(key)
+
+            while len(self.__entries) > self.max_entries:
+                self.__entries.popitem(last=False)
+
+    def __lookup(self, key: str, method: str) -> Optional[str]:
+        answer = self.__get(key)
+        if answer is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        logger_data = {
+            'service': 'CachedAIAgentAdapter',
+            'method': method,
+            'model': self.model,
+            'key': key[:12],
+            'cache': 'miss' if answer is None else 'hit',
+            'hits': self.hits,
+            'misses': self.misses,
+        }
+        logger.info(logger_data)
+
+        return answer
+
+    def answer(self, prompt: str, timeout: Optional[float] = None) -> str:
+        key = self.__build_key(prompt)
+
+        answer = self.__lookup(key, method='answer')
+        if answer is None:
+            answer = self.adapter.answer(prompt, timeout=timeout)
+            self.__set(key, answer)
+
+        return answer
+
+    async def aanswer(self, prompt: str, timeout: Optional[float] = None) -> str:
+        key = self.__build_key(prompt)
+
+        answer = self.__lookup(key, method='aanswer')
+        if answer is None:
+            answer = await self.adapter.aanswer(prompt, timeout=timeout)
+            self.__set(key, answer)
+
+        return answer
+
+    def stats(self) -> dict:
+        with self.__lock:
+            size = len(self.__entries)
+
+        return {'hits': self.hits, 'misses': self.misses, 'size': size, 'max_entries': self.max_entries}
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
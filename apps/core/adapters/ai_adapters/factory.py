@@ -0,0 +1,51 @@
+from functools import lru_cache
+from typing import Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from apps.core.adapters.ai_adapters.base import AIAgentAdapter
+from apps.core.adapters.ai_adapters.cached_adapter import CachedAIAgentAdapter
+
+
+@lru_cache(maxsize=None)
+def _build_ai_adapter(name: str) -> AIAgentAdapter:
+    try:
+        adapter_path = settings.AI_ADAPTERS[name]
+    except KeyError:
+        raise ImproperlyConfigured(f'AI adapter "{name}" is not registered in AI_ADAPTERS')
+
+    adapter_class = import_string(adapter_path)
+    adapter = adapter_class()
+
+    if settings.AI_RESPONSE_CACHE_TTL > 0:
+        adapter = CachedAIAgentAdapter(
+            adapter,
+            ttl=settings.AI_RESPONSE_CACHE_TTL,
+            max_entries=settings.AI_RESPONSE_CACHE_MAX_ENTRIES,
+        )
+
+    return adapter
+
+
+def get_ai_adapter(name: Optional[str] = None) -> AIAgentAdapter:
+    """
+    Returns the AI adapter registered under `name` in settings.AI_ADAPTERS
+    (settings.AI_ADAPTER by default). Each adapter module is only imported,
+    and its instance built, the first time it is requested. Answers are cached
+    by CachedAIAgentAdapter unless AI_RESPONSE_CACHE_TTL is 0.
+    """
+    return _build_ai_adapter(name or settings.AI_ADAPTER)
+
+
+def clear_ai_adapter_cache() -> None:
+    _build_ai_adapter.cache_clear()
+
+
+@receiver(setting_changed)
+def clear_ai_adapter_cache_signal(setting, **kwargs):
+    if setting in {'AI_ADAPTER', 'AI_ADAPTERS', 'AI_RESPONSE_CACHE_TTL', 'AI_RESPONSE_CACHE_MAX_ENTRIES'}:
+        clear_ai_adapter_cache()
@@ -0,0 +1,50 @@
+import asyncio
+import hashlib
+import time
+from typing import Optional
+
+from django.conf import settings
+
+from apps.core.adapters.ai_adapters.base import AIAgentAdapter
+
+
+class LocalAIAdapter(AIAgentAdapter):
+    """
+    Offline adapter for load tests and benchmarks.
+
+    Answers are derived from a hash of the prompt, so the same prompt always
+    gets the same answer, after a synthetic latency of AI_LOCAL_LATENCY seconds.
+    AI_LOCAL_RESPONSE, when set, is used as the answer template and may
+    reference {digest}.
+    """
+
+    def __init__(self, latency: Optional[float] = None, response: Optional[str] = None) -> None:
+        self.model = 'local'
+        self.latency = settings.AI_LOCAL_LATENCY if latency is None else latency
+        self.response = settings.AI_LOCAL_RESPONSE if response is None else response
+
+    def __build_answer(self, prompt: str) -> str:
+        digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:12]
+        if self.response:
+            return self.response.format(digest=digest)
+
+        return f'Synthetic description {digest}.'
+
+    def answer(self, prompt: str, timeout: Optional[float] = None) -> str:
+        # Como um cliente real, desiste depois de `timeout` segundos quando a latência sintética é maior.
+        if timeout is not None and self.latency > timeout:
+            time.sleep(timeout)
+            raise TimeoutError(f'No answer after {timeout} seconds')
+
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        return self.__build_answer(prompt)
+
+    async def aanswer(self, prompt: str, timeout: Optional[float] = None) -> str:
+        async def answer_later() -> str:
+            if self.latency > 0:
+                await asyncio.sleep(self.latency)
+            return self.__build_answer(prompt)
+
+        return await asyncio.wait_for(answer_later(), timeout=timeout)
@@ -1,20 +1,133 @@
-import openai
+import asyncio
+import threading
+import weakref
+from typing import Optional
+
 from django.conf import settings
 
 from apps.core.adapters.ai_adapters.base import AIAgentAdapter
 
+_clients_lock = threading.Lock()
+# (configurações usadas, cliente): o cliente é recriado quando alguma configuração OPENAI_* muda.
+_client = None
+# httpx.AsyncClient fica preso ao event loop em que abriu as conexões, então há um cliente async por loop.
+_async_clients = weakref.WeakKeyDictionary()
+# Fechamentos assíncronos de clientes substituídos em andamento (o event loop só guarda referências fracas às tasks).
+_closing_tasks = set()
+
+
+def _get_client_settings() -> tuple:
+    return (
+        settings.OPENAI_API_KEY,
+        settings.OPENAI_TIMEOUT,
+        settings.OPENAI_MAX_RETRIES,
+        settings.OPENAI_MAX_CONNECTIONS,
+        settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+    )
+
+
+def _build_client_options() -> dict:
+    return {
+        'api_key': settings.OPENAI_API_KEY,
+        'timeout': settings.OPENAI_TIMEOUT,
+        'max_retries': settings.OPENAI_MAX_RETRIES,
+    }
+
+
+def _build_limits():
+    # httpx é dependência declarada do projeto (pyproject.toml); como o SDK da OpenAI, só é importado quando usado.
+    import httpx  # noqa: PLC0415
+
+    return httpx.Limits(
+        max_connections=settings.OPENAI_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS,
+    )
+
+
+def get_openai_client():
+    """
+    Returns the OpenAI client shared by every adapter in the process, so its
+    pooled HTTP connections are reused across calls. The SDK retries failed
+    requests (connection errors, 408, 409, 429 and 5xx) with exponential backoff
+    up to OPENAI_MAX_RETRIES times. A new client is built when any OPENAI_*
+    setting changes.
+    """
+    global _client  # noqa: PLW0603
+
+    client_settings = _get_client_settings()
+    if _client is None or _client[0] != client_settings:
+        # O SDK da OpenAI é pesado para importar, então só é carregado na primeira chamada ao modelo.
+        import openai  # noqa: PLC0415
+
+        with _clients_lock:
+            if _client is None or _client[0] != client_settings:
+                previous = _client
+                client = openai.OpenAI(**_build_client_options(), http_client=openai.DefaultHttpxClient(limits=_build_limits()))
+                _client = (client_settings, client)
+                # O cliente antigo é fechado para liberar as conexões do pool.
+                if previous is not None:
+                    previous[1].close()
+
+    return _client[1]
+
+
+def get_async_openai_client():
+    import openai  # noqa: PLC0415
+
+    loop = asyncio.get_running_loop()
+    client_settings = _get_client_settings()
+    with _clients_lock:
+        cached = _async_clients.get(loop)
+        if cached is None or cached[0] != client_settings:
+            previous = cached
+            client = openai.AsyncOpenAI(**_build_client_options(), http_client=openai.DefaultAsyncHttpxClient(limits=_build_limits()))
+            cached = (client_settings, client)
+            _async_clients[loop] = cached
+            if previous is not None:
+                task = loop.create_task(previous[1].close())
+                _closing_tasks.add(task)
+                task.add_done_callback(_closing_tasks.discard)
+
+    return cached[1]
+
+
+def reset_openai_clients() -> None:
+    global _client  # noqa: PLW0603
+
+    with _clients_lock:
+        _client = None
+        _async_clients.clear()
+
 
 class OpenAIAdapter(AIAgentAdapter):
     def __init__(self):
         self.model = 'gpt-3.5-turbo'
 
-        self.agent = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+    @property
+    def agent(self):
+        return get_openai_client()
+
+    def __build_messages(self, prompt: str) -> list[dict]:
+        return [
+            {'role': 'system', 'content': prompt},
+        ]
 
-    def answer(self, prompt: str) -> str:
+    def answer(self, prompt: str, timeout: Optional[float] = None) -> str:
+        # Timeout de cada tentativa da chamada (OPENAI_TIMEOUT por padrão), lido a cada chamada e não só ao criar o cliente.
         response = self.agent.chat.completions.create(
             model=self.model,
-            messages=[
-                {'role': 'system', 'content': prompt},
-            ],
+            messages=self.__build_messages(prompt),
+            timeout=settings.OPENAI_TIMEOUT if timeout is None else timeout,
+        )
+        return response.choices[0].message.content
+
+    async def aanswer(self, prompt: str, timeout: Optional[float] = None) -> str:
+        # O timeout limita a chamada inteira, incluindo as novas tentativas feitas pelo SDK.
+        response = await asyncio.wait_for(
+            get_async_openai_client().chat.completions.create(
+                model=self.model,
+                messages=self.__build_messages(prompt),
+            ),
+            timeout=timeout,
         )
         return response.choices[0].message.content
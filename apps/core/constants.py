@@ -1 +1,14 @@
 CSV_LINE_LIMIT = 500
+IMPORT_BATCH_SIZE = 1000
+IMPORT_NAME_CACHE_LIMIT = 10000
+DESCRIPTION_BACKFILL_BATCH_SIZE = 100
+DESCRIPTION_BACKFILL_WORKERS = 4
+DESCRIPTION_BACKFILL_RATE_LIMIT = 3.0
+REVIEW_NOTIFICATION_DELIVERY_IMMEDIATE = 'immediate'
+REVIEW_NOTIFICATION_DELIVERY_DIGEST = 'digest'
+REVIEW_NOTIFICATION_DIGEST_BATCH_SIZE = 1000
+REVIEW_NOTIFICATION_STATUS_CLAIMED = 'claimed'
+REVIEW_NOTIFICATION_STATUS_SENT = 'sent'
+REVIEW_NOTIFICATION_STATUS_FAILED = 'failed'
+REVIEW_NOTIFICATION_STATUS_SKIPPED = 'skipped'
+FUZZY_MATCH_THRESHOLD = 0.5
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.core.utils.trigram import TRIGRAM_EXTENSION, enable_trigram_search, is_trigram_extension_available
+
+
+class Command(BaseCommand):
+    help = f'Create the {TRIGRAM_EXTENSION} extension and the trigram name indexes skipped by the migrations'
+
+    def handle(self, *args, **kwargs):
+        if not is_trigram_extension_available(connection):
+            raise CommandError(f'{TRIGRAM_EXTENSION} is not available on the database server (install the PostgreSQL contrib package)')
+
+        built_indexes = enable_trigram_search()
+
+        self.stdout.write(self.style.SUCCESS(f'Trigram indexes built: {", ".join(built_indexes) or "none (already valid)"}'))
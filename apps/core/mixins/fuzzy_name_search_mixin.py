@@ -0,0 +1,23 @@
+from django.db.models import QuerySet
+
+from apps.core.utils.trigram import fuzzy_search
+
+
+class FuzzyNameSearchQuerysetMixin:
+    """
+    Filters list requests by `?q=` with a trigram similarity lookup on the
+    `fuzzy_search_field` of the model (typos and partial names still match),
+    most similar rows first.
+    """
+
+    fuzzy_search_field = 'name'
+    fuzzy_search_query_param = 'q'
+
+    def get_queryset(self) -> QuerySet:
+        queryset = super().get_queryset()
+
+        text = self.request.query_params.get(self.fuzzy_search_query_param, '').strip()
+        if self.request.method != 'GET' or not text:
+            return queryset
+
+        return fuzzy_search(queryset, text, field=self.fuzzy_search_field)
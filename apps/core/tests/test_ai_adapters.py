@@ -0,0 +1,285 @@
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from apps.core.adapters.ai_adapters.base import AIAgentAdapter
+from apps.core.adapters.ai_adapters.factory import clear_ai_adapter_cache, get_ai_adapter
+from apps.core.adapters.ai_adapters.local_adapter import LocalAIAdapter
+from apps.core.adapters.ai_adapters.open_ai_adapter import OpenAIAdapter, reset_openai_clients
+
+
+class TestAIAdapterFactory:
+    def setup_method(self):
+        clear_ai_adapter_cache()
+
+    def teardown_method(self):
+        clear_ai_adapter_cache()
+
+    def test_get_ai_adapter_returns_configured_adapter(self):
+        # Act
+        adapter = get_ai_adapter()
+
+        # Assert
+        assert isinstance(adapter, OpenAIAdapter)
+
+    def test_get_ai_adapter_reuses_instance(self):
+        # Act
+        first_adapter = get_ai_adapter()
+        second_adapter = get_ai_adapter('openai')
+
+        # Assert
+        assert first_adapter is second_adapter
+
+    def test_get_ai_adapter_unknown_name_raises(self):
+        # Act / Assert
+        with override_settings(AI_ADAPTER='unknown'), pytest.raises(ImproperlyConfigured):
+            get_ai_adapter()
+
+
+class TestOpenAIAdapter:
+    def setup_method(self):
+        reset_openai_clients()
+
+    def teardown_method(self):
+        reset_openai_clients()
+
+    def test_openai_client_is_built_once_and_shared(self):
+        # Arrange
+        with patch('openai.OpenAI') as mock_openai, patch('openai.DefaultHttpxClient') as mock_http_client:
+            mock_openai.return_value.chat.completions.create.return_value.choices[0].message.content = 'A description'
+
+            # Act
+            answer = OpenAIAdapter().answer('prompt')
+            OpenAIAdapter().answer('prompt')
+
+        # Assert
+        assert answer == 'A description'
+        mock_openai.assert_called_once_with(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=settings.OPENAI_TIMEOUT,
+            max_retries=settings.OPENAI_MAX_RETRIES,
+            http_client=mock_http_client.return_value,
+        )
+        limits = mock_http_client.call_args.kwargs['limits']
+        assert limits.max_connections == settings.OPENAI_MAX_CONNECTIONS
+        assert limits.max_keepalive_connections == settings.OPENAI_MAX_KEEPALIVE_CONNECTIONS
+
+    def test_answer_passes_timeout_to_each_call(self):
+        # Arrange
+        with patch('openai.OpenAI') as mock_openai, patch('openai.DefaultHttpxClient'):
+            create = mock_openai.return_value.chat.completions.create
+
+            # Act
+            OpenAIAdapter().answer('prompt')
+            OpenAIAdapter().answer('prompt', timeout=5)
+
+        # Assert
+        assert [call.kwargs['timeout'] for call in create.call_args_list] == [settings.OPENAI_TIMEOUT, 5]
+
+    def test_openai_client_is_rebuilt_when_settings_change(self):
+        # Arrange
+        with patch('openai.OpenAI') as mock_openai, patch('openai.DefaultHttpxClient'):
+            # Act
+            OpenAIAdapter().answer('prompt')
+            with override_settings(OPENAI_API_KEY='sk-other', OPENAI_MAX_RETRIES=5):
+                OpenAIAdapter().answer('prompt')
+
+        # Assert
+        assert mock_openai.call_count == 2
+        assert mock_openai.call_args.kwargs['api_key'] == 'sk-other'
+        assert mock_openai.call_args.kwargs['max_retries'] == 5
+
+    def test_async_openai_client_is_rebuilt_when_settings_change(self):
+        # Arrange
+        async def answer_twice():
+            await OpenAIAdapter().aanswer('prompt')
+            with override_settings(OPENAI_TIMEOUT=1):
+                await OpenAIAdapter().aanswer('prompt')
+
+        with patch('openai.AsyncOpenAI') as mock_async_openai, patch('openai.DefaultAsyncHttpxClient'):
+            mock_async_openai.return_value = AsyncMock()
+
+            # Act
+            asyncio.run(answer_twice())
+
+        # Assert
+        assert mock_async_openai.call_count == 2
+        assert mock_async_openai.call_args.kwargs['timeout'] == 1
+
+    def test_replaced_client_is_closed(self):
+        # Arrange
+        with patch('openai.OpenAI') as mock_openai, patch('openai.DefaultHttpxClient'):
+            first_client, second_client = MagicMock(), MagicMock()
+            mock_openai.side_effect = [first_client, second_client]
+
+            # Act
+            OpenAIAdapter().answer('prompt')
+            with override_settings(OPENAI_TIMEOUT=1):
+                OpenAIAdapter().answer('prompt')
+
+        # Assert
+        first_client.close.assert_called_once_with()
+        second_client.close.assert_not_called()
+
+    def test_replaced_async_client_is_closed(self):
+        # Arrange
+        async def answer_twice():
+            await OpenAIAdapter().aanswer('prompt')
+            with override_settings(OPENAI_TIMEOUT=1):
+                await OpenAIAdapter().aanswer('prompt')
+            # Deixa a task de fechamento do cliente antigo rodar.
+            await asyncio.sleep(0)
+
+        with patch('openai.AsyncOpenAI') as mock_async_openai, patch('openai.DefaultAsyncHttpxClient'):
+            first_client, second_client = AsyncMock(), AsyncMock()
+            mock_async_openai.side_effect = [first_client, second_client]
+
+            # Act
+            asyncio.run(answer_twice())
+
+        # Assert
+        first_client.close.assert_awaited_once_with()
+        second_client.close.assert_not_awaited()
+
+    def test_aanswer_uses_async_client(self):
+        # Arrange
+        with patch('openai.AsyncOpenAI') as mock_async_openai, patch('openai.DefaultAsyncHttpxClient'):
+            create = AsyncMock()
+            create.return_value.choices[0].message.content = 'An async description'
+            mock_async_openai.return_value.chat.completions.create = create
+
+            # Act
+            answer = asyncio.run(OpenAIAdapter().aanswer('prompt'))
+
+        # Assert
+        assert answer == 'An async description'
+        create.assert_awaited_once()
+
+    def test_aanswer_times_out(self):
+        # Arrange
+        async def slow_create(**kwargs):
+            await asyncio.sleep(1)
+
+        with patch('openai.AsyncOpenAI') as mock_async_openai, patch('openai.DefaultAsyncHttpxClient'):
+            mock_async_openai.return_value.chat.completions.create = slow_create
+
+            # Act / Assert
+            with pytest.raises(TimeoutError):
+                asyncio.run(OpenAIAdapter().aanswer('prompt', timeout=0.01))
+
+
+class TestAIAgentAdapterAsync:
+    class SlowAdapter(AIAgentAdapter):
+        def __init__(self, delay: float = 0) -> None:
+            self.delay = delay
+
+        def answer(self, prompt: str, timeout: Optional[float] = None) -> str:
+            time.sleep(self.delay)
+            return f'answer to {prompt}'
+
+    def test_default_aanswer_runs_sync_answer(self):
+        # Act
+        answer = asyncio.run(self.SlowAdapter().aanswer('prompt'))
+
+        # Assert
+        assert answer == 'answer to prompt'
+
+    def test_default_aanswer_times_out(self):
+        # Act / Assert
+        with pytest.raises(TimeoutError):
+            asyncio.run(self.SlowAdapter(delay=0.2).aanswer('prompt', timeout=0.01))
+
+
+class TestLocalAIAdapter:
+    def teardown_method(self):
+        clear_ai_adapter_cache()
+
+    def test_answer_is_deterministic_per_prompt(self):
+        # Arrange
+        adapter = LocalAIAdapter(latency=0)
+
+        # Act
+        first_answer = adapter.answer('prompt')
+        second_answer = adapter.answer('prompt')
+        other_answer = adapter.answer('other prompt')
+
+        # Assert
+        assert first_answer == second_answer
+        assert first_answer != other_answer
+
+    def test_answer_uses_configured_template(self):
+        # Arrange
+        adapter = LocalAIAdapter(latency=0, response='Offline description ({digest})')
+
+        # Act
+        answer = adapter.answer('prompt')
+
+        # Assert
+        assert answer.startswith('Offline description (')
+
+    def test_answer_times_out(self):
+        # Arrange
+        adapter = LocalAIAdapter(latency=1)
+
+        with patch('apps.core.adapters.ai_adapters.local_adapter.time.sleep') as mock_sleep:
+            # Act / Assert
+            with pytest.raises(TimeoutError):
+                adapter.answer('prompt', timeout=0.01)
+
+        mock_sleep.assert_called_once_with(0.01)
+
+    def test_answer_waits_synthetic_latency(self):
+        # Arrange
+        adapter = LocalAIAdapter(latency=0.25)
+
+        with patch('apps.core.adapters.ai_adapters.local_adapter.time.sleep') as mock_sleep:
+            # Act
+            adapter.answer('prompt')
+
+        # Assert
+        mock_sleep.assert_called_once_with(0.25)
+
+    def test_aanswer_respects_timeout(self):
+        # Arrange
+        adapter = LocalAIAdapter(latency=1)
+
+        # Act / Assert
+        with pytest.raises(TimeoutError):
+            asyncio.run(adapter.aanswer('prompt', timeout=0.01))
+
+    def test_factory_selects_local_adapter(self):
+        # Act
+        with override_settings(AI_ADAPTER='local', AI_LOCAL_LATENCY=0):
+            adapter = get_ai_adapter()
+
+        # Assert
+        assert isinstance(adapter, LocalAIAdapter)
+        assert adapter.answer('prompt') == LocalAIAdapter(latency=0).answer('prompt')
+
+
+class TestAIAdapterStartup:
+    def test_loading_urls_does_not_import_openai(self):
+        # Arrange
+        code = "import sys, django; django.setup(); from django.urls import get_resolver; get_resolver().url_patterns; print('openai' in sys.modules)"
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=settings.BASE_DIR,
+            env={**os.environ, 'DJANGO_SETTINGS_MODULE': 'app.test_settings'},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Assert
+        assert result.stdout.strip() == 'False'
@@ -0,0 +1,127 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from django.test import override_settings
+
+from apps.core.adapters.ai_adapters.cached_adapter import CachedAIAgentAdapter
+from apps.core.adapters.ai_adapters.factory import clear_ai_adapter_cache, get_ai_adapter
+from apps.core.adapters.ai_adapters.open_ai_adapter import OpenAIAdapter
+
+
+class TestCachedAIAgentAdapter:
+    def setup_method(self):
+        self.mock_adapter = MagicMock()
+        self.mock_adapter.model = 'gpt-test'
+        self.mock_adapter.answer.side_effect = lambda prompt, timeout=None: f'answer to {prompt}'
+        self.adapter = CachedAIAgentAdapter(self.mock_adapter, ttl=60, max_entries=2)
+
+    def test_repeated_prompt_is_served_from_cache(self):
+        # Act
+        first_answer = self.adapter.answer('prompt')
+        second_answer = self.adapter.answer('prompt')
+
+        # Assert
+        assert first_answer == second_answer == 'answer to prompt'
+        self.mock_adapter.answer.assert_called_once_with('prompt', timeout=None)
+        assert self.adapter.stats() == {'hits': 1, 'misses': 1, 'size': 1, 'max_entries': 2}
+
+    def test_key_includes_model_name(self):
+        # Arrange
+        self.adapter.answer('prompt')
+
+        # Act
+        self.mock_adapter.model = 'gpt-other'
+        self.adapter.answer('prompt')
+
+        # Assert
+        assert self.mock_adapter.answer.call_count == 2
+
+    def test_expired_entry_calls_adapter_again(self):
+        # Arrange
+        with patch('apps.core.adapters.ai_adapters.cached_adapter.time.monotonic') as mock_monotonic:
+            mock_monotonic.return_value = 100
+            self.adapter.answer('prompt')
+
+            # Act
+            mock_monotonic.return_value = 161
+            self.adapter.answer('prompt')
+
+        # Assert
+        assert self.mock_adapter.answer.call_count == 2
+        assert self.adapter.misses == 2
+
+    def test_least_recently_used_entry_is_evicted(self):
+        # Arrange
+        self.adapter.answer('first')
+        self.adapter.answer('second')
+        self.adapter.answer('first')
+
+        # Act
+        self.adapter.answer('third')
+        self.adapter.answer('first')
+        self.adapter.answer('second')
+
+        # Assert
+        called_prompts = [call.args[0] for call in self.mock_adapter.answer.call_args_list]
+        assert called_prompts == ['first', 'second', 'third', 'second']
+        assert self.adapter.stats()['size'] == 2
+
+    def test_adapter_errors_are_not_cached(self):
+        # Arrange
+        self.mock_adapter.answer.side_effect = [Exception('timeout'), 'answer']
+
+        # Act
+        with pytest.raises(Exception, match='timeout'):
+            self.adapter.answer('prompt')
+        answer = self.adapter.answer('prompt')
+
+        # Assert
+        assert answer == 'answer'
+        assert self.adapter.stats()['size'] == 1
+
+    def test_aanswer_shares_cache_with_answer(self):
+        # Arrange
+        self.mock_adapter.aanswer = AsyncMock(return_value='async answer')
+        self.adapter.answer('prompt')
+
+        # Act
+        cached_answer = asyncio.run(self.adapter.aanswer('prompt'))
+        fresh_answer = asyncio.run(self.adapter.aanswer('other prompt', timeout=5))
+
+        # Assert
+        assert cached_answer == 'answer to prompt'
+        assert fresh_answer == 'async answer'
+        self.mock_adapter.aanswer.assert_awaited_once_with('other prompt', timeout=5)
+
+    def test_answer_forwards_timeout(self):
+        # Act
+        self.adapter.answer('prompt', timeout=5)
+
+        # Assert
+        self.mock_adapter.answer.assert_called_once_with('prompt', timeout=5)
+
+
+class TestCachedAIAgentAdapterFactory:
+    def teardown_method(self):
+        clear_ai_adapter_cache()
+
+    def test_factory_wraps_adapter_when_cache_is_enabled(self):
+        # Act
+        with override_settings(AI_RESPONSE_CACHE_TTL=60, AI_RESPONSE_CACHE_MAX_ENTRIES=10):
+            adapter = get_ai_adapter()
+
+        # Assert
+        assert isinstance(adapter, CachedAIAgentAdapter)
+        assert isinstance(adapter.adapter, OpenAIAdapter)
+        assert adapter.model == 'gpt-3.5-turbo'
+        assert adapter.max_entries == 10
+
+    def test_factory_adapter_accepts_timeout(self):
+        # Arrange
+        with override_settings(AI_ADAPTER='local', AI_LOCAL_LATENCY=1, AI_RESPONSE_CACHE_TTL=60, AI_RESPONSE_CACHE_MAX_ENTRIES=10):
+            adapter = get_ai_adapter()
+
+        # Act / Assert
+        with patch('apps.core.adapters.ai_adapters.local_adapter.time.sleep'), pytest.raises(TimeoutError):
+            adapter.answer('prompt', timeout=0.01)
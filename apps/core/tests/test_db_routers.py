@@ -0,0 +1,120 @@
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from app.db_routers import ReadReplicaMiddleware, ReadReplicaRouter, read_from_replica
+from apps.movies.models import Movie
+
+REPLICAS = ['replica_1']
+
+
+class TestReadReplicaRouter:
+    @pytest.fixture(autouse=True)
+    def replicas(self, settings):
+        settings.DATABASE_REPLICAS = REPLICAS
+
+    def setup_method(self):
+        self.router = ReadReplicaRouter()
+
+    def test_reads_go_to_primary_by_default(self):
+        # Act / Assert
+        assert self.router.db_for_read(Movie) == 'default'
+
+    def test_reads_go_to_replica_inside_read_from_replica(self):
+        # Act
+        with read_from_replica():
+            database = self.router.db_for_read(Movie)
+
+        # Assert
+        assert database in REPLICAS
+        assert self.router.db_for_read(Movie) == 'default'
+
+    def test_writes_and_migrations_stay_on_primary(self):
+        # Act / Assert
+        with read_from_replica():
+            assert self.router.db_for_write(Movie) == 'default'
+        assert self.router.allow_migrate('default', 'movies') is True
+        assert self.router.allow_migrate('replica_1', 'movies') is False
+
+    def test_without_replicas_reads_go_to_primary(self, settings):
+        # Arrange
+        settings.DATABASE_REPLICAS = []
+
+        # Act / Assert
+        with read_from_replica():
+            assert self.router.db_for_read(Movie) == 'default'
+
+
+class TestReadReplicaMiddleware:
+    @pytest.fixture(autouse=True)
+    def replicas(self, settings):
+        settings.DATABASE_REPLICAS = REPLICAS
+        settings.READ_REPLICA_STICKY_SECONDS = 5
+
+    def setup_method(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.router = ReadReplicaRouter()
+        self.databases = []
+        self.status_code = 200
+        self.middleware = ReadReplicaMiddleware(self.__get_response)
+
+    def teardown_method(self):
+        cache.clear()
+
+    def __get_response(self, request):
+        self.databases.append(self.router.db_for_read(Movie))
+        return HttpResponse(status=self.status_code)
+
+    def __build_token(self, user_id=1):
+        token = AccessToken()
+        token['user_id'] = user_id
+        return f'Bearer {token}'
+
+    def test_safe_requests_read_from_replica(self):
+        # Act
+        self.middleware(self.factory.get('/api/v1/movies/', HTTP_AUTHORIZATION=self.__build_token()))
+
+        # Assert
+        assert self.databases == ['replica_1']
+
+    def test_writes_read_from_primary(self):
+        # Act
+        self.middleware(self.factory.post('/api/v1/movies/', HTTP_AUTHORIZATION=self.__build_token()))
+
+        # Assert
+        assert self.databases == ['default']
+
+    def test_user_reads_own_writes_from_primary(self):
+        # Arrange
+        token = self.__build_token(user_id=1)
+        self.middleware(self.factory.post('/api/v1/movies/', HTTP_AUTHORIZATION=token))
+
+        # Act
+        self.middleware(self.factory.get('/api/v1/movies/', HTTP_AUTHORIZATION=token))
+        self.middleware(self.factory.get('/api/v1/movies/', HTTP_AUTHORIZATION=self.__build_token(user_id=2)))
+
+        # Assert
+        assert self.databases == ['default', 'default', 'replica_1']
+
+    def test_failed_write_does_not_stick_user_to_primary(self):
+        # Arrange
+        token = self.__build_token()
+        self.status_code = 400
+        self.middleware(self.factory.post('/api/v1/movies/', HTTP_AUTHORIZATION=token))
+
+        # Act
+        self.middleware(self.factory.get('/api/v1/movies/', HTTP_AUTHORIZATION=token))
+
+        # Assert
+        assert self.databases == ['default', 'replica_1']
+
+    @pytest.mark.django_db
+    def test_reads_inside_a_transaction_stay_on_primary(self):
+        # Act
+        self.middleware(self.factory.get('/api/v1/movies/'))
+
+        # Assert
+        assert self.databases == ['default']
@@ -0,0 +1,89 @@
+from datetime import datetime
+from unittest.mock import patch
+
+from openpyxl import Workbook
+
+from apps.core.utils.file_readers.csv_reader import CSVReader
+from apps.core.utils.file_readers.excel_reader import ExcelReader
+
+
+class TestCSVReader:
+    def setup_method(self):
+        self.reader = CSVReader(chunk_size=2)
+
+    def test_iter_batches_streams_chunks(self, tmp_path):
+        # Arrange
+        file_path = tmp_path / 'movies.csv'
+        file_path.write_text('title,genre\nA,Drama\nB,Drama\nC,Action\n')
+
+        # Act
+        batches = list(self.reader.iter_batches(str(file_path), batch_size=2))
+
+        # Assert
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert batches[1] == [{'title': 'C', 'genre': 'Action'}]
+
+    def test_log_names_the_calling_method(self, tmp_path):
+        # Arrange
+        file_path = tmp_path / 'movies.csv'
+        file_path.write_text('title,genre\nA,Drama\n')
+
+        # Act
+        with patch('apps.core.utils.file_readers.csv_reader.logger') as mock_logger:
+            list(self.reader.iter_batches(str(file_path), batch_size=2))
+            list(self.reader.iter_rows(str(file_path)))
+
+        # Assert
+        assert [call.args[0]['method'] for call in mock_logger.info.call_args_list] == ['iter_batches', 'iter_rows']
+
+    def test_iter_rows_keeps_cells_as_text(self, tmp_path):
+        # Arrange
+        file_path = tmp_path / 'movies.csv'
+        file_path.write_text('title,release_date,resume\n1984,2020-01-01,\n')
+
+        # Act
+        rows = list(self.reader.iter_rows(str(file_path)))
+
+        # Assert
+        assert rows == [{'title': '1984', 'release_date': '2020-01-01', 'resume': ''}]
+
+
+class TestExcelReader:
+    def setup_method(self):
+        self.reader = ExcelReader()
+
+    def test_iter_rows_normalizes_cells(self, tmp_path):
+        # Arrange
+        file_path = tmp_path / 'movies.xlsx'
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(['title', 'release_date', 'resume'])
+        sheet.append(['Movie', datetime(2020, 1, 1), None])
+        sheet.append([None, None, None])
+        sheet.append([1984, None, 'Resume'])
+        workbook.save(file_path)
+
+        # Act
+        rows = list(self.reader.iter_rows(str(file_path)))
+
+        # Assert
+        assert rows == [
+            {'title': 'Movie', 'release_date': '2020-01-01', 'resume': ''},
+            {'title': '1984', 'release_date': '', 'resume': 'Resume'},
+        ]
+
+    def test_iter_batches_groups_rows(self, tmp_path):
+        # Arrange
+        file_path = tmp_path / 'actors.xlsx'
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(['name'])
+        for index in range(5):
+            sheet.append([f'Actor {index}'])
+        workbook.save(file_path)
+
+        # Act
+        batches = list(self.reader.iter_batches(str(file_path), batch_size=2))
+
+        # Assert
+        assert [len(batch) for batch in batches] == [2, 2, 1]
@@ -0,0 +1,32 @@
+from unittest.mock import patch
+
+from apps.core.utils.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    def test_acquire_spaces_calls_by_rate(self):
+        # Arrange
+        rate_limiter = RateLimiter(rate=2)
+
+        with (
+            patch('apps.core.utils.rate_limiter.time.monotonic', return_value=10.0),
+            patch('apps.core.utils.rate_limiter.time.sleep') as mock_sleep,
+        ):
+            # Act
+            for _ in range(3):
+                rate_limiter.acquire()
+
+        # Assert
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    def test_zero_rate_disables_limit(self):
+        # Arrange
+        rate_limiter = RateLimiter(rate=0)
+
+        with patch('apps.core.utils.rate_limiter.time.sleep') as mock_sleep:
+            # Act
+            for _ in range(3):
+                rate_limiter.acquire()
+
+        # Assert
+        mock_sleep.assert_not_called()
@@ -0,0 +1,196 @@
+import os
+from unittest.mock import patch
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+
+from apps.actors.models import Actor
+from apps.actors.tests.factories import ActorFactory
+from apps.core.utils import trigram
+from apps.core.utils.trigram import create_trigram_index, enable_trigram_search, fuzzy_resolve, fuzzy_search, is_trigram_enabled
+
+
+@pytest.fixture
+def without_trigram(monkeypatch):
+    monkeypatch.setattr(trigram, 'is_trigram_enabled', lambda using='default': False)
+
+
+@pytest.fixture
+def with_trigram(db):
+    if not is_trigram_enabled():
+        # A CI roda com a imagem oficial do PostgreSQL (com contrib) e exige que estes testes rodem.
+        if os.environ.get('TRIGRAM_TESTS_REQUIRED'):
+            pytest.fail('pg_trgm is not installed in the test database')
+        pytest.skip('pg_trgm is not installed in the test database')
+
+
+@pytest.mark.django_db
+class TestIsTrigramEnabled:
+    def test_checked_once_per_database_session(self, django_assert_num_queries):
+        # Arrange
+        enabled = is_trigram_enabled()
+
+        # Act / Assert
+        with django_assert_num_queries(0):
+            assert is_trigram_enabled() is enabled
+
+    def test_checked_again_after_a_reconnect(self, django_assert_num_queries):
+        # Arrange
+        enabled = is_trigram_enabled()
+        # Resultado guardado para uma conexão do driver que já foi substituída por uma reconexão.
+        connection._trigram_enabled = (object(), not enabled)
+
+        # Act / Assert
+        with django_assert_num_queries(1):
+            assert is_trigram_enabled() is enabled
+
+
+@pytest.mark.django_db
+class TestFuzzySearchFallback:
+    @pytest.fixture(autouse=True)
+    def fallback(self, without_trigram):
+        pass
+
+    def test_matches_case_insensitive_substring(self):
+        # Arrange
+        ActorFactory(name='Keanu Reeves')
+        ActorFactory(name='Laurence Fishburne')
+
+        # Act
+        names = list(fuzzy_search(Actor.objects.all(), 'reeves').values_list('name', flat=True))
+
+        # Assert
+        assert names == ['Keanu Reeves']
+
+    def test_resolve_matches_case_insensitive_equal_names_in_one_query(self, django_assert_num_queries):
+        # Arrange
+        ActorFactory(name='Keanu Reeves')
+
+        # Act
+        with django_assert_num_queries(1):
+            resolved = fuzzy_resolve(Actor.objects.all(), ['keanu reeves', 'Keanu Reves'])
+
+        # Assert
+        assert resolved['keanu reeves'].name == 'Keanu Reeves'
+        assert resolved['Keanu Reves'] is None
+
+    def test_resolve_without_names_does_not_query(self, django_assert_num_queries):
+        # Act / Assert
+        with django_assert_num_queries(0):
+            assert fuzzy_resolve(Actor.objects.all(), []) == {}
+
+
+@pytest.mark.django_db
+class TestFuzzySearchTrigram:
+    @pytest.fixture(autouse=True)
+    def trigram(self, with_trigram):
+        pass
+
+    def test_matches_typos_most_similar_first(self):
+        # Arrange
+        ActorFactory(name='Keanu Reeves')
+        ActorFactory(name='Keanu Reed')
+        ActorFactory(name='Laurence Fishburne')
+
+        # Act
+        results = list(fuzzy_search(Actor.objects.all(), 'Reves'))
+
+        # Assert
+        assert [actor.name for actor in results][0] == 'Keanu Reeves'
+        assert 'Laurence Fishburne' not in {actor.name for actor in results}
+        assert all(0 < actor.similarity <= 1 for actor in results)
+
+    def test_resolve_picks_the_most_similar_name_above_threshold(self):
+        # Arrange
+        ActorFactory(name='Keanu Reeves')
+        ActorFactory(name='Laurence Fishburne')
+
+        # Act
+        resolved = fuzzy_resolve(Actor.objects.all(), ['Keanu Reves', 'Carrie-Anne Moss'])
+
+        # Assert
+        assert resolved['Keanu Reves'].name == 'Keanu Reeves'
+        assert resolved['Carrie-Anne Moss'] is None
+
+    def test_resolve_many_names_in_one_query(self, django_assert_num_queries):
+        # Arrange
+        ActorFactory(name='Keanu Reeves')
+        ActorFactory(name='Laurence Fishburne')
+        ActorFactory(name='Carrie-Anne Moss')
+
+        # Act
+        with django_assert_num_queries(1):
+            resolved = fuzzy_resolve(Actor.objects.all(), ['Keanu Reves', 'Laurence Fishburn', 'Carrie-Ane Moss', 'Hugo Weaving'])
+
+        # Assert
+        assert {name: actor and actor.name for name, actor in resolved.items()} == {
+            'Keanu Reves': 'Keanu Reeves',
+            'Laurence Fishburn': 'Laurence Fishburne',
+            'Carrie-Ane Moss': 'Carrie-Anne Moss',
+            'Hugo Weaving': None,
+        }
+
+    def test_resolve_keeps_the_queryset_filters(self):
+        # Arrange
+        ActorFactory(name='Keanu Reeves')
+        ActorFactory(name='Laurence Fishburne')
+
+        # Act
+        resolved = fuzzy_resolve(Actor.objects.exclude(name='Keanu Reeves'), ['Keanu Reves', 'Laurence Fishburn'])
+
+        # Assert
+        assert resolved['Keanu Reves'] is None
+        assert resolved['Laurence Fishburn'].name == 'Laurence Fishburne'
+
+
+@pytest.mark.django_db
+class TestEnableTrigramSearch:
+    def test_migration_warns_when_it_skips_the_index(self):
+        # Arrange
+        schema_editor = connection.schema_editor(atomic=False)
+
+        # Act
+        with (
+            patch('apps.core.utils.trigram.is_trigram_extension_available', return_value=False),
+            patch('apps.core.utils.trigram.logger') as mock_logger,
+            patch.object(schema_editor, 'execute') as mock_execute,
+        ):
+            create_trigram_index(schema_editor, table='actors_actor', column='name', index_name='actor_name_trgm_idx')
+
+        # Assert
+        mock_execute.assert_not_called()
+        assert mock_logger.warning.call_args.args[0]['action'] == 'skipped'
+        assert mock_logger.warning.call_args.args[0]['index_name'] == 'actor_name_trgm_idx'
+
+    def test_keeps_valid_indexes(self):
+        # Act
+        with (
+            patch('apps.core.utils.trigram.is_valid_index', return_value=True),
+            patch('apps.core.utils.trigram.create_trigram_index') as mock_create_trigram_index,
+        ):
+            built_indexes = enable_trigram_search()
+
+        # Assert
+        assert built_indexes == []
+        mock_create_trigram_index.assert_not_called()
+
+    def test_builds_missing_indexes(self):
+        # Act
+        with (
+            patch('apps.core.utils.trigram.is_valid_index', side_effect=[True, False]),
+            patch('apps.core.utils.trigram.create_trigram_index') as mock_create_trigram_index,
+        ):
+            built_indexes = enable_trigram_search()
+
+        # Assert
+        assert built_indexes == ['genre_name_trgm_idx']
+        assert mock_create_trigram_index.call_args.kwargs == {'table': 'genres_genre', 'column': 'name', 'index_name': 'genre_name_trgm_idx'}
+
+    def test_command_fails_without_the_extension_on_the_server(self):
+        # Act / Assert
+        with (
+            patch('apps.core.management.commands.enable_trigram_search.is_trigram_extension_available', return_value=False),
+            pytest.raises(CommandError),
+        ):
+            call_command('enable_trigram_search')
@@ -1,22 +1,38 @@
+from typing import Iterator
+
 import pandas as pd
 
 from app.settings import logger
+from apps.core.constants import IMPORT_BATCH_SIZE
 
 from .file_reader import FileReader
 
 
 class CSVReader(FileReader):
-    def read(self, file_path: str) -> list[dict]:
+    def __init__(self, chunk_size: int = IMPORT_BATCH_SIZE) -> None:
+        self.chunk_size = chunk_size
+
+    def __iter_chunks(self, file_path: str, chunk_size: int, method: str) -> Iterator[list[dict]]:
         logger_data = {
             'service': 'CSVReader',
-            'method': 'read',
+            'method': method,
             'file_path': file_path,
+            'chunk_size': chunk_size,
         }
         logger.info(logger_data)
 
         try:
-            df = pd.read_csv(file_path)
-            return df.to_dict(orient='records')
+            # Células vazias chegam como '' e todos os valores como texto, como os services esperam.
+            with pd.read_csv(file_path, chunksize=chunk_size, dtype=str, keep_default_na=False) as chunks:
+                for chunk in chunks:
+                    yield chunk.to_dict(orient='records')
         except Exception as e:
             logger.error(logger_data, exc_info=True)
             raise e
+
+    def iter_rows(self, file_path: str) -> Iterator[dict]:
+        for chunk in self.__iter_chunks(file_path, self.chunk_size, method='iter_rows'):
+            yield from chunk
+
+    def iter_batches(self, file_path: str, batch_size: int) -> Iterator[list[dict]]:
+        return self.__iter_chunks(file_path, batch_size, method='iter_batches')
@@ -1,4 +1,7 @@
-import pandas as pd
+from datetime import date, datetime, time
+from typing import Any, Iterator
+
+from openpyxl import load_workbook
 
 from app.settings import logger
 
@@ -6,16 +9,43 @@ from .file_reader import FileReader
 
 
 class ExcelReader(FileReader):
-    def read(self, file_path: str) -> list[dict]:
+    def __normalize_cell(self, value: Any) -> str:
+        if value is None:
+            return ''
+        if isinstance(value, datetime):
+            return value.date().isoformat() if value.time() == time.min else value.isoformat()
+        if isinstance(value, date):
+            return value.isoformat()
+        return str(value)
+
+    def iter_rows(self, file_path: str) -> Iterator[dict]:
         logger_data = {
             'service': 'ExcelReader',
-            'method': 'read',
+            'method': 'iter_rows',
             'file_path': file_path,
         }
         logger.info(logger_data)
+
         try:
-            df = pd.read_excel(file_path)
-            return df.to_dict(orient='records')
+            # O modo read-only do openpyxl carrega as linhas sob demanda em vez da planilha inteira.
+            workbook = load_workbook(file_path, read_only=True, data_only=True)
+        except Exception as e:
+            logger.error(logger_data, exc_info=True)
+            raise e
+
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+
+            columns = [self.__normalize_cell(column) for column in header]
+            for values in rows:
+                if all(value is None for value in values):
+                    continue
+                yield dict(zip(columns, map(self.__normalize_cell, values)))
         except Exception as e:
             logger.error(logger_data, exc_info=True)
             raise e
+        finally:
+            workbook.close()
@@ -1,7 +1,22 @@
 from abc import ABC, abstractmethod
+from typing import Iterator
 
 
 class FileReader(ABC):
     @abstractmethod
-    def read(self, file_path: str) -> list[dict]:
+    def iter_rows(self, file_path: str) -> Iterator[dict]:
         raise NotImplementedError('This method must be implemented')
+
+    def iter_batches(self, file_path: str, batch_size: int) -> Iterator[list[dict]]:
+        batch = []
+        for row in self.iter_rows(file_path):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    def read(self, file_path: str) -> list[dict]:
+        return list(self.iter_rows(file_path))
@@ -0,0 +1,30 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces calls to at most `rate` per second.
+
+    Each acquire() reserves the next free slot and sleeps until it arrives, so
+    concurrent workers share the same budget. A rate <= 0 disables the limit.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self.__interval = 1 / rate if rate > 0 else 0.0
+        self.__lock = threading.Lock()
+        self.__next_slot = 0.0
+
+    def acquire(self) -> None:
+        if self.__interval <= 0:
+            return
+
+        with self.__lock:
+            now = time.monotonic()
+            slot = max(now, self.__next_slot)
+            self.__next_slot = slot + self.__interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
@@ -0,0 +1,172 @@
+from typing import Dict, Iterable, List, Optional
+
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import FloatField, Model, QuerySet
+from django.db.models.functions import Cast, Lower
+
+from app.settings import logger
+from apps.core.constants import FUZZY_MATCH_THRESHOLD
+
+TRIGRAM_EXTENSION = 'pg_trgm'
+# (tabela, coluna, índice) dos índices de trigramas criados pelas migrations de actors e genres.
+TRIGRAM_INDEXES = (
+    ('actors_actor', 'name', 'actor_name_trgm_idx'),
+    ('genres_genre', 'name', 'genre_name_trgm_idx'),
+)
+
+
+def is_trigram_extension_available(connection) -> bool:
+    """
+    Whether pg_trgm can be created in this database (it ships with the PostgreSQL
+    contrib package, which some minimal installations do not include).
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1 FROM pg_available_extensions WHERE name = %s', [TRIGRAM_EXTENSION])
+        return cursor.fetchone() is not None
+
+
+def is_trigram_enabled(using: str = DEFAULT_DB_ALIAS) -> bool:
+    """
+    Whether pg_trgm is installed in the database, checked once per database
+    session: a reconnect checks again, so an extension created later is picked up.
+
+    Without it the lookups below fall back to case-insensitive matching.
+    """
+    connection = connections[using]
+    connection.ensure_connection()
+
+    # O DatabaseWrapper sobrevive às reconexões; o resultado vale só para a conexão do driver em que foi consultado.
+    checked_connection, enabled = getattr(connection, '_trigram_enabled', (None, False))
+    if checked_connection is not connection.connection:
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1 FROM pg_extension WHERE extname = %s', [TRIGRAM_EXTENSION])
+            enabled = cursor.fetchone() is not None
+        connection._trigram_enabled = (connection.connection, enabled)
+
+    return enabled
+
+
+def create_trigram_index(schema_editor, table: str, column: str, index_name: str) -> None:
+    # Chamado pelas migrations (atomic = False): sem pg_trgm no servidor o índice é pulado, mas a migration fica
+    # registrada como aplicada; o comando enable_trigram_search cria a extensão e os índices depois.
+    if not is_trigram_extension_available(schema_editor.connection):
+        logger_data = {
+            'util': 'trigram',
+            'method': 'create_trigram_index',
+            'action': 'skipped',
+            'index_name': index_name,
+            'error_message': f'{TRIGRAM_EXTENSION} is not available on the server; run enable_trigram_search once it is installed',
+        }
+        logger.warning(logger_data)
+        return
+
+    schema_editor.execute(f'CREATE EXTENSION IF NOT EXISTS {TRIGRAM_EXTENSION}')
+    schema_editor.connection.__dict__.pop('_trigram_enabled', None)
+    # Um CREATE INDEX CONCURRENTLY interrompido deixa um índice inválido com o mesmo nome, que IF NOT EXISTS
+    # manteria para sempre: o índice é removido e criado de novo.
+    drop_trigram_index(schema_editor, index_name)
+    schema_editor.execute(f'CREATE INDEX CONCURRENTLY "{index_name}" ON "{table}" USING gin ("{column}" gin_trgm_ops)')
+
+
+def drop_trigram_index(schema_editor, index_name: str) -> None:
+    schema_editor.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{index_name}"')
+
+
+def is_valid_index(connection, index_name: str) -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT 1 FROM pg_index JOIN pg_class ON pg_class.oid = pg_index.indexrelid WHERE pg_class.relname = %s AND pg_index.indisvalid',
+            [index_name],
+        )
+        return cursor.fetchone() is not None
+
+
+def enable_trigram_search(using: str = DEFAULT_DB_ALIAS) -> List[str]:
+    """
+    Creates pg_trgm and the trigram indexes that the migrations skipped because
+    the server did not provide the extension yet. Valid indexes are kept; missing
+    or invalid ones are (re)built concurrently. Returns the names of the indexes
+    built. Must run outside a transaction.
+    """
+    connection = connections[using]
+    built_indexes = []
+    with connection.schema_editor(atomic=False) as schema_editor:
+        for table, column, index_name in TRIGRAM_INDEXES:
+            if is_valid_index(connection, index_name):
+                continue
+
+            create_trigram_index(schema_editor, table=table, column=column, index_name=index_name)
+            built_indexes.append(index_name)
+
+    return built_indexes
+
+
+def fuzzy_search(queryset: QuerySet, text: str, field: str = 'name') -> QuerySet:
+    """
+    Rows whose `field` contains a word similar to `text` (`text <% field`, served
+    by the gin_trgm_ops index), most similar first and annotated with `similarity`.
+
+    Without pg_trgm it falls back to a case-insensitive substring match.
+    """
+    if not is_trigram_enabled(queryset.db):
+        return queryset.filter(**{f'{field}__icontains': text}).order_by(field)
+
+    # similarity devolve real; em double precision o valor volta idêntico do cursor da paginação.
+    similarity = Cast(TrigramWordSimilarity(text, field), FloatField())
+
+    return queryset.filter(**{f'{field}__trigram_word_similar': text}).annotate(similarity=similarity).order_by('-similarity', field)
+
+
+def fuzzy_resolve(
+    queryset: QuerySet,
+    names: Iterable[str],
+    field: str = 'name',
+    threshold: float = FUZZY_MATCH_THRESHOLD,
+) -> Dict[str, Optional[Model]]:
+    """
+    Maps each name to the most similar row (similarity of the whole value of at
+    least `threshold`), or None when nothing is close enough, in a single query:
+    the names go in a VALUES list joined LATERAL to an indexed lookup per name.
+
+    Without pg_trgm only case-insensitive equal values match, also in a single query.
+    """
+    names = list(dict.fromkeys(names))
+    if not names:
+        return {}
+
+    if not is_trigram_enabled(queryset.db):
+        rows = queryset.annotate(field_lower=Lower(field)).filter(field_lower__in={name.lower() for name in names})
+        rows_by_lower = {getattr(row, field).lower(): row for row in rows}
+        return {name: rows_by_lower.get(name.lower()) for name in names}
+
+    model = queryset.model
+    table = model._meta.db_table
+    column = model._meta.get_field(field).column
+    pk_column = model._meta.pk.column
+
+    # Os filtros do queryset entram como subconsulta de chaves; sem filtros a tabela é consultada direto.
+    queryset_filter, queryset_params = '', ()
+    if queryset.query.has_filters():
+        subquery, queryset_params = queryset.values('pk').query.sql_with_params()
+        queryset_filter = f'AND candidate."{pk_column}" IN ({subquery})'
+
+    # coluna % nome usa o índice gin_trgm_ops; o limiar do operador (pg_trgm.similarity_threshold, 0.3) é refinado pelo threshold.
+    sql = f"""
+        SELECT matched.*, names.name AS fuzzy_name
+        FROM (VALUES {', '.join(['(%s::text)'] * len(names))}) AS names (name)
+        CROSS JOIN LATERAL (
+            SELECT candidate.*
+            FROM "{table}" candidate
+            WHERE candidate."{column}" %% names.name
+              AND similarity(candidate."{column}", names.name) >= %s
+              {queryset_filter}
+            ORDER BY similarity(candidate."{column}", names.name) DESC
+            LIMIT 1
+        ) matched
+    """
+    rows = queryset.raw(sql, [*names, threshold, *queryset_params])
+
+    resolved = dict.fromkeys(names)
+    resolved.update({row.fuzzy_name: row for row in rows})
+    return resolved
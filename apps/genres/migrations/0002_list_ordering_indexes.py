@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:44
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY não bloqueia escritas na tabela, mas não pode rodar dentro de uma transação.
+    atomic = False
+
+    dependencies = [
+        ('genres', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='genre',
+            index=models.Index(fields=['name', 'uuid'], name='genre_name_uuid_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='genre',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='genre_name_lower_idx'),
+        ),
+    ]
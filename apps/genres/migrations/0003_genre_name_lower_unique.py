@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:10
+
+import django.db.models.functions.text
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations, models
+from django.db.models.functions import Lower
+
+
+def merge_case_insensitive_duplicates(apps, schema_editor):
+    # O índice único não pode ser criado com nomes repetidos (ex.: "Drama" e "drama"):
+    # mantém o gênero mais antigo de cada nome e move os filmes dos demais para ele.
+    Genre = apps.get_model('genres', 'Genre')
+    Movie = apps.get_model('movies', 'Movie')
+
+    kept_by_name = {}
+    for genre in Genre.objects.annotate(name_lower=Lower('name')).order_by('name_lower', 'created_at', 'uuid'):
+        kept = kept_by_name.setdefault(genre.name_lower, genre)
+        if kept.pk != genre.pk:
+            Movie.objects.filter(genre=genre).update(genre=kept)
+            genre.delete()
+
+
+class Migration(migrations.Migration):
+    # CREATE/DROP INDEX CONCURRENTLY não bloqueiam escritas na tabela, mas não podem rodar dentro de uma transação.
+    atomic = False
+
+    dependencies = [
+        ('genres', '0002_list_ordering_indexes'),
+        ('movies', '0003_list_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_case_insensitive_duplicates, migrations.RunPython.noop, atomic=True),
+        # O Django cria a UniqueConstraint com expressão como índice único; aqui o mesmo índice é criado sem lock.
+        # Um nome repetido inserido entre a junção acima e o CREATE faz o build falhar e deixa um índice INVALID,
+        # que não garante unicidade: ele é removido antes (sem IF NOT EXISTS, que o aceitaria) e rodar a
+        # migration de novo junta os repetidos e cria o índice do zero.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    [
+                        'DROP INDEX CONCURRENTLY IF EXISTS "genre_name_lower_unique"',
+                        'CREATE UNIQUE INDEX CONCURRENTLY "genre_name_lower_unique" ON "genres_genre" (LOWER("name"))',
+                    ],
+                    'DROP INDEX CONCURRENTLY IF EXISTS "genre_name_lower_unique"',
+                ),
+            ],
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='genre',
+                    constraint=models.UniqueConstraint(
+                        django.db.models.functions.text.Lower('name'),
+                        name='genre_name_lower_unique',
+                        violation_error_message='A genre with this name already exists.',
+                    ),
+                ),
+            ],
+        ),
+        RemoveIndexConcurrently(
+            model_name='genre',
+            name='genre_name_lower_idx',
+        ),
+    ]
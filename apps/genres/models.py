@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
+from django.db.models.functions import Lower
 
 from apps.core.models import BaseModel
 
@@ -8,6 +10,16 @@ class Genre(BaseModel):
 
     class Meta:
         ordering = ['name']
+        indexes = [
+            # Listagem ordenada por nome (a paginação por cursor desempata pelo uuid)
+            models.Index(fields=['name', 'uuid'], name='genre_name_uuid_idx'),
+            # Busca aproximada por nome (?q= e importação com --fuzzy); criado só quando o servidor tem pg_trgm
+            GinIndex(fields=['name'], opclasses=['gin_trgm_ops'], name='genre_name_trgm_idx'),
+        ]
+        constraints = [
+            # Nomes únicos sem diferenciar maiúsculas/minúsculas; o índice também atende lower(name) = lower(%s)
+            models.UniqueConstraint(Lower('name'), name='genre_name_lower_unique', violation_error_message='A genre with this name already exists.'),
+        ]
 
     def __str__(self):
         return self.name
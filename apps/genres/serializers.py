@@ -1,3 +1,4 @@
+from django.db.models.functions import Lower
 from rest_framework import serializers
 
 from apps.genres.models import Genre
@@ -7,6 +8,13 @@ class GenreSerializer(serializers.ModelSerializer):
     def validate_name(self, value):
         if str.isnumeric(value):
             raise serializers.ValidationError('A valid string is required.')
+
+        # lower(name) = lower(%s) usa o índice único genre_name_lower_unique; name__iexact (UPPER) não usaria.
+        genres = Genre.objects.annotate(name_lower=Lower('name')).filter(name_lower=value.lower())
+        if self.instance is not None:
+            genres = genres.exclude(pk=self.instance.pk)
+        if genres.exists():
+            raise serializers.ValidationError('A genre with this name already exists.')
         return value
 
     class Meta:
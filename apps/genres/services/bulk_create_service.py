@@ -0,0 +1,44 @@
+from typing import Dict, List
+
+from app.settings import logger
+from apps.genres.models import Genre
+
+
+class GenreBulkCreateService:
+    def __init__(self, genre_names: List[str]) -> None:
+        self.genre_names = genre_names
+
+    def __insert(self, genres: List[Genre]) -> set:
+        # Um único INSERT ... ON CONFLICT DO NOTHING: o índice único genre_name_lower_unique descarta
+        # os nomes que já existem (sem diferenciar maiúsculas), inclusive os criados por requisições concorrentes.
+        Genre.objects.bulk_create(genres, ignore_conflicts=True)
+
+        # Com ignore_conflicts o PostgreSQL não informa quais linhas entraram; os uuids são gerados
+        # aqui, então os que estão na tabela são exatamente os inseridos por este INSERT.
+        return set(Genre.objects.filter(uuid__in=[genre.uuid for genre in genres]).values_list('uuid', flat=True))
+
+    def create(self) -> Dict:
+        logger_data = {
+            'service': 'GenreBulkCreateService',
+            'method': 'create',
+            'genres': len(self.genre_names),
+        }
+        logger.info(logger_data)
+
+        genres = [Genre(name=name) for name in self.genre_names]
+        created_uuids = self.__insert(genres) if genres else set()
+
+        created_genres = [genre for genre in genres if genre.uuid in created_uuids]
+        skipped_genres = [genre.name for genre in genres if genre.uuid not in created_uuids]
+
+        logger_data['created'] = len(created_genres)
+        logger_data['skipped'] = len(skipped_genres)
+        logger.info(logger_data)
+
+        return {
+            'created_genres': created_genres,
+            'skipped_genres': skipped_genres,
+        }
+
+
+genre_bulk_create_service = GenreBulkCreateService
@@ -8,4 +8,5 @@ class GenreFactory(factory.django.DjangoModelFactory):
         model = 'genres.Genre'
 
     uuid = factory.LazyAttribute(lambda x: faker_gen.uuid4())
-    name = factory.Faker('word')
+    # Nomes de gênero são únicos sem diferenciar maiúsculas (genre_name_lower_unique)
+    name = factory.Sequence(lambda n: f'{faker_gen.word()} {n}')
@@ -0,0 +1,43 @@
+import pytest
+
+from apps.genres.models import Genre
+from apps.genres.services.bulk_create_service import GenreBulkCreateService
+from apps.genres.tests.factories import GenreFactory
+
+
+@pytest.mark.django_db
+class TestGenreBulkCreateService:
+    def test_create_reports_created_and_skipped(self):
+        # Arrange
+        GenreFactory(name='ação')
+
+        # Act
+        result = GenreBulkCreateService(['Ação', 'Comédia', 'Drama']).create()
+
+        # Assert
+        assert [genre.name for genre in result['created_genres']] == ['Comédia', 'Drama']
+        assert result['skipped_genres'] == ['Ação']
+        assert Genre.objects.count() == 3
+
+    def test_create_large_payload_in_constant_queries(self, django_assert_num_queries):
+        # Arrange
+        existing = GenreFactory(name='genre 0')
+        names = [f'Genre {index}' for index in range(10_000)]
+
+        # Act
+        # Um INSERT ... ON CONFLICT DO NOTHING e um SELECT dos uuids inseridos, independente do tamanho da lista.
+        with django_assert_num_queries(2):
+            result = GenreBulkCreateService(names).create()
+
+        # Assert
+        assert len(result['created_genres']) == 9_999
+        assert result['skipped_genres'] == ['Genre 0']
+        assert Genre.objects.filter(pk=existing.pk).get().name == 'genre 0'
+
+    def test_create_empty_list_does_not_query(self, django_assert_num_queries):
+        # Act
+        with django_assert_num_queries(0):
+            result = GenreBulkCreateService([]).create()
+
+        # Assert
+        assert result == {'created_genres': [], 'skipped_genres': []}
@@ -26,3 +26,8 @@ class TestModelGenre:
     def test_genre_without_name(self):
         with pytest.raises(IntegrityError):
             Genre.objects.create(name=None)
+
+    def test_genre_name_unique_case_insensitive(self):
+        GenreFactory(name='Drama')
+        with pytest.raises(IntegrityError):
+            Genre.objects.create(name='drama')
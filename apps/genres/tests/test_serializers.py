@@ -1,7 +1,11 @@
+import pytest
+
 from app.test_settings import faker_gen
 from apps.genres.serializers import GenreBulkCreateSerializer, GenreSerializer
+from apps.genres.tests.factories import GenreFactory
 
 
+@pytest.mark.django_db
 class TestGenreSerializer:
     def setup_method(self):
         self.serializer = GenreSerializer
@@ -38,6 +42,21 @@ class TestGenreSerializer:
 
         assert 'A valid string is required.' == str(serializer.errors['name'][0])
 
+    def test_genre_serializer_duplicated_name_case_insensitive(self):
+        GenreFactory(name='Drama')
+
+        serializer = self.serializer(data={'name': 'DRAMA'})
+
+        assert not serializer.is_valid()
+        assert 'A genre with this name already exists.' == str(serializer.errors['name'][0])
+
+    def test_genre_serializer_update_keeps_own_name(self):
+        genre = GenreFactory(name='Drama')
+
+        serializer = self.serializer(genre, data={'name': 'drama'})
+
+        assert serializer.is_valid()
+
 
 class TestGenreBulkCreateSerializer:
     def setup_method(self):
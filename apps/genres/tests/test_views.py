@@ -93,6 +93,19 @@ class TestGenreAPI(BaseAPITest):
         assert response.status_code == status.HTTP_200_OK
         assert response.data['count'] == Genre.objects.count()
 
+    def test_list_genres_filtered_by_name(self):
+        # Arrange
+        GenreFactory(name='Science Fiction')
+        GenreFactory(name='Drama')
+        self.give_permissions(model=Genre)
+
+        # Act
+        response = self.client.get(reverse('genre-create-list'), {'q': 'fiction'})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert [genre['name'] for genre in response.data['results']] == ['Science Fiction']
+
     def test_list_genres_without_permissions(self, existing_genre):
         url = reverse('genre-create-list')
         response = self.client.get(url, format='json')
@@ -300,6 +313,20 @@ class TestGenreBulkCreateAPI(BaseAPITest):
         assert response.data['created'] == genres_created.count()
         assert Genre.objects.count() == initial_count + genres_created.count()
 
+    def test_bulk_create_genres_large_payload(self):
+        self.give_permissions(model=Genre)
+        GenreFactory(name='genre 0')
+
+        data = {'genres': [f'Genre {index}' for index in range(1000)]}
+        url = reverse('genre-bulk-create')
+
+        response = self.client.post(url, data, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['created'] == 999
+        assert response.data['skipped_genres'] == ['Genre 0']
+        assert Genre.objects.count() == 1000
+
     def test_bulk_create_genres_empty_list(self):
         self.give_permissions(model=Genre)
 
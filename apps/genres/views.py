@@ -1,17 +1,15 @@
-import operator
-from functools import reduce
-
-from django.db.models import Q
 from rest_framework import generics, response, status, views
 from rest_framework.permissions import IsAuthenticated
 
 from app.decorators import log_request
 from app.permissions import GlobalDefaultPermission
+from apps.core.mixins.fuzzy_name_search_mixin import FuzzyNameSearchQuerysetMixin
 from apps.genres.models import Genre
 from apps.genres.serializers import GenreBulkCreateSerializer, GenreSerializer
+from apps.genres.services.bulk_create_service import genre_bulk_create_service
 
 
-class GenreCreateListView(generics.ListCreateAPIView):
+class GenreCreateListView(FuzzyNameSearchQuerysetMixin, generics.ListCreateAPIView):
     permission_classes = (
         IsAuthenticated,
         GlobalDefaultPermission,
@@ -61,27 +59,13 @@ class GenreBulkCreateView(views.APIView):
         serializer = GenreBulkCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        genre_names = serializer.validated_data['genres']
-
-        q_objects = [Q(name__iexact=name) for name in genre_names]
-        if q_objects:
-            existing_genres = Genre.objects.filter(reduce(operator.or_, q_objects)).values_list('name', flat=True)
-            existing_names_lower = {name.lower() for name in existing_genres}
-        else:
-            existing_names_lower = set()
-
-        genres_to_create = [name for name in genre_names if name.lower() not in existing_names_lower]
-
-        created_genres = []
-        for genre_name in genres_to_create:
-            genre = Genre.objects.create(name=genre_name)
-            created_genres.append(GenreSerializer(genre).data)
+        result = genre_bulk_create_service(serializer.validated_data['genres']).create()
 
         response_data = {
-            'created': len(created_genres),
-            'skipped': len(genre_names) - len(created_genres),
-            'created_genres': created_genres,
-            'skipped_genres': [name for name in genre_names if name.lower() in existing_names_lower],
+            'created': len(result['created_genres']),
+            'skipped': len(result['skipped_genres']),
+            'created_genres': GenreSerializer(result['created_genres'], many=True).data,
+            'skipped_genres': result['skipped_genres'],
         }
 
         return response.Response(data=response_data, status=status.HTTP_201_CREATED)
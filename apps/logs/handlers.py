@@ -1,41 +1,177 @@
 import logging
+import os
+import queue
+import threading
+import time
 
 from pymongo import MongoClient
 
+_STOP = object()
+
 
 class BaseHandler(logging.Handler):
     pass
 
 
 class MongoHandler(BaseHandler):
-    def __init__(self, mongo_uri: str, db_name: str, collection: str) -> None:
+    """
+    Handler de logs para o MongoDB que não bloqueia a thread da requisição.
+
+    Os registros vão para uma fila em memória limitada (`max_queue_size`) e uma
+    thread em background grava no Mongo com `insert_many` sempre que o lote
+    atinge `batch_size` registros ou a cada `flush_interval` segundos. Com a
+    fila cheia, novos registros são descartados e contados em `dropped_count`.
+    A conexão só é aberta na primeira gravação e os registros pendentes são
+    gravados no `close()` (chamado pelo logging ao encerrar o processo).
+    """
+
+    def __init__(
+        self,
+        mongo_uri: str,
+        db_name: str,
+        collection: str,
+        *,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+    ) -> None:
         super().__init__()
-        self.client = MongoClient(mongo_uri, serverSelectionTimeoutMS=5000, connectTimeoutMS=5000)
-        self.collection = self.client[db_name][collection]
+        self.mongo_uri = mongo_uri
+        self.db_name = db_name
+        self.collection_name = collection
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
 
-        try:
-            # Executar uma simples operação de verificação
-            self.client.admin.command('ping')  # Isso irá verificar se estamos conectados
-            print('Conexão com MongoDB estabelecida com sucesso!')
-        except Exception as e:
-            print(f'Aviso: falha ao pingar o MongoDB na inicialização do handler: {e}')
-            raise
+        self.dropped_count = 0
+        self.failed_count = 0
 
-    def emit(self, record):
-        log_entry = self.format(record)
-        data = {
+        self.__worker_lock = threading.Lock()
+        self.__write_lock = threading.Lock()
+        self.__reset()
+
+    def __reset(self) -> None:
+        # Também é chamado depois de um fork: o processo filho não herda a thread e o MongoClient não é fork-safe.
+        self.__pid = os.getpid()
+        self.__queue = queue.Queue(maxsize=self.max_queue_size)
+        self.__stop_event = threading.Event()
+        self.__worker = None
+        self.__client = None
+        self.__collection = None
+
+    def __ensure_worker(self) -> None:
+        if self.__pid == os.getpid() and self.__worker is not None and self.__worker.is_alive():
+            return
+
+        with self.__worker_lock:
+            if self.__pid != os.getpid():
+                self.__reset()
+
+            if self.__worker is None or not self.__worker.is_alive():
+                self.__worker = threading.Thread(target=self.__run, name='mongo-log-handler', daemon=True)
+                self.__worker.start()
+
+    def __get_collection(self):
+        if self.__collection is None:
+            self.__client = MongoClient(self.mongo_uri, serverSelectionTimeoutMS=5000, connectTimeoutMS=5000)
+            self.__collection = self.__client[self.db_name][self.collection_name]
+
+        return self.__collection
+
+    def __write(self, documents: list[dict]) -> None:
+        if not documents:
+            return
+
+        with self.__write_lock:
+            try:
+                self.__get_collection().insert_many(documents, ordered=False)
+            except Exception:
+                # Falhas de gravação não podem derrubar a aplicação nem gerar novos logs recursivamente.
+                self.failed_count += len(documents)
+
+    def __drain(self, limit: int) -> list[dict]:
+        documents = []
+        while len(documents) < limit:
+            try:
+                document = self.__queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if document is not _STOP:
+                documents.append(document)
+
+        return documents
+
+    def __run(self) -> None:
+        while not self.__stop_event.is_set():
+            documents = []
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(documents) < self.batch_size and not self.__stop_event.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+
+                try:
+                    document = self.__queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+                if document is _STOP:
+                    break
+                documents.append(document)
+
+            self.__write(documents)
+
+    def __build_document(self, record: logging.LogRecord) -> dict:
+        return {
             'level': record.levelname,
-            'message': log_entry,
+            'message': self.format(record),
             'pathname': record.pathname,
             'lineno': record.lineno,
             'funcName': record.funcName,
             'created': record.created,
         }
+
+    def emit(self, record):
         try:
-            self.collection.insert_one(data)
+            document = self.__build_document(record)
         except Exception:
-            pass
+            self.handleError(record)
+            return
+
+        self.__ensure_worker()
+
+        try:
+            self.__queue.put_nowait(document)
+        except queue.Full:
+            self.dropped_count += 1
+
+    def flush(self):
+        if self.__pid != os.getpid():
+            return
+
+        while documents := self.__drain(self.batch_size):
+            self.__write(documents)
+
+    def close(self):
+        worker = self.__worker
+        self.__stop_event.set()
+        if worker is not None and worker.is_alive() and worker is not threading.current_thread():
+            # Acorda a thread caso ela esteja aguardando novos registros na fila.
+            try:
+                self.__queue.put_nowait(_STOP)
+            except queue.Full:
+                pass
+            worker.join(timeout=max(self.flush_interval, 1.0) * 5)
+
+        self.flush()
+
+        if self.__client is not None:
+            self.__client.close()
+
+        super().close()
 
 
-def create_mongo_handler(mongo_uri, db_name, collection):
-    return MongoHandler(mongo_uri, db_name, collection)
+def create_mongo_handler(mongo_uri, db_name, collection, **kwargs):
+    return MongoHandler(mongo_uri, db_name, collection, **kwargs)
@@ -0,0 +1,132 @@
+import logging
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from apps.logs.handlers import MongoHandler, create_mongo_handler
+
+
+class TestMongoHandler:
+    def setup_method(self):
+        self.logger = logging.getLogger('test_mongo_handler')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+
+    def teardown_method(self):
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+            handler.close()
+
+    @pytest.fixture
+    def mongo_client(self, mocker):
+        return mocker.patch('apps.logs.handlers.MongoClient')
+
+    def __collection(self, mongo_client) -> MagicMock:
+        return mongo_client.return_value.__getitem__.return_value.__getitem__.return_value
+
+    def __build_handler(self, **kwargs) -> MongoHandler:
+        handler = MongoHandler('mongodb://localhost', 'flix_logs', 'logs', **kwargs)
+        self.logger.addHandler(handler)
+        return handler
+
+    def test_init_does_not_connect(self, mongo_client):
+        # Act
+        self.__build_handler()
+
+        # Assert
+        mongo_client.assert_not_called()
+
+    def test_emit_does_not_write_on_caller_thread(self, mongo_client, mocker):
+        # Arrange
+        mocker.patch('apps.logs.handlers.threading.Thread')
+        handler = self.__build_handler()
+
+        # Act
+        self.logger.info('request handled')
+
+        # Assert
+        mongo_client.assert_not_called()
+
+        handler.flush()
+        documents = self.__collection(mongo_client).insert_many.call_args.args[0]
+        assert [document['message'] for document in documents] == ['request handled']
+        assert documents[0]['level'] == 'INFO'
+
+    def test_flush_writes_in_batches(self, mongo_client, mocker):
+        # Arrange
+        mocker.patch('apps.logs.handlers.threading.Thread')
+        handler = self.__build_handler(batch_size=2)
+        for index in range(5):
+            self.logger.info(f'message {index}')
+
+        # Act
+        handler.flush()
+
+        # Assert
+        calls = self.__collection(mongo_client).insert_many.call_args_list
+        assert [len(call.args[0]) for call in calls] == [2, 2, 1]
+
+    def test_full_queue_drops_records(self, mongo_client, mocker):
+        # Arrange
+        mocker.patch('apps.logs.handlers.threading.Thread')
+        handler = self.__build_handler(max_queue_size=2)
+
+        # Act
+        for index in range(5):
+            self.logger.info(f'message {index}')
+
+        # Assert
+        assert handler.dropped_count == 3
+
+    def test_write_failure_is_counted(self, mongo_client, mocker):
+        # Arrange
+        mocker.patch('apps.logs.handlers.threading.Thread')
+        self.__collection(mongo_client).insert_many.side_effect = Exception('mongo down')
+        handler = self.__build_handler()
+        self.logger.info('message')
+
+        # Act
+        handler.flush()
+
+        # Assert
+        assert handler.failed_count == 1
+
+    def test_background_worker_flushes_by_interval(self, mongo_client):
+        # Arrange
+        handler = self.__build_handler(flush_interval=0.05)
+        insert_many = self.__collection(mongo_client).insert_many
+
+        # Act
+        self.logger.info('message')
+        deadline = time.monotonic() + 2
+        while not insert_many.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # Assert
+        assert insert_many.call_count == 1
+        assert handler.dropped_count == 0
+
+    def test_close_flushes_pending_records(self, mongo_client):
+        # Arrange
+        handler = self.__build_handler(batch_size=100, flush_interval=60)
+        for index in range(3):
+            self.logger.info(f'message {index}')
+
+        # Act
+        self.logger.removeHandler(handler)
+        handler.close()
+
+        # Assert
+        calls = self.__collection(mongo_client).insert_many.call_args_list
+        assert sum(len(call.args[0]) for call in calls) == 3
+        mongo_client.return_value.close.assert_called_once()
+
+    def test_create_mongo_handler_forwards_options(self, mongo_client):
+        # Act
+        handler = create_mongo_handler('mongodb://localhost', 'flix_logs', 'logs', batch_size=10)
+
+        # Assert
+        assert isinstance(handler, MongoHandler)
+        assert handler.batch_size == 10
+        handler.close()
@@ -5,4 +5,4 @@ from apps.movies.models import Movie
 
 @admin.register(Movie)
 class MovieAdmin(admin.ModelAdmin):
-    list_display = ('uuid', 'title', 'genre', 'release_date', 'resume')
+    list_display = ('uuid', 'title', 'genre', 'release_date', 'average_stars', 'review_count', 'resume')
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand
+
+from apps.core.adapters.ai_adapters.factory import get_ai_adapter
+from apps.core.constants import DESCRIPTION_BACKFILL_BATCH_SIZE, DESCRIPTION_BACKFILL_RATE_LIMIT, DESCRIPTION_BACKFILL_WORKERS
+from apps.movies.services.description_backfill_service import MovieDescriptionBackfillService
+
+
+class Command(BaseCommand):
+    help = 'Generate AI descriptions for every movie without a resume'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=DESCRIPTION_BACKFILL_WORKERS,
+            help=f'Number of concurrent AI requests (default: {DESCRIPTION_BACKFILL_WORKERS}).',
+        )
+        parser.add_argument(
+            '--rate-limit',
+            type=float,
+            default=DESCRIPTION_BACKFILL_RATE_LIMIT,
+            help=f'Maximum AI requests per second, 0 disables the limit (default: {DESCRIPTION_BACKFILL_RATE_LIMIT}).',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DESCRIPTION_BACKFILL_BATCH_SIZE,
+            help=f'Number of movies written per bulk update (default: {DESCRIPTION_BACKFILL_BATCH_SIZE}).',
+        )
+        parser.add_argument('--limit', type=int, default=None, help='Maximum number of movies to process.')
+        return super().add_arguments(parser)
+
+    def handle(self, *args, **kwargs):
+        service = MovieDescriptionBackfillService(
+            ai_adapter=get_ai_adapter(),
+            workers=kwargs['workers'],
+            rate_limit=kwargs['rate_limit'],
+            batch_size=kwargs['batch_size'],
+            limit=kwargs['limit'],
+        )
+        result = service.backfill()
+
+        self.stdout.write(self.style.SUCCESS(f'\n{"=" * 50}'))
+        self.stdout.write(self.style.SUCCESS('DESCRIPTION BACKFILL SUMMARY'))
+        self.stdout.write(self.style.SUCCESS(f'{"=" * 50}'))
+        self.stdout.write(self.style.SUCCESS(f'Movies processed: {result["processed_count"]}'))
+        self.stdout.write(self.style.SUCCESS(f'Descriptions updated: {result["updated_count"]}'))
+        self.stdout.write(self.style.WARNING(f'Skipped (resume written meanwhile): {result["skipped_count"]}'))
+        self.stdout.write(self.style.WARNING(f'Failures: {result["failed_count"]}'))
+        self.stdout.write(self.style.SUCCESS(f'Elapsed: {result["elapsed_seconds"]}s ({result["throughput"]} movies/s)'))
+
+        if result['errors']:
+            self.stdout.write(self.style.ERROR('\nERRORS FOUND:'))
+            for error in result['errors']:
+                self.stdout.write(self.style.ERROR(f'  - {error}'))
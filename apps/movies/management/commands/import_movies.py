@@ -1,11 +1,21 @@
+from argparse import ArgumentTypeError
+
 from django.core.management.base import BaseCommand
 
+from apps.core.constants import IMPORT_BATCH_SIZE
 from apps.core.utils.file_readers.csv_reader import CSVReader
 from apps.core.utils.file_readers.excel_reader import ExcelReader
 from apps.core.utils.file_readers.file_reader import FileReader
 from apps.movies.services.import_service import MovieImportService
 
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise ArgumentTypeError(f'must be a positive integer, got {value}')
+    return number
+
+
 class Command(BaseCommand):
     help = 'Import movies from a file'
 
@@ -19,13 +29,26 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser) -> None:
         parser.add_argument('file_path', type=str, help='Path to the CSV file with movies.')
+        parser.add_argument(
+            '--batch-size',
+            type=positive_int,
+            default=IMPORT_BATCH_SIZE,
+            help=f'Number of movies written per bulk insert (default: {IMPORT_BATCH_SIZE}).',
+        )
+        parser.add_argument(
+            '--fuzzy',
+            action='store_true',
+            help='Resolve genres and actors without an exact name match to the most similar registered name (pg_trgm).',
+        )
         return super().add_arguments(parser)
 
     def handle(self, *args, **kwargs):
         file_path = kwargs['file_path']
+        batch_size = kwargs['batch_size']
+        fuzzy = kwargs['fuzzy']
 
         file_reader = self.__map_file_reader(file_path)
-        service = MovieImportService(file_path=file_path, file_reader=file_reader)
+        service = MovieImportService(file_path=file_path, file_reader=file_reader, batch_size=batch_size, fuzzy=fuzzy)
         result = service.import_movies()
 
         created_count = result['created_count']
@@ -38,6 +61,12 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f'Movies created: {created_count}'))
         self.stdout.write(self.style.WARNING(f'Movies skipped: {skipped_count}'))
 
+        fuzzy_matches = result['fuzzy_matches']
+        if fuzzy_matches:
+            self.stdout.write(self.style.WARNING('\nRESOLVED BY SIMILARITY:'))
+            for name, matched_name in fuzzy_matches.items():
+                self.stdout.write(self.style.WARNING(f'  - "{name}" -> "{matched_name}"'))
+
         if errors:
             self.stdout.write(self.style.ERROR('\nERRORS FOUND:'))
             for error in errors:
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.movies.services.rating_service import MovieRatingService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the denormalized rating aggregates (review_count, stars_sum, average_stars) of every movie'
+
+    def handle(self, *args, **kwargs):
+        service = MovieRatingService()
+
+        with transaction.atomic():
+            updated_count = service.rebuild()
+
+        self.stdout.write(self.style.SUCCESS(f'Movie ratings rebuilt: {updated_count}'))
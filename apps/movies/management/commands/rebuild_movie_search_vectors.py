@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.movies.services.search_service import MovieSearchService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search vector (title, resume and actor names) of every movie'
+
+    def handle(self, *args, **kwargs):
+        service = MovieSearchService()
+
+        with transaction.atomic():
+            updated_count = service.rebuild()
+
+        self.stdout.write(self.style.SUCCESS(f'Movie search vectors rebuilt: {updated_count}'))
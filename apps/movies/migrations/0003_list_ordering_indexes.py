@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:44
+
+from django.conf import settings
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY não bloqueia escritas na tabela, mas não pode rodar dentro de uma transação.
+    atomic = False
+
+    dependencies = [
+        ('movies', '0002_movie_rating_aggregates'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='movie',
+            index=models.Index(fields=['title', 'uuid'], name='movie_title_uuid_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:56
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_search_vector(apps, schema_editor):
+    Movie = apps.get_model('movies', 'Movie')
+    config = settings.MOVIE_SEARCH_CONFIG
+
+    movie_actors = Movie.actors.through.objects.filter(movie=OuterRef('pk')).order_by().values('movie')
+    actor_names = Subquery(movie_actors.annotate(names=StringAgg('actor__name', delimiter=' ')).values('names'))
+    Movie.objects.update(
+        search_vector=(
+            SearchVector('title', weight='A', config=config)
+            + SearchVector('resume', weight='B', config=config)
+            + SearchVector(actor_names, weight='C', config=config)
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY não bloqueia escritas na tabela, mas não pode rodar dentro de uma transação.
+    atomic = False
+
+    dependencies = [
+        ('actors', '0002_list_ordering_indexes'),
+        ('movies', '0003_list_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        # Preenchido antes do índice: montar o GIN de uma vez é mais rápido que atualizá-lo linha a linha.
+        migrations.RunPython(backfill_search_vector, migrations.RunPython.noop, atomic=True),
+        AddIndexConcurrently(
+            model_name='movie',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='movie_search_vector_idx'),
+        ),
+    ]
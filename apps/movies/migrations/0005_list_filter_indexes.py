@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 17:27
+
+import django.db.models.deletion
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY não bloqueia escritas na tabela, mas não pode rodar dentro de uma transação.
+    atomic = False
+
+    dependencies = [
+        ('genres', '0004_genre_name_trgm_idx'),
+        ('movies', '0004_movie_search_vector'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='movie',
+            index=models.Index(fields=['genre', 'title', 'uuid'], name='movie_genre_title_uuid_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='movie',
+            index=models.Index(fields=['release_date'], name='movie_release_date_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='movie',
+            index=models.Index(fields=['average_stars'], name='movie_average_stars_idx'),
+        ),
+        # O índice da FK (criado pelo Django com nome derivado da tabela e da coluna) fica redundante com
+        # movie_genre_title_uuid_idx; é removido só depois que o novo índice existe, também sem bloquear escritas.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunSQL(
+                    sql='DROP INDEX CONCURRENTLY IF EXISTS "movies_movie_genre_id_2b557368"',
+                    reverse_sql='CREATE INDEX CONCURRENTLY IF NOT EXISTS "movies_movie_genre_id_2b557368" ON "movies_movie" ("genre_id")',
+                ),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name='movie',
+                    name='genre',
+                    field=models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name='movies',
+                        to='genres.genre',
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,30 @@
+import uuid
+
+from django.db import transaction
+from django.urls import reverse
+
+from apps.movies.models import Movie
+from apps.movies.tasks import generate_movie_description
+
+
+class MovieDescriptionJobMixin:
+    """
+    Enqueues the background AI description of a movie (generate_movie_description)
+    and builds the job data returned to the client to poll its status.
+    """
+
+    def enqueue_description(self, movie: Movie) -> str:
+        # O id do job é gerado aqui para ser devolvido ao cliente antes mesmo da task ser publicada, após o commit.
+        job_id = str(uuid.uuid4())
+        transaction.on_commit(lambda: generate_movie_description.apply_async(args=[str(movie.pk)], task_id=job_id))
+
+        return job_id
+
+    def build_description_job_data(self, job_id: str) -> dict:
+        status_url = reverse('movie-description-job-view', kwargs={'job_id': job_id})
+
+        return {
+            'id': job_id,
+            'status': 'PENDING',
+            'status_url': self.request.build_absolute_uri(status_url),
+        }
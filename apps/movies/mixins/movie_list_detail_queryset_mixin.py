@@ -0,0 +1,19 @@
+from django.db.models import QuerySet
+
+
+class MovieListDetailQuerysetMixin:
+    """
+    Builds the queryset used by MovieListDetailSerializer on read requests.
+
+    The genre is joined and the actors are prefetched in a single query (the
+    rate is read from the denormalized Movie.average_stars column), so a page
+    costs a constant number of queries regardless of its size.
+    """
+
+    def get_queryset(self) -> QuerySet:
+        queryset = super().get_queryset()
+
+        if self.request.method != 'GET':
+            return queryset
+
+        return queryset.select_related('genre').prefetch_related('actors')
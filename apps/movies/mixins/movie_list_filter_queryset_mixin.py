@@ -0,0 +1,40 @@
+from django.db.models import QuerySet
+
+from apps.movies.serializers import MovieListFilterSerializer
+
+
+class MovieListFilterQuerysetMixin:
+    """
+    Filters list requests by `genre`, `actor`, `min_release_year`,
+    `max_release_year` and `min_rate` query params (invalid values answer 400).
+
+    Every filter is served by an index: (genre, title, uuid) keeps genre
+    filtering in the list ordering, the actor goes through the actor_id index
+    of the movie/actor table, and release_date and average_stars have their own
+    indexes. The ordering and both paginations are applied on top of it.
+    """
+
+    def get_queryset(self) -> QuerySet:
+        queryset = super().get_queryset()
+
+        if self.request.method != 'GET':
+            return queryset
+
+        serializer = MovieListFilterSerializer(data=self.request.query_params)
+        serializer.is_valid(raise_exception=True)
+        filters = serializer.validated_data
+
+        if 'genre' in filters:
+            queryset = queryset.filter(genre_id=filters['genre'])
+        if 'actor' in filters:
+            # Um único ator: o join com movies_movie_actors não duplica filmes (movie_id, actor_id é único).
+            queryset = queryset.filter(actors=filters['actor'])
+        # __year__gte/__year__lte viram release_date >= 'AAAA-01-01' / <= 'AAAA-12-31', que usam o índice.
+        if 'min_release_year' in filters:
+            queryset = queryset.filter(release_date__year__gte=filters['min_release_year'])
+        if 'max_release_year' in filters:
+            queryset = queryset.filter(release_date__year__lte=filters['max_release_year'])
+        if 'min_rate' in filters:
+            queryset = queryset.filter(average_stars__gte=filters['min_rate'])
+
+        return queryset
@@ -8,9 +8,3 @@ class MovieSuggestorDescriptionMixin:
         description = suggestor_description_service.suggest_description(movie)
 
         return description
-
-    def apply_description(self, movie: Movie, description: str) -> Movie:
-        movie.resume = description
-        movie.save()
-
-        return movie
@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 
 from apps.actors.models import Actor
@@ -6,11 +8,15 @@ from apps.genres.models import Genre
 
 
 class Movie(BaseModel):
+    # Mantidos só pelos UPDATEs do MovieRatingService e do MovieSearchService.
+    SERVICE_MANAGED_FIELDS = frozenset({'review_count', 'stars_sum', 'average_stars', 'search_vector'})
+
     title = models.CharField(max_length=500)
     genre = models.ForeignKey(
         Genre,
         on_delete=models.PROTECT,  # Se algum registro estiver associado a um gênero em uso, não vai permitir a deleção.
         related_name='movies',  # Facilita na queryset do Django ao usar .movies trazer todos os filmes que o Genre está ligado.
+        db_index=False,  # Coberto por movie_genre_title_uuid_idx, que começa pelo gênero.
     )
     release_date = models.DateField(null=True, blank=True)
     actors = models.ManyToManyField(
@@ -18,9 +24,36 @@ class Movie(BaseModel):
         related_name='movies',  # Facilita na queryset do Django ao usar .movies trazer todos os filmes que o Actor está ligado.
     )
     resume = models.TextField(null=True, blank=True)
+    # Agregados de avaliações mantidos pelo MovieRatingService a cada escrita de Review.
+    review_count = models.PositiveIntegerField(default=0, editable=False)
+    stars_sum = models.PositiveIntegerField(default=0, editable=False)
+    average_stars = models.FloatField(null=True, blank=True, editable=False)
+    # Título, resumo e nomes dos atores para a busca textual, mantido pelo MovieSearchService.
+    search_vector = SearchVectorField(null=True, editable=False)
 
     class Meta:
         ordering = ['title']
+        indexes = [
+            # Listagem ordenada por título (a paginação por cursor desempata pelo uuid)
+            models.Index(fields=['title', 'uuid'], name='movie_title_uuid_idx'),
+            # Filtro por gênero já na ordem da listagem (genre = x ORDER BY title, uuid)
+            models.Index(fields=['genre', 'title', 'uuid'], name='movie_genre_title_uuid_idx'),
+            # Filtros por intervalo de ano de lançamento e nota mínima
+            models.Index(fields=['release_date'], name='movie_release_date_idx'),
+            models.Index(fields=['average_stars'], name='movie_average_stars_idx'),
+            # Busca textual (search_vector @@ query)
+            GinIndex(fields=['search_vector'], name='movie_search_vector_idx'),
+        ]
 
     def __str__(self):
         return self.title
+
+    def save(self, *args, **kwargs):
+        # editable=False não tira os campos do UPDATE do save(): sem isto, editar um filme gravaria de volta os
+        # agregados lidos no início da requisição, apagando os deltas de reviews criadas nesse intervalo.
+        if not self._state.adding and not kwargs.get('force_insert') and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields if not field.primary_key and field.name not in self.SERVICE_MANAGED_FIELDS
+            ]
+
+        super().save(*args, **kwargs)
@@ -1,4 +1,3 @@
-from django.db.models import Avg
 from rest_framework import serializers
 
 from apps.actors.serializers import ActorSerializer
@@ -19,7 +18,7 @@ class MovieModelSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Movie
-        fields = '__all__'
+        exclude = ['search_vector']
 
     def validate_release_date(self, value):
         if value.year < self.LIMIT_YEAR_OF_BIRTH:
@@ -52,7 +51,7 @@ class MovieListDetailSerializer(serializers.ModelSerializer):
         ]
 
     def get_rate(self, obj):
-        rate = obj.reviews.aggregate(Avg('stars'))['stars__avg']
+        rate = obj.average_stars
         if rate:
             return round(rate, 1)
         return None
@@ -65,5 +64,25 @@ class MovieStatsSerializer(serializers.Serializer):
     average_stars = serializers.FloatField()
 
 
+class MovieSearchSerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200, help_text='Texto da busca (aceita "frases entre aspas", or e -palavra)')
+
+
+class MovieListFilterSerializer(serializers.Serializer):
+    genre = serializers.UUIDField(required=False, help_text='UUID do gênero')
+    actor = serializers.UUIDField(required=False, help_text='UUID de um ator do elenco')
+    min_release_year = serializers.IntegerField(required=False, min_value=1, max_value=9999, help_text='Lançados a partir deste ano')
+    max_release_year = serializers.IntegerField(required=False, min_value=1, max_value=9999, help_text='Lançados até este ano')
+    min_rate = serializers.FloatField(required=False, min_value=0, max_value=5, help_text='Nota média mínima')
+
+    def validate(self, attrs):
+        min_release_year = attrs.get('min_release_year')
+        max_release_year = attrs.get('max_release_year')
+        if min_release_year is not None and max_release_year is not None and min_release_year > max_release_year:
+            raise serializers.ValidationError({'min_release_year': 'The min release year can not be greater than the max release year.'})
+
+        return attrs
+
+
 class MovieDescriptionSerializer(serializers.Serializer):
     movie_uuid = serializers.PrimaryKeyRelatedField(queryset=Movie.objects.all())
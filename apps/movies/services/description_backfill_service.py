@@ -0,0 +1,150 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from django.db.models import Q
+from django.utils import timezone
+
+from app.settings import logger
+from apps.core.adapters.ai_adapters.base import AIAgentAdapter
+from apps.core.constants import DESCRIPTION_BACKFILL_BATCH_SIZE, DESCRIPTION_BACKFILL_RATE_LIMIT, DESCRIPTION_BACKFILL_WORKERS
+from apps.core.utils.rate_limiter import RateLimiter
+from apps.movies.models import Movie
+from apps.movies.serializers import MovieModelSerializer
+from apps.movies.services.movie_suggestor_description_service import MovieSuggestorDescriptionService
+from apps.movies.services.search_service import search_service
+
+
+class MovieDescriptionBackfillService:
+    """
+    Generates descriptions for every movie without a resume.
+
+    Movies are read in keyset batches; the AI calls of a batch are fanned out to
+    a thread pool sharing a RateLimiter and the results are written back with a
+    single bulk_update per batch, which only touches the movies whose resume is
+    still empty (a resume written through the API meanwhile is kept).
+    """
+
+    RESUME_LIMIT = MovieModelSerializer.LIMIT_RESUME_CHARACTERS
+
+    def __init__(
+        self,
+        ai_adapter: AIAgentAdapter,
+        workers: int = DESCRIPTION_BACKFILL_WORKERS,
+        rate_limit: float = DESCRIPTION_BACKFILL_RATE_LIMIT,
+        batch_size: int = DESCRIPTION_BACKFILL_BATCH_SIZE,
+        limit: Optional[int] = None,
+    ) -> None:
+        self.suggestor_description_service = MovieSuggestorDescriptionService(ai_adapter=ai_adapter)
+        self.workers = workers
+        self.rate_limiter = RateLimiter(rate_limit)
+        self.batch_size = batch_size
+        self.limit = limit
+
+        self.updated_count = 0
+        self.skipped_count = 0
+        self.failed_count = 0
+        self.errors: List[str] = []
+
+    def __get_empty_resume_queryset(self):
+        return Movie.objects.filter(Q(resume__isnull=True) | Q(resume=''))
+
+    def __iter_batches(self):
+        queryset = self.__get_empty_resume_queryset().order_by('uuid').only('uuid', 'title', 'resume')
+        remaining = self.limit
+        last_uuid = None
+
+        while remaining is None or remaining > 0:
+            batch_queryset = queryset.filter(uuid__gt=last_uuid) if last_uuid else queryset
+            size = self.batch_size if remaining is None else min(self.batch_size, remaining)
+
+            movies = list(batch_queryset[:size])
+            if not movies:
+                return
+
+            yield movies
+
+            last_uuid = movies[-1].uuid
+            if remaining is not None:
+                remaining -= len(movies)
+
+    def __suggest_description(self, movie: Movie) -> str:
+        self.rate_limiter.acquire()
+        description = self.suggestor_description_service.suggest_description(movie)
+
+        # Mesmo limite da API (MovieModelSerializer), que este caminho não passa.
+        if len(description) > self.RESUME_LIMIT:
+            raise ValueError(f'Generated description has {len(description)} characters, the limit is {self.RESUME_LIMIT}')
+
+        return description
+
+    def __process_batch(self, executor: ThreadPoolExecutor, movies: List[Movie]) -> None:
+        futures = [(movie, executor.submit(self.__suggest_description, movie)) for movie in movies]
+
+        now = timezone.now()
+        movies_to_update = []
+        for movie, future in futures:
+            try:
+                description = future.result()
+            except Exception as e:
+                self.failed_count += 1
+                self.errors.append(f'Movie {movie.uuid} ({movie.title}): {str(e)}')
+                logger.error(f'Error generating description for movie {movie.uuid}: {str(e)}')
+                continue
+
+            movie.resume = description
+            movie.updated_at = now
+            movies_to_update.append(movie)
+
+        if not movies_to_update:
+            return
+
+        # Um UPDATE condicional para o lote: o bulk_update mantém o filtro da queryset, então filmes que
+        # ganharam resumo pela API durante as chamadas à IA não são sobrescritos.
+        updated_count = self.__get_empty_resume_queryset().bulk_update(movies_to_update, fields=['resume', 'updated_at'])
+        # bulk_update não dispara post_save: o resumo novo entra no search_vector do lote em um UPDATE.
+        search_service().refresh(Movie.objects.filter(pk__in=[movie.pk for movie in movies_to_update]))
+
+        self.updated_count += updated_count
+        self.skipped_count += len(movies_to_update) - updated_count
+
+    def backfill(self) -> Dict:
+        logger_data = {
+            'service': 'MovieDescriptionBackfillService',
+            'method': 'backfill',
+            'workers': self.workers,
+            'rate_limit': self.rate_limiter.rate,
+            'batch_size': self.batch_size,
+            'limit': self.limit,
+        }
+        logger.info(logger_data)
+
+        started_at = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for movies in self.__iter_batches():
+                self.__process_batch(executor, movies)
+
+        elapsed = time.monotonic() - started_at
+        processed_count = self.updated_count + self.skipped_count + self.failed_count
+        throughput = processed_count / elapsed if elapsed > 0 else 0.0
+
+        logger.info({
+            **logger_data,
+            'updated_count': self.updated_count,
+            'skipped_count': self.skipped_count,
+            'failed_count': self.failed_count,
+            'elapsed': elapsed,
+        })
+
+        return {
+            'processed_count': processed_count,
+            'updated_count': self.updated_count,
+            'skipped_count': self.skipped_count,
+            'failed_count': self.failed_count,
+            'elapsed_seconds': round(elapsed, 2),
+            'throughput': round(throughput, 2),
+            'errors': self.errors,
+        }
+
+
+description_backfill_service = MovieDescriptionBackfillService
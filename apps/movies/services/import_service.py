@@ -1,27 +1,55 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db import transaction
 
 from app.settings import logger
 from apps.actors.models import Actor
-from apps.core.constants import CSV_LINE_LIMIT
+from apps.core.constants import CSV_LINE_LIMIT, IMPORT_BATCH_SIZE, IMPORT_NAME_CACHE_LIMIT
 from apps.core.utils.file_readers.file_reader import FileReader
+from apps.core.utils.trigram import fuzzy_resolve
 from apps.genres.models import Genre
 from apps.movies.models import Movie
+from apps.movies.services.search_service import search_service
+from apps.movies.services.stats_snapshot_store import movie_stats_snapshot_store
+
+PendingMovie = Tuple[int, Movie, List[Actor]]
 
 
 class MovieImportService:
-    def __init__(self, file_path: str, file_reader: FileReader) -> None:
+    TITLE_LIMIT = Movie._meta.get_field('title').max_length
+
+    def __init__(self, file_path: str, file_reader: FileReader, batch_size: int = IMPORT_BATCH_SIZE, fuzzy: bool = False) -> None:
+        if batch_size <= 0:
+            raise ValueError(f'batch_size must be a positive integer, got {batch_size}')
+
         self.file_path = file_path
         self.file_reader = file_reader
+        self.batch_size = batch_size
+        self.fuzzy = fuzzy
         self.created_count = 0
         self.skipped_count = 0
         self.errors: List[str] = []
+        # Nome do arquivo -> nome cadastrado, para os gêneros/atores resolvidos por similaridade.
+        self.fuzzy_matches: Dict[str, str] = {}
+        # Gêneros/atores do lote atual, por nome.
+        self.__genres_by_name: Dict[str, Genre] = {}
+        self.__actors_by_name: Dict[str, Actor] = {}
+        # Nomes já encontrados em lotes anteriores (até IMPORT_NAME_CACHE_LIMIT por tipo); nomes ausentes não ficam no cache.
+        self.__known_genres: Dict[str, Genre] = {}
+        self.__known_actors: Dict[str, Actor] = {}
 
     def __validate_title(self, title: str, row_num: int) -> bool:
         if not title:
             self.errors.append(f'Line {row_num + 1}: Title is required')
             self.skipped_count += 1
             return False
+
+        if len(title) > self.TITLE_LIMIT:
+            self.errors.append(f'Line {row_num + 1}: Title exceeds {self.TITLE_LIMIT} characters')
+            self.skipped_count += 1
+            return False
+
         return True
 
     def __validate_genre(self, genre_name: str, row_num: int) -> Optional[Genre]:
@@ -30,13 +58,14 @@ class MovieImportService:
             self.skipped_count += 1
             return None
 
-        try:
-            return Genre.objects.get(name=genre_name)
-        except Genre.DoesNotExist:
+        genre = self.__genres_by_name.get(genre_name)
+        if not genre:
             self.errors.append(f'Line {row_num + 1}: Genre "{genre_name}" not found. Create the genre first.')
             self.skipped_count += 1
             return None
 
+        return genre
+
     def __parse_release_date(self, date_str: str, row_num: int) -> Optional[datetime.date]:
         if not date_str:
             return None
@@ -60,23 +89,69 @@ class MovieImportService:
 
         return resume
 
-    def __get_actors_by_names(self, actors_names: str, row_num: int) -> Optional[List[Actor]]:
+    def __split_actor_names(self, actors_names: str) -> List[str]:
+        return [name.strip() for name in actors_names.split(',') if name.strip()]
+
+    def __get_actors_by_names(self, actors_names: str, row_num: int) -> List[Actor]:
         if not actors_names:
             return []
 
-        actor_names_list = [name.strip() for name in actors_names.split(',') if name.strip()]
-        actors_to_add = []
-
-        for actor_name in actor_names_list:
-            try:
-                actor = Actor.objects.get(name=actor_name)
-                actors_to_add.append(actor)
-            except Actor.DoesNotExist:
+        actors_to_add = {}
+        for actor_name in self.__split_actor_names(actors_names):
+            actor = self.__actors_by_name.get(actor_name)
+            if actor:
+                actors_to_add[actor.pk] = actor
+            else:
                 logger.warning(f'Line {row_num + 1}: Actor "{actor_name}" not found. Skipping...')
 
-        return actors_to_add
+        return list(actors_to_add.values())
+
+    def __resolve_names(self, queryset, known: Dict, names: Set[str]) -> Dict:
+        resolved = {name: known[name] for name in names if name in known}
+        missing_names = names - resolved.keys()
+        if not missing_names:
+            return resolved
+
+        found = {instance.name: instance for instance in queryset.filter(name__in=missing_names)}
+        found.update(self.__resolve_fuzzy(queryset, missing_names - found.keys()))
+        resolved.update(found)
+
+        # Só correspondências entram no cache, e só até o limite: um nome ausente pode ser cadastrado durante a importação.
+        for name, instance in found.items():
+            if len(known) >= IMPORT_NAME_CACHE_LIMIT:
+                break
+            known[name] = instance
+
+        return resolved
+
+    def __resolve_genres(self, rows: Iterable[Dict[str, str]]) -> None:
+        genre_names = {str(row.get('genre', '')).strip() for row in rows} - {''}
+        self.__genres_by_name = self.__resolve_names(Genre.objects.all(), self.__known_genres, genre_names)
+
+    def __resolve_actors(self, rows: Iterable[Dict[str, str]]) -> None:
+        actor_names = set()
+        for row in rows:
+            actor_names.update(self.__split_actor_names(str(row.get('actors', ''))))
 
-    def __process_row(self, row: Dict[str, str], row_num: int) -> Optional[Movie]:
+        self.__actors_by_name = self.__resolve_names(Actor.objects.all(), self.__known_actors, actor_names)
+
+    def __resolve_fuzzy(self, queryset, names: Set[str]) -> Dict:
+        # Só os nomes sem correspondência exata passam pela busca por similaridade (pg_trgm).
+        if not self.fuzzy or not names:
+            return {}
+
+        resolved = {}
+        for name, instance in fuzzy_resolve(queryset, sorted(names)).items():
+            if instance is None:
+                continue
+
+            resolved[name] = instance
+            self.fuzzy_matches[name] = instance.name
+            logger.info(f'"{name}" resolved to "{instance.name}" by similarity')
+
+        return resolved
+
+    def __build_movie(self, row: Dict[str, str], row_num: int) -> Optional[PendingMovie]:
         try:
             title = row.get('title', '').strip()
             if not self.__validate_title(title, row_num):
@@ -95,16 +170,12 @@ class MovieImportService:
             if resume is None and row.get('resume'):
                 return None
 
-            movie = Movie.objects.create(title=title, genre=genre, release_date=release_date, resume=resume)
+            movie = Movie(title=title, genre=genre, release_date=release_date, resume=resume)
 
             actors_names = row.get('actors', '').strip()
             actors_to_add = self.__get_actors_by_names(actors_names, row_num)
-            if actors_to_add:
-                movie.actors.set(actors_to_add)
 
-            self.created_count += 1
-            logger.info(f'Movie created: {title}')
-            return movie
+            return row_num, movie, actors_to_add
 
         except Exception as e:
             self.errors.append(f'Row {row_num + 1}: Unexpected error - {str(e)}')
@@ -112,23 +183,71 @@ class MovieImportService:
             logger.error(f'Error processing row {row_num + 1}: {str(e)}')
             return None
 
+    def __write_batch(self, pending_movies: List[PendingMovie]) -> None:
+        if not pending_movies:
+            return
+
+        movie_actor_model = Movie.actors.through
+        movies = [movie for _, movie, _ in pending_movies]
+        movie_actors = [movie_actor_model(movie_id=movie.pk, actor_id=actor.pk) for _, movie, actors in pending_movies for actor in actors]
+
+        try:
+            # Uma transação por lote: cada lote é confirmado ao ser gravado, e um lote com erro é descartado sem
+            # desfazer os anteriores nem manter locks e versões de linha abertos durante a importação inteira.
+            with transaction.atomic():
+                Movie.objects.bulk_create(movies, batch_size=self.batch_size)
+                movie_actor_model.objects.bulk_create(movie_actors, batch_size=self.batch_size)
+                # bulk_create não dispara post_save/m2m_changed: o search_vector do lote é calculado em um UPDATE.
+                search_service().refresh(Movie.objects.filter(pk__in=[movie.pk for movie in movies]))
+                # bulk_create não dispara post_save, então o snapshot de estatísticas é invalidado explicitamente.
+                transaction.on_commit(movie_stats_snapshot_store.invalidate)
+        except Exception as e:
+            for row_num, _, _ in pending_movies:
+                self.errors.append(f'Row {row_num + 1}: Unexpected error - {str(e)}')
+            self.skipped_count += len(pending_movies)
+            logger.error(f'Error writing batch of {len(pending_movies)} movies: {str(e)}')
+            return
+
+        self.created_count += len(movies)
+        logger_data = {
+            'service': 'MovieImportService',
+            'method': 'write_batch',
+            'movies_created': len(movies),
+            'movie_actors_created': len(movie_actors),
+        }
+        logger.info(logger_data)
+
     def import_movies(self) -> Dict:
         logger_data = {
             'service': 'MovieImportService',
             'method': 'import_movies',
             'file_path': self.file_path,
             'file_reader': self.file_reader.__class__.__name__,
+            'batch_size': self.batch_size,
+            'fuzzy': self.fuzzy,
         }
         logger.info(logger_data)
 
-        rows = self.file_reader.read(self.file_path)
-        for row_num, row in enumerate(rows):
-            self.__process_row(row, row_num)
+        row_num = 0
+        # Os lotes são lidos sob demanda: cada lote é validado e gravado antes do próximo ser carregado.
+        for rows in self.file_reader.iter_batches(self.file_path, self.batch_size):
+            self.__resolve_genres(rows)
+            self.__resolve_actors(rows)
+
+            pending_movies: List[PendingMovie] = []
+            for row in rows:
+                pending_movie = self.__build_movie(row, row_num)
+                if pending_movie:
+                    pending_movies.append(pending_movie)
+                row_num += 1
+
+            self.__write_batch(pending_movies)
 
         return {
             'created_count': self.created_count,
             'skipped_count': self.skipped_count,
             'errors': self.errors,
+            'fuzzy_matches': self.fuzzy_matches,
         }
 
 
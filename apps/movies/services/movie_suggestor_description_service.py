@@ -27,5 +27,6 @@ class MovieSuggestorDescriptionService:
 
     def apply_description(self, movie: Movie, description: str) -> None:
         movie.resume = description
-        movie.save()
+        # Só o resumo é gravado: a descrição pode ser aplicada em background, depois de outras edições no filme.
+        movie.save(update_fields=['resume', 'updated_at'])
         return movie.refresh_from_db()
@@ -0,0 +1,69 @@
+from typing import Optional, Tuple
+
+from django.apps import apps as django_apps
+from django.db.models import Avg, Count, F, FloatField, OuterRef, QuerySet, Subquery, Sum, Value
+from django.db.models.functions import Cast, Coalesce, NullIf
+
+from app.settings import logger
+from apps.movies.models import Movie
+
+ReviewRating = Tuple[str, int]
+
+
+class MovieRatingService:
+    """
+    Keeps the denormalized rating columns of Movie (review_count, stars_sum and
+    average_stars) in sync with its reviews using atomic F() increments, so the
+    rate of a movie is a column read instead of an aggregate over its reviews.
+    """
+
+    def __apply_delta(self, movie_id, count_delta: int, stars_delta: int) -> None:
+        review_count = F('review_count') + count_delta
+        stars_sum = F('stars_sum') + stars_delta
+
+        Movie.objects.filter(pk=movie_id).update(
+            review_count=review_count,
+            stars_sum=stars_sum,
+            average_stars=Cast(stars_sum, FloatField()) / NullIf(review_count, 0),
+        )
+
+    def apply_review_change(self, previous: Optional[ReviewRating], current: Optional[ReviewRating]) -> None:
+        """
+        Applies the difference between the previous and current (movie_id, stars)
+        of a review. `previous` is None for a new review and `current` is None for
+        a deleted one.
+        """
+        if previous == current:
+            return
+
+        if previous and current and previous[0] == current[0]:
+            self.__apply_delta(current[0], count_delta=0, stars_delta=current[1] - previous[1])
+            return
+
+        if previous:
+            self.__apply_delta(previous[0], count_delta=-1, stars_delta=-previous[1])
+
+        if current:
+            self.__apply_delta(current[0], count_delta=1, stars_delta=current[1])
+
+    def rebuild(self, queryset: Optional[QuerySet] = None) -> int:
+        queryset = queryset if queryset is not None else Movie.objects.all()
+
+        logger_data = {
+            'service': 'MovieRatingService',
+            'method': 'rebuild',
+        }
+        logger.info(logger_data)
+
+        # Resolved through the app registry because apps.reviews.models imports this module.
+        review_model = django_apps.get_model('reviews', 'Review')
+        reviews = review_model.objects.filter(movie=OuterRef('pk')).order_by().values('movie')
+
+        return queryset.update(
+            review_count=Coalesce(Subquery(reviews.annotate(total=Count('uuid')).values('total')), Value(0)),
+            stars_sum=Coalesce(Subquery(reviews.annotate(total=Sum('stars')).values('total')), Value(0)),
+            average_stars=Subquery(reviews.annotate(average=Avg('stars')).values('average')),
+        )
+
+
+rating_service = MovieRatingService
@@ -0,0 +1,66 @@
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db.models import F, FloatField, OuterRef, QuerySet, Subquery
+from django.db.models.functions import Cast
+
+from app.settings import logger
+from apps.movies.models import Movie
+
+
+class MovieSearchService:
+    """
+    Keeps the stored Movie.search_vector (title, resume and actor names, weighted
+    A, B and C) up to date and runs the ranked full-text search over it.
+
+    The vector is GIN-indexed, so a search only ranks the movies that match the
+    query instead of building a tsvector for every movie on each request.
+    """
+
+    def __build_search_vector(self) -> SearchVector:
+        config = settings.MOVIE_SEARCH_CONFIG
+        movie_actors = Movie.actors.through.objects.filter(movie=OuterRef('pk')).order_by().values('movie')
+        actor_names = Subquery(movie_actors.annotate(names=StringAgg('actor__name', delimiter=' ')).values('names'))
+
+        return (
+            SearchVector('title', weight='A', config=config)
+            + SearchVector('resume', weight='B', config=config)
+            + SearchVector(actor_names, weight='C', config=config)
+        )
+
+    def refresh(self, queryset: Optional[QuerySet] = None) -> int:
+        """
+        Recomputes the search vector of the movies in `queryset` (every movie by
+        default) with a single UPDATE.
+        """
+        queryset = queryset if queryset is not None else Movie.objects.all()
+
+        return queryset.update(search_vector=self.__build_search_vector())
+
+    def rebuild(self) -> int:
+        logger_data = {
+            'service': 'MovieSearchService',
+            'method': 'rebuild',
+            'config': settings.MOVIE_SEARCH_CONFIG,
+        }
+        logger.info(logger_data)
+
+        return self.refresh()
+
+    def search(self, text: str, queryset: Optional[QuerySet] = None) -> QuerySet:
+        """
+        Movies matching `text` (web search syntax: quoted phrases, `or`, `-word`)
+        annotated with their `rank`.
+        """
+        queryset = queryset if queryset is not None else Movie.objects.all()
+        query = SearchQuery(text, search_type='websearch', config=settings.MOVIE_SEARCH_CONFIG)
+
+        # ts_rank devolve real; em double precision o valor volta idêntico do cursor da paginação (rank < valor).
+        rank = Cast(SearchRank(F('search_vector'), query), FloatField())
+
+        return queryset.filter(search_vector=query).annotate(rank=rank)
+
+
+search_service = MovieSearchService
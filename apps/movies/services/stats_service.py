@@ -7,37 +7,42 @@ from apps.reviews.models import Review
 class MovieStatsService:
     def __init__(self, queryset: QuerySet) -> None:
         self.queryset = queryset
-        self.reviews = Review.objects.count()
 
     def __get_total_movies(self) -> int:
         return self.queryset.count()
 
-    def __get_movies_by_genre(self) -> int:
-        return self.queryset.values('genre__name').annotate(count=Count('uuid'))
+    def __get_movies_by_genre(self) -> list[dict]:
+        return list(self.queryset.values('genre__name').annotate(count=Count('uuid')))
 
-    def __get_average_stars(self) -> float:
-        result = Review.objects.aggregate(avg_stars=Avg('stars'))['avg_stars']
+    def __get_reviews_summary(self) -> dict:
+        # Total e média das avaliações em uma única agregação.
+        return Review.objects.aggregate(total_reviews=Count('uuid'), avg_stars=Avg('stars'))
 
-        if result is not None:
-            average_stars = round(result, 1)
+    def __get_average_stars(self, avg_stars: float | None) -> float:
+        if avg_stars is not None:
+            average_stars = round(avg_stars, 1)
         else:
             average_stars = 0.0
 
         return average_stars if average_stars else 0
 
     def build_data(self):
+        total_movies = self.__get_total_movies()
+
         logger_data = {
             'service': 'MovieStatsService',
             'method': 'build_data',
-            'queryset_count': self.queryset.count(),
+            'queryset_count': total_movies,
         }
         logger.info(logger_data)
 
+        reviews_summary = self.__get_reviews_summary()
+
         data = {
-            'total_movies': self.__get_total_movies(),
+            'total_movies': total_movies,
             'movies_by_genre': self.__get_movies_by_genre(),
-            'total_reviews': self.reviews,
-            'average_stars': self.__get_average_stars(),
+            'total_reviews': reviews_summary['total_reviews'],
+            'average_stars': self.__get_average_stars(reviews_summary['avg_stars']),
         }
 
         return data
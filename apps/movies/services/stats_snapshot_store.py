@@ -0,0 +1,86 @@
+import threading
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+
+from app.settings import logger
+
+
+class MovieStatsSnapshotStore:
+    """
+    Shared snapshot of the MovieStatsSerializer payload.
+
+    The snapshot lives in the configured cache backend (Redis in production), so
+    every process serves and drops the same copy: it is rebuilt at most once per
+    MOVIE_STATS_SNAPSHOT_TTL seconds and dropped whenever a Movie, Review or
+    Genre write is committed (see apps.movies.signals). A TTL of 0 disables the
+    snapshot.
+
+    Snapshots are stored under a version that invalidate() bumps, and a rebuild
+    writes under the version it read before querying, so a rebuild that was
+    already running when a write committed can never publish its stale stats.
+    """
+
+    VERSION_KEY = 'movies:stats:version'
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+
+    def __get_ttl(self) -> int:
+        return settings.MOVIE_STATS_SNAPSHOT_TTL
+
+    def __get_version(self) -> int:
+        version = cache.get(self.VERSION_KEY)
+        if version is None:
+            # Uma versão nova (e não 1) evita reaproveitar snapshots antigos se a chave de versão for removida do cache.
+            version = time.time_ns()
+            if not cache.add(self.VERSION_KEY, version, timeout=None):
+                version = cache.get(self.VERSION_KEY, version)
+
+        return version
+
+    def __get_key(self, version: int) -> str:
+        return f'movies:stats:snapshot:{version}'
+
+    def get(self, builder: Callable[[], dict]) -> dict:
+        ttl = self.__get_ttl()
+        if ttl <= 0:
+            return builder()
+
+        key = self.__get_key(self.__get_version())
+        data = cache.get(key)
+        if data is not None:
+            return data
+
+        with self.__lock:
+            # Outra thread deste processo pode ter reconstruído o snapshot enquanto esperávamos o lock.
+            key = self.__get_key(self.__get_version())
+            data = cache.get(key)
+            if data is not None:
+                return data
+
+            logger_data = {
+                'service': 'MovieStatsSnapshotStore',
+                'method': 'get',
+                'action': 'rebuild',
+                'ttl': ttl,
+            }
+            logger.info(logger_data)
+
+            # A versão foi lida antes da consulta: se uma escrita for confirmada durante o builder, o resultado fica
+            # numa chave que ninguém mais lê.
+            data = builder()
+            cache.set(key, data, timeout=ttl)
+
+        return data
+
+    def invalidate(self) -> None:
+        try:
+            cache.incr(self.VERSION_KEY)
+        except ValueError:
+            cache.set(self.VERSION_KEY, time.time_ns(), timeout=None)
+
+
+movie_stats_snapshot_store = MovieStatsSnapshotStore()
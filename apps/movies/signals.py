@@ -0,0 +1,73 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.actors.models import Actor
+from apps.genres.models import Genre
+from apps.movies.models import Movie
+from apps.movies.services.search_service import search_service
+from apps.movies.services.stats_snapshot_store import movie_stats_snapshot_store
+from apps.reviews.models import Review
+
+
+@receiver(post_save, sender=Movie)
+@receiver(post_delete, sender=Movie)
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+@receiver(post_save, sender=Genre)
+@receiver(post_delete, sender=Genre)
+def invalidate_movie_stats_snapshot_signal(sender, **kwargs):
+    transaction.on_commit(movie_stats_snapshot_store.invalidate)
+
+
+# Campos de Movie que entram no search_vector; saves que só tocam outros campos (ex.: updated_at) não o recalculam.
+SEARCH_VECTOR_FIELDS = {'title', 'resume'}
+
+
+def refresh_movies_search_vector(movie_ids) -> None:
+    if movie_ids:
+        search_service().refresh(Movie.objects.filter(pk__in=movie_ids))
+
+
+@receiver(post_save, sender=Movie)
+def refresh_movie_search_vector_signal(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not SEARCH_VECTOR_FIELDS & set(update_fields):
+        return
+
+    refresh_movies_search_vector([instance.pk])
+
+
+@receiver(m2m_changed, sender=Movie.actors.through)
+def refresh_movie_search_vector_on_actors_change_signal(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        # movie.actors.add/remove/set/clear
+        if action in {'post_add', 'post_remove', 'post_clear'}:
+            refresh_movies_search_vector([instance.pk])
+        return
+
+    # actor.movies.add/remove/set/clear: no clear os filmes só são conhecidos antes de remover as linhas.
+    if action == 'pre_clear':
+        instance._search_vector_movie_ids = list(instance.movies.values_list('pk', flat=True))
+    elif action == 'post_clear':
+        refresh_movies_search_vector(instance.__dict__.pop('_search_vector_movie_ids', []))
+    elif action in {'post_add', 'post_remove'}:
+        refresh_movies_search_vector(list(pk_set))
+
+
+@receiver(post_save, sender=Actor)
+def refresh_actor_movies_search_vector_signal(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and 'name' not in update_fields):
+        return
+
+    search_service().refresh(Movie.objects.filter(actors=instance))
+
+
+@receiver(pre_delete, sender=Actor)
+def collect_actor_movies_before_delete_signal(sender, instance, **kwargs):
+    # O CASCADE apaga as linhas de movies_movie_actors sem disparar m2m_changed.
+    instance._search_vector_movie_ids = list(instance.movies.values_list('pk', flat=True))
+
+
+@receiver(post_delete, sender=Actor)
+def refresh_deleted_actor_movies_search_vector_signal(sender, instance, **kwargs):
+    refresh_movies_search_vector(instance.__dict__.pop('_search_vector_movie_ids', []))
@@ -0,0 +1,50 @@
+from celery import shared_task
+
+from app.settings import logger
+from apps.core.adapters.ai_adapters.factory import get_ai_adapter
+from apps.core.constants import DESCRIPTION_BACKFILL_BATCH_SIZE, DESCRIPTION_BACKFILL_RATE_LIMIT, DESCRIPTION_BACKFILL_WORKERS
+from apps.movies.models import Movie
+from apps.movies.services.description_backfill_service import MovieDescriptionBackfillService
+from apps.movies.services.movie_suggestor_description_service import MovieSuggestorDescriptionService
+
+
+@shared_task
+def generate_movie_description(movie_id):
+    logger_data = {
+        'task': 'generate_movie_description',
+        'movie_id': movie_id,
+    }
+
+    try:
+        movie = Movie.objects.get(uuid=movie_id)
+        service = MovieSuggestorDescriptionService(ai_adapter=get_ai_adapter())
+        description = service.suggest_description(movie)
+        service.apply_description(movie, description)
+    except Exception as e:
+        logger.error({**logger_data, 'action': 'error', 'error_message': str(e)}, exc_info=True)
+        raise
+
+    logger.info({**logger_data, 'action': 'applied'})
+
+    return {'movie_id': str(movie_id), 'description': description}
+
+
+@shared_task
+def backfill_movie_descriptions(
+    workers=DESCRIPTION_BACKFILL_WORKERS,
+    rate_limit=DESCRIPTION_BACKFILL_RATE_LIMIT,
+    batch_size=DESCRIPTION_BACKFILL_BATCH_SIZE,
+    limit=None,
+):
+    service = MovieDescriptionBackfillService(
+        ai_adapter=get_ai_adapter(),
+        workers=workers,
+        rate_limit=rate_limit,
+        batch_size=batch_size,
+        limit=limit,
+    )
+    result = service.backfill()
+
+    logger.info({'task': 'backfill_movie_descriptions', **{key: value for key, value in result.items() if key != 'errors'}})
+
+    return result
@@ -0,0 +1,190 @@
+from concurrent.futures import Future
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.core.constants import DESCRIPTION_BACKFILL_BATCH_SIZE, DESCRIPTION_BACKFILL_RATE_LIMIT, DESCRIPTION_BACKFILL_WORKERS
+from apps.movies.models import Movie
+from apps.movies.services.description_backfill_service import MovieDescriptionBackfillService
+from apps.movies.services.search_service import search_service
+from apps.movies.tasks import backfill_movie_descriptions
+from apps.movies.tests.factories import MovieFactory
+
+
+class InlineExecutor:
+    # Roda as chamadas na thread do teste, que enxerga a transação do banco de teste.
+    def __init__(self, max_workers):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+@pytest.mark.django_db
+class TestMovieDescriptionBackfillService:
+    def setup_method(self):
+        self.mock_adapter = MagicMock()
+        self.mock_adapter.answer.return_value = 'Generated description'
+
+    def __build_service(self, **kwargs) -> MovieDescriptionBackfillService:
+        return MovieDescriptionBackfillService(ai_adapter=self.mock_adapter, rate_limit=0, **kwargs)
+
+    def test_backfill_fills_only_empty_resumes(self):
+        # Arrange
+        empty_movies = [MovieFactory(resume=None), MovieFactory(resume='')]
+        described_movie = MovieFactory(resume='Already described')
+
+        # Act
+        result = self.__build_service().backfill()
+
+        # Assert
+        assert result['processed_count'] == 2
+        assert result['updated_count'] == 2
+        assert result['failed_count'] == 0
+        for movie in empty_movies:
+            movie.refresh_from_db()
+            assert movie.resume == 'Generated description'
+        described_movie.refresh_from_db()
+        assert described_movie.resume == 'Already described'
+
+    def test_backfill_reports_failures_and_keeps_going(self):
+        # Arrange
+        failing_movie = MovieFactory(resume=None, title='Failing movie')
+        MovieFactory(resume=None, title='Working movie')
+        self.mock_adapter.answer.side_effect = self.__answer_or_fail
+
+        # Act
+        result = self.__build_service().backfill()
+
+        # Assert
+        assert result['updated_count'] == 1
+        assert result['failed_count'] == 1
+        assert str(failing_movie.uuid) in result['errors'][0]
+        failing_movie.refresh_from_db()
+        assert failing_movie.resume is None
+
+    def __answer_or_fail(self, prompt: str) -> str:
+        if 'Failing movie' in prompt:
+            raise Exception('AI provider unavailable')
+        return 'Generated description'
+
+    def test_backfill_respects_limit(self):
+        # Arrange
+        MovieFactory.create_batch(5, resume=None)
+
+        # Act
+        result = self.__build_service(batch_size=2, limit=3).backfill()
+
+        # Assert
+        assert result['updated_count'] == 3
+        assert self.mock_adapter.answer.call_count == 3
+
+    def test_backfill_writes_each_batch_with_one_update(self):
+        # Arrange
+        MovieFactory.create_batch(6, resume=None)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            result = self.__build_service(batch_size=3).backfill()
+
+        # Assert
+        assert result['updated_count'] == 6
+        resume_updates = [query for query in queries if query['sql'].startswith('UPDATE') and 'SET "resume"' in query['sql']]
+        search_vector_updates = [query for query in queries if query['sql'].startswith('UPDATE') and 'SET "search_vector"' in query['sql']]
+        assert len(resume_updates) == 2
+        assert len(search_vector_updates) == 2
+
+    def test_backfill_makes_new_resumes_searchable(self):
+        # Arrange
+        movie = MovieFactory(resume=None, title='Matrix')
+        self.mock_adapter.answer.return_value = 'Um programador descobre que vive em uma simulação.'
+
+        # Act
+        self.__build_service().backfill()
+
+        # Assert
+        assert search_service().search('simulação').get().title == movie.title
+
+    def test_backfill_keeps_resume_written_during_the_ai_call(self):
+        # Arrange
+        movie = MovieFactory(resume=None, title='Matrix')
+
+        def answer_while_user_edits(prompt: str) -> str:
+            Movie.objects.filter(pk=movie.pk).update(resume='Written by a user')
+            return 'Generated description'
+
+        self.mock_adapter.answer.side_effect = answer_while_user_edits
+
+        # Act
+        with patch('apps.movies.services.description_backfill_service.ThreadPoolExecutor', InlineExecutor):
+            result = self.__build_service().backfill()
+
+        # Assert
+        assert result['updated_count'] == 0
+        assert result['skipped_count'] == 1
+        movie.refresh_from_db()
+        assert movie.resume == 'Written by a user'
+
+    def test_backfill_rejects_description_over_the_resume_limit(self):
+        # Arrange
+        movie = MovieFactory(resume=None)
+        self.mock_adapter.answer.return_value = 'A' * (MovieDescriptionBackfillService.RESUME_LIMIT + 1)
+
+        # Act
+        result = self.__build_service().backfill()
+
+        # Assert
+        assert result['updated_count'] == 0
+        assert result['failed_count'] == 1
+        assert 'the limit is 500' in result['errors'][0]
+        movie.refresh_from_db()
+        assert movie.resume is None
+
+
+class TestBackfillMovieDescriptionsTask:
+    def test_task_forwards_every_service_parameter(self):
+        # Arrange
+        with patch('apps.movies.tasks.MovieDescriptionBackfillService') as mock_service:
+            mock_service.return_value.backfill.return_value = {'errors': []}
+
+            # Act
+            backfill_movie_descriptions.delay(workers=8, rate_limit=1.5, batch_size=20, limit=100)
+
+        # Assert
+        kwargs = mock_service.call_args.kwargs
+        assert {key: kwargs[key] for key in ('workers', 'rate_limit', 'batch_size', 'limit')} == {
+            'workers': 8,
+            'rate_limit': 1.5,
+            'batch_size': 20,
+            'limit': 100,
+        }
+
+    def test_task_defaults_to_the_settings_constants(self):
+        # Arrange
+        with patch('apps.movies.tasks.MovieDescriptionBackfillService') as mock_service:
+            mock_service.return_value.backfill.return_value = {'errors': []}
+
+            # Act
+            backfill_movie_descriptions.delay()
+
+        # Assert
+        kwargs = mock_service.call_args.kwargs
+        assert {key: kwargs[key] for key in ('workers', 'rate_limit', 'batch_size', 'limit')} == {
+            'workers': DESCRIPTION_BACKFILL_WORKERS,
+            'rate_limit': DESCRIPTION_BACKFILL_RATE_LIMIT,
+            'batch_size': DESCRIPTION_BACKFILL_BATCH_SIZE,
+            'limit': None,
+        }
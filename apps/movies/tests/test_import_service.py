@@ -1,12 +1,16 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from apps.actors.tests.factories import ActorFactory
 from apps.genres.tests.factories import GenreFactory
 from apps.movies.models import Movie
 from apps.movies.services.import_service import MovieImportService
+from apps.movies.services.search_service import search_service
 
 
 @pytest.fixture
@@ -65,7 +69,7 @@ class TestMovieImportService:
     def test_import_movies_valid_data(self, dataframe_file_valid):
         # Arrange
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = dataframe_file_valid.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [dataframe_file_valid.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -87,7 +91,7 @@ class TestMovieImportService:
     def test_import_movies_empty_file(self, dataframe_file_empty):
         # Arrange
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = dataframe_file_empty.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [dataframe_file_empty.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -102,7 +106,7 @@ class TestMovieImportService:
     def test_import_movies_multiple_movies(self, dataframe_file_multiple_movies):
         # Arrange
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = dataframe_file_multiple_movies.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [dataframe_file_multiple_movies.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -124,7 +128,7 @@ class TestMovieImportService:
             'resume': ['A test movie resume'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_without_title.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_without_title.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -147,7 +151,7 @@ class TestMovieImportService:
             'resume': ['A test movie resume'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_without_genre.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_without_genre.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
         # Act
         result = service.import_movies()
@@ -169,7 +173,7 @@ class TestMovieImportService:
             'resume': ['A test movie resume'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_genre_not_found.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_genre_not_found.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -192,7 +196,7 @@ class TestMovieImportService:
             'resume': ['A test movie resume'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_invalid_date_format.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_invalid_date_format.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -215,7 +219,7 @@ class TestMovieImportService:
             'resume': ['A test movie resume'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_valid_date_empty_string.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_valid_date_empty_string.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -241,7 +245,7 @@ class TestMovieImportService:
             'resume': [long_resume],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_resume_too_long.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_resume_too_long.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -264,7 +268,7 @@ class TestMovieImportService:
             'resume': [''],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_resume_empty.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_resume_empty.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -289,7 +293,7 @@ class TestMovieImportService:
             'resume': ['A test movie resume'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_actors_exist.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_actors_exist.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -316,7 +320,7 @@ class TestMovieImportService:
             'resume': ['A test movie resume'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_actors_not_exist.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_actors_not_exist.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -342,7 +346,7 @@ class TestMovieImportService:
             'resume': ['A test movie resume'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_actors_empty_string.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_actors_empty_string.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -364,7 +368,7 @@ class TestMovieImportService:
             'resume': ['A test movie resume', 'A test movie resume'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_multiple_errors.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_multiple_errors.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -388,7 +392,7 @@ class TestMovieImportService:
             'resume': ['', 'Valid resume'],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movies_mixed.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movies_mixed.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -413,7 +417,7 @@ class TestMovieImportService:
             'resume': [''],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_date_with_spaces.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_date_with_spaces.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -438,7 +442,7 @@ class TestMovieImportService:
             'resume': ['  Resume with spaces  '],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_resume_with_spaces.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_resume_with_spaces.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -463,7 +467,7 @@ class TestMovieImportService:
             'resume': [''],
         })
         mock_file_reader = MagicMock()
-        mock_file_reader.read.return_value = movie_title_with_spaces.to_dict(orient='records')
+        mock_file_reader.iter_batches.return_value = [movie_title_with_spaces.to_dict(orient='records')]
         service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
 
         # Act
@@ -477,3 +481,203 @@ class TestMovieImportService:
 
         movie = Movie.objects.first()
         assert movie.title == 'Test Movie'
+
+    def test_import_movies_query_count_does_not_grow_with_rows(self, genre, actor1, actor2):
+        # Arrange
+        movies = pd.DataFrame({
+            'title': [f'Movie {index}' for index in range(50)],
+            'genre': [genre.name] * 50,
+            'release_date': ['2020-01-01'] * 50,
+            'actors': [f'{actor1.name}, {actor2.name}'] * 50,
+            'resume': ['A test movie resume'] * 50,
+        })
+        mock_file_reader = MagicMock()
+        mock_file_reader.iter_batches.return_value = [movies.to_dict(orient='records')]
+        service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            result = service.import_movies()
+
+        # Assert
+        assert result['created_count'] == 50
+        assert Movie.objects.count() == 50
+        assert Movie.actors.through.objects.count() == 100
+        # 1 genre lookup + 1 actor lookup + savepoint/insert/insert/search vector update/release for a single batch
+        assert len(queries) <= 9
+
+    def test_import_movies_fills_search_vector(self, dataframe_file_valid, actor1):
+        # Arrange
+        mock_file_reader = MagicMock()
+        mock_file_reader.iter_batches.return_value = [dataframe_file_valid.to_dict(orient='records')]
+        service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
+
+        # Act
+        service.import_movies()
+
+        # Assert
+        movie = Movie.objects.get()
+        assert list(search_service().search(actor1.name).values_list('pk', flat=True)) == [movie.pk]
+        assert list(search_service().search('resume').values_list('pk', flat=True)) == [movie.pk]
+
+    def test_import_movies_writes_in_batches(self, genre, actor1):
+        # Arrange
+        movies = pd.DataFrame({
+            'title': [f'Movie {index}' for index in range(5)],
+            'genre': [genre.name] * 5,
+            'release_date': ['2020-01-01'] * 5,
+            'actors': [actor1.name] * 5,
+            'resume': [''] * 5,
+        })
+        mock_file_reader = MagicMock()
+        mock_file_reader.iter_batches.return_value = [movies.to_dict(orient='records')]
+        service = self.service_class(file_path='test.csv', file_reader=mock_file_reader, batch_size=2)
+
+        # Act
+        result = service.import_movies()
+
+        # Assert
+        assert result['created_count'] == 5
+        assert result['skipped_count'] == 0
+        assert Movie.objects.count() == 5
+        assert all(str(movie.actors.get().uuid) == actor1.uuid for movie in Movie.objects.all())
+
+    def test_import_movies_duplicated_actor_names_in_row(self, genre, actor1):
+        # Arrange
+        movie_duplicated_actors = pd.DataFrame({
+            'title': ['Test Movie'],
+            'genre': [genre.name],
+            'release_date': ['2020-01-01'],
+            'actors': [f'{actor1.name}, {actor1.name}'],
+            'resume': [''],
+        })
+        mock_file_reader = MagicMock()
+        mock_file_reader.iter_batches.return_value = [movie_duplicated_actors.to_dict(orient='records')]
+        service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
+
+        # Act
+        result = service.import_movies()
+
+        # Assert
+        assert result['created_count'] == 1
+        assert Movie.objects.get().actors.count() == 1
+
+    def test_import_movies_fuzzy_resolves_genre_and_actor_names(self, genre, actor1):
+        # Arrange
+        movie_misspelled_names = pd.DataFrame({
+            'title': ['Test Movie'],
+            'genre': [genre.name.upper()],
+            'release_date': ['2020-01-01'],
+            'actors': [actor1.name.lower()],
+            'resume': [''],
+        })
+        mock_file_reader = MagicMock()
+        mock_file_reader.iter_batches.return_value = [movie_misspelled_names.to_dict(orient='records')]
+        service = self.service_class(file_path='test.csv', file_reader=mock_file_reader, fuzzy=True)
+
+        # Act
+        result = service.import_movies()
+
+        # Assert
+        movie = Movie.objects.get()
+        assert result['created_count'] == 1
+        assert result['fuzzy_matches'] == {genre.name.upper(): genre.name, actor1.name.lower(): actor1.name}
+        assert movie.genre.name == genre.name
+        assert [actor.name for actor in movie.actors.all()] == [actor1.name]
+
+    def test_import_movies_without_fuzzy_keeps_exact_matching(self, genre):
+        # Arrange
+        movie_misspelled_genre = pd.DataFrame({
+            'title': ['Test Movie'],
+            'genre': [genre.name.upper()],
+            'release_date': ['2020-01-01'],
+            'actors': [''],
+            'resume': [''],
+        })
+        mock_file_reader = MagicMock()
+        mock_file_reader.iter_batches.return_value = [movie_misspelled_genre.to_dict(orient='records')]
+        service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
+
+        # Act
+        result = service.import_movies()
+
+        # Assert
+        assert result['created_count'] == 0
+        assert result['fuzzy_matches'] == {}
+        assert f'Genre "{genre.name.upper()}" not found' in result['errors'][0]
+
+    @pytest.mark.parametrize('batch_size', [0, -1])
+    def test_non_positive_batch_size_is_rejected(self, batch_size):
+        # Act / Assert
+        with pytest.raises(ValueError, match='batch_size must be a positive integer'):
+            self.service_class(file_path='test.csv', file_reader=MagicMock(), batch_size=batch_size)
+
+    def test_command_rejects_non_positive_batch_size(self):
+        # Act / Assert
+        with pytest.raises(CommandError, match='must be a positive integer'):
+            call_command('import_movies', 'test.csv', '--batch-size', '0')
+
+    def test_import_movies_resolves_names_missing_in_a_previous_batch(self, genre):
+        # Arrange
+        def iter_batches(file_path, batch_size):
+            yield [{'title': 'Movie 1', 'genre': 'Drama', 'release_date': '', 'actors': '', 'resume': ''}]
+            # Gênero cadastrado durante a importação: o nome ausente no lote anterior não pode ter ficado no cache.
+            GenreFactory(name='Drama')
+            yield [{'title': 'Movie 2', 'genre': 'Drama', 'release_date': '', 'actors': '', 'resume': ''}]
+
+        mock_file_reader = MagicMock()
+        mock_file_reader.iter_batches.side_effect = iter_batches
+        service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
+
+        # Act
+        result = service.import_movies()
+
+        # Assert
+        assert result['created_count'] == 1
+        assert result['skipped_count'] == 1
+        assert list(Movie.objects.values_list('title', flat=True)) == ['Movie 2']
+
+    def test_import_movies_name_cache_is_bounded(self, genre, actor1, actor2):
+        # Arrange
+        rows = {'genre': genre.name, 'release_date': '', 'actors': f'{actor1.name}, {actor2.name}', 'resume': ''}
+        mock_file_reader = MagicMock()
+        mock_file_reader.iter_batches.return_value = [[{'title': 'Movie 1', **rows}], [{'title': 'Movie 2', **rows}]]
+        service = self.service_class(file_path='test.csv', file_reader=mock_file_reader)
+
+        # Act
+        with patch('apps.movies.services.import_service.IMPORT_NAME_CACHE_LIMIT', 1):
+            with CaptureQueriesContext(connection) as queries:
+                result = service.import_movies()
+
+        # Assert
+        assert result['created_count'] == 2
+        assert all(movie.actors.count() == 2 for movie in Movie.objects.all())
+        # No segundo lote o gênero vem do cache; só um dos dois atores coube no cache e o outro é consultado de novo.
+        actor_lookups = [query['sql'] for query in queries if query['sql'].startswith('SELECT') and 'FROM "actors_actor"' in query['sql']]
+        genre_lookups = [query['sql'] for query in queries if query['sql'].startswith('SELECT') and 'FROM "genres_genre"' in query['sql']]
+        assert len(genre_lookups) == 1
+        assert len(actor_lookups) == 2
+
+
+@pytest.mark.django_db(transaction=True)
+class TestMovieImportServiceTransactions:
+    def test_import_movies_commits_each_batch(self):
+        # Arrange
+        genre = GenreFactory(name='Action')
+        committed_titles = []
+
+        def iter_batches(file_path, batch_size):
+            yield [{'title': 'Movie 1', 'genre': genre.name, 'release_date': '', 'actors': '', 'resume': ''}]
+            # O lote anterior já foi confirmado: nenhuma transação fica aberta entre os lotes.
+            committed_titles.append((connection.in_atomic_block, list(Movie.objects.values_list('title', flat=True))))
+            yield [{'title': 'Movie 2', 'genre': genre.name, 'release_date': '', 'actors': '', 'resume': ''}]
+
+        mock_file_reader = MagicMock()
+        mock_file_reader.iter_batches.side_effect = iter_batches
+
+        # Act
+        result = MovieImportService(file_path='test.csv', file_reader=mock_file_reader).import_movies()
+
+        # Assert
+        assert result['created_count'] == 2
+        assert committed_titles == [(False, ['Movie 1'])]
@@ -2,6 +2,7 @@ import pytest
 from django.db import DataError, IntegrityError
 
 from apps.movies.models import Movie
+from apps.movies.services.rating_service import rating_service
 from apps.movies.tests.factories import DEFAULT_ACTORS_COUNT, MovieFactory
 
 
@@ -53,3 +54,17 @@ class TestModelMovie:
 
             actor_movies = list(map(str, actor_movies_uuids))
             assert movie.uuid in actor_movies, f"Movie {movie} not found in actor's movies"
+
+    def test_movie_save_keeps_rating_written_after_the_fetch(self):
+        # Arrange
+        movie = Movie.objects.get(pk=MovieFactory().pk)
+        rating_service().apply_review_change(previous=None, current=(movie.pk, 4))
+
+        # Act
+        movie.title = 'Edited title'
+        movie.save()
+
+        # Assert
+        movie.refresh_from_db()
+        assert movie.title == 'Edited title'
+        assert (movie.review_count, movie.stars_sum, movie.average_stars) == (1, 4, 4.0)
@@ -0,0 +1,83 @@
+import pytest
+
+from apps.movies.services.rating_service import MovieRatingService
+from apps.movies.tests.factories import MovieFactory
+from apps.reviews.models import Review
+from apps.reviews.tests.factories import ReviewFactory
+
+
+@pytest.mark.django_db
+class TestMovieRatingService:
+    def setup_method(self):
+        self.service = MovieRatingService()
+
+    def test_review_create_updates_movie_aggregates(self):
+        movie = MovieFactory()
+
+        ReviewFactory(movie=movie, stars=4)
+        ReviewFactory(movie=movie, stars=5)
+
+        movie.refresh_from_db()
+        assert movie.review_count == 2
+        assert movie.stars_sum == 9
+        assert movie.average_stars == 4.5
+
+    def test_review_update_applies_stars_difference(self):
+        movie = MovieFactory()
+        review = ReviewFactory(movie=movie, stars=1)
+        ReviewFactory(movie=movie, stars=3)
+
+        review.stars = 5
+        review.save()
+
+        movie.refresh_from_db()
+        assert movie.review_count == 2
+        assert movie.stars_sum == 8
+        assert movie.average_stars == 4.0
+
+    def test_review_moved_to_another_movie(self):
+        old_movie = MovieFactory()
+        new_movie = MovieFactory()
+        review = ReviewFactory(movie=old_movie, stars=2)
+
+        review.movie = new_movie
+        review.save()
+
+        old_movie.refresh_from_db()
+        new_movie.refresh_from_db()
+        assert old_movie.review_count == 0
+        assert old_movie.stars_sum == 0
+        assert old_movie.average_stars is None
+        assert new_movie.review_count == 1
+        assert new_movie.stars_sum == 2
+        assert new_movie.average_stars == 2.0
+
+    def test_review_delete_updates_movie_aggregates(self):
+        movie = MovieFactory()
+        review = ReviewFactory(movie=movie, stars=5)
+        ReviewFactory(movie=movie, stars=1)
+
+        review.delete()
+
+        movie.refresh_from_db()
+        assert movie.review_count == 1
+        assert movie.stars_sum == 1
+        assert movie.average_stars == 1.0
+
+    def test_rebuild_recomputes_aggregates_from_reviews(self):
+        movie = MovieFactory()
+        movie_without_reviews = MovieFactory()
+        ReviewFactory(movie=movie, stars=3)
+        ReviewFactory(movie=movie, stars=4)
+        # Bulk updates bypass Review.save and leave the aggregates stale.
+        Review.objects.filter(movie=movie).update(stars=5)
+
+        self.service.rebuild()
+
+        movie.refresh_from_db()
+        movie_without_reviews.refresh_from_db()
+        assert movie.review_count == 2
+        assert movie.stars_sum == 10
+        assert movie.average_stars == 5.0
+        assert movie_without_reviews.review_count == 0
+        assert movie_without_reviews.average_stars is None
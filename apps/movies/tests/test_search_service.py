@@ -0,0 +1,108 @@
+import pytest
+
+from apps.actors.tests.factories import ActorFactory
+from apps.movies.models import Movie
+from apps.movies.services.search_service import MovieSearchService
+from apps.movies.tests.factories import MovieFactory
+
+
+@pytest.mark.django_db
+class TestMovieSearchService:
+    def setup_method(self):
+        self.service = MovieSearchService()
+
+    def __search_titles(self, text: str) -> list[str]:
+        return list(self.service.search(text).order_by('-rank', 'uuid').values_list('title', flat=True))
+
+    def test_search_matches_title_resume_and_actor_names(self):
+        # Arrange
+        MovieFactory(title='Cidade de Deus', resume='Dois jovens crescem na favela.', actors=[ActorFactory(name='Alexandre Rodrigues')])
+        MovieFactory(title='Matrix', resume='Um programador descobre a simulação.', actors=[ActorFactory(name='Keanu Reeves')])
+
+        # Act / Assert
+        assert self.__search_titles('cidade') == ['Cidade de Deus']
+        assert self.__search_titles('programador') == ['Matrix']
+        assert self.__search_titles('keanu') == ['Matrix']
+
+    def test_search_ranks_title_above_resume_above_actors(self):
+        # Arrange
+        MovieFactory(title='Ainda Estou Aqui', resume='Uma família no Rio.', actors=[ActorFactory(name='Selton Mello')])
+        MovieFactory(title='O Auto da Compadecida', resume='Chicó e João Grilo enganam todos.', actors=[ActorFactory(name='Matheus Nachtergaele')])
+        MovieFactory(title='Selton', resume='Um documentário.')
+        MovieFactory(title='O Palhaço', resume='Selton vive um palhaço de circo.')
+
+        # Act / Assert
+        assert self.__search_titles('selton') == ['Selton', 'O Palhaço', 'Ainda Estou Aqui']
+
+    def test_search_uses_web_search_syntax(self):
+        # Arrange
+        MovieFactory(title='O Poderoso Chefão', resume='A família Corleone.')
+        MovieFactory(title='O Poderoso Chefão II', resume='A juventude de Vito Corleone.')
+
+        # Act / Assert
+        assert self.__search_titles('corleone -juventude') == ['O Poderoso Chefão']
+        assert self.__search_titles('"família corleone"') == ['O Poderoso Chefão']
+
+    def test_save_refreshes_search_vector(self):
+        # Arrange
+        movie = MovieFactory(title='Título antigo', resume='')
+
+        # Act
+        movie.title = 'Central do Brasil'
+        movie.save()
+
+        # Assert
+        assert self.__search_titles('central') == ['Central do Brasil']
+        assert self.__search_titles('antigo') == []
+
+    def test_save_without_search_fields_does_not_refresh(self, django_assert_num_queries):
+        # Arrange
+        movie = MovieFactory()
+
+        # Act / Assert
+        with django_assert_num_queries(1):
+            movie.save(update_fields=['updated_at'])
+
+    def test_actors_changes_refresh_search_vector(self):
+        # Arrange
+        actor = ActorFactory(name='Wagner Moura')
+        movie = MovieFactory(title='Tropa de Elite', actors=[])
+
+        # Act / Assert
+        movie.actors.add(actor)
+        assert self.__search_titles('moura') == ['Tropa de Elite']
+
+        movie.actors.remove(actor)
+        assert self.__search_titles('moura') == []
+
+        actor.movies.add(movie)
+        assert self.__search_titles('moura') == ['Tropa de Elite']
+
+        actor.movies.clear()
+        assert self.__search_titles('moura') == []
+
+    def test_actor_rename_and_delete_refresh_search_vector(self):
+        # Arrange
+        actor = ActorFactory(name='Fernanda Montenegro')
+        MovieFactory(title='Central do Brasil', actors=[actor])
+
+        # Act / Assert
+        actor.name = 'Fernanda Torres'
+        actor.save()
+        assert self.__search_titles('torres') == ['Central do Brasil']
+        assert self.__search_titles('montenegro') == []
+
+        actor.delete()
+        assert self.__search_titles('torres') == []
+
+    def test_rebuild_fills_every_movie(self):
+        # Arrange
+        MovieFactory.create_batch(3)
+        Movie.objects.update(search_vector=None)
+
+        # Act
+        updated_count = self.service.rebuild()
+
+        # Assert
+        assert updated_count == 3
+        assert not Movie.objects.filter(search_vector__isnull=True).exists()
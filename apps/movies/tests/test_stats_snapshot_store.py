@@ -0,0 +1,107 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.cache import cache
+
+from apps.movies.services.stats_snapshot_store import MovieStatsSnapshotStore, movie_stats_snapshot_store
+from apps.reviews.tests.factories import ReviewFactory
+
+
+@pytest.mark.django_db
+class TestMovieStatsSnapshotStore:
+    def setup_method(self):
+        cache.delete(MovieStatsSnapshotStore.VERSION_KEY)
+        self.store = MovieStatsSnapshotStore()
+        self.builder = MagicMock(side_effect=lambda: {'total_movies': self.builder.call_count})
+
+    def test_snapshot_is_reused_within_ttl(self, settings):
+        settings.MOVIE_STATS_SNAPSHOT_TTL = 60
+
+        first = self.store.get(builder=self.builder)
+        second = self.store.get(builder=self.builder)
+
+        assert first == second == {'total_movies': 1}
+        self.builder.assert_called_once()
+
+    def test_snapshot_is_shared_between_processes(self, settings):
+        settings.MOVIE_STATS_SNAPSHOT_TTL = 60
+        other_process_store = MovieStatsSnapshotStore()
+
+        self.store.get(builder=self.builder)
+        data = other_process_store.get(builder=self.builder)
+
+        assert data == {'total_movies': 1}
+        self.builder.assert_called_once()
+
+    def test_invalidate_drops_snapshot_of_every_process(self, settings):
+        settings.MOVIE_STATS_SNAPSHOT_TTL = 60
+        other_process_store = MovieStatsSnapshotStore()
+        other_process_store.get(builder=self.builder)
+
+        self.store.invalidate()
+        data = other_process_store.get(builder=self.builder)
+
+        assert data == {'total_movies': 2}
+
+    def test_snapshot_is_rebuilt_after_ttl(self, settings):
+        settings.MOVIE_STATS_SNAPSHOT_TTL = 60
+
+        with patch('django.core.cache.backends.locmem.time.time', return_value=0.0) as now:
+            self.store.get(builder=self.builder)
+            now.return_value = 61.0
+            data = self.store.get(builder=self.builder)
+
+        assert self.builder.call_count == 2
+        assert data == {'total_movies': 2}
+
+    def test_rebuild_racing_an_invalidation_does_not_publish_stale_stats(self, settings):
+        settings.MOVIE_STATS_SNAPSHOT_TTL = 60
+
+        def build_while_a_write_commits():
+            # A escrita é confirmada (e o snapshot invalidado) enquanto as estatísticas antigas são calculadas.
+            self.store.invalidate()
+            return {'total_movies': 'stale'}
+
+        self.store.get(builder=build_while_a_write_commits)
+        data = self.store.get(builder=self.builder)
+
+        assert data == {'total_movies': 1}
+
+    def test_invalidate_without_version_key_starts_a_new_version(self, settings):
+        settings.MOVIE_STATS_SNAPSHOT_TTL = 60
+        self.store.get(builder=self.builder)
+        cache.delete(MovieStatsSnapshotStore.VERSION_KEY)
+
+        self.store.invalidate()
+        data = self.store.get(builder=self.builder)
+
+        assert data == {'total_movies': 2}
+
+    def test_snapshot_disabled_when_ttl_is_zero(self, settings):
+        settings.MOVIE_STATS_SNAPSHOT_TTL = 0
+
+        self.store.get(builder=self.builder)
+        self.store.get(builder=self.builder)
+
+        assert self.builder.call_count == 2
+
+    def test_invalidate_drops_snapshot(self, settings):
+        settings.MOVIE_STATS_SNAPSHOT_TTL = 60
+
+        self.store.get(builder=self.builder)
+        self.store.invalidate()
+        self.store.get(builder=self.builder)
+
+        assert self.builder.call_count == 2
+
+    def test_review_write_invalidates_snapshot_on_commit(self, settings, django_capture_on_commit_callbacks):
+        settings.MOVIE_STATS_SNAPSHOT_TTL = 60
+        movie_stats_snapshot_store.get(builder=self.builder)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            ReviewFactory()
+
+        movie_stats_snapshot_store.get(builder=self.builder)
+        movie_stats_snapshot_store.invalidate()
+
+        assert self.builder.call_count == 2
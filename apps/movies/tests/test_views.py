@@ -2,12 +2,19 @@ import uuid
 from unittest.mock import patch
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 
 from app.tests import BaseAPITest
+from apps.actors.models import Actor
+from apps.actors.tests.factories import ActorFactory
 from apps.movies.models import Movie
+from apps.movies.services.rating_service import rating_service
 from apps.movies.tests.factories import MovieFactory
+from apps.movies.views import MovieRetrieveUpdateDestroyView
+from apps.reviews.tests.factories import ReviewFactory
 
 
 @pytest.fixture
@@ -43,6 +50,97 @@ class TestMoviesAPI(BaseAPITest):
         in the database'
         )
 
+    def test_list_movies_query_count_does_not_grow_with_page_size(self):
+        self.give_permissions(model=Movie)
+        url = reverse('movie-create-list')
+
+        for movie in MovieFactory.create_batch(2):
+            ReviewFactory(movie=movie)
+        # Warm up the user's permission cache so both requests are measured the same way
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as small_page_queries:
+            response = self.client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+
+        for movie in MovieFactory.create_batch(8):
+            ReviewFactory.create_batch(2, movie=movie)
+
+        with CaptureQueriesContext(connection) as full_page_queries:
+            response = self.client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 10
+
+        assert len(full_page_queries) == len(small_page_queries), (
+            f'Expected a constant number of queries, got {len(small_page_queries)} for 2 movies and {len(full_page_queries)} for 10 movies'
+        )
+
+    def test_list_movies_returns_rate_from_annotation(self):
+        self.give_permissions(model=Movie)
+        movie = MovieFactory()
+        ReviewFactory(movie=movie, stars=4)
+        ReviewFactory(movie=movie, stars=5)
+
+        url = reverse('movie-create-list')
+        response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0]['rate'] == 4.5
+
+    def test_list_movies_cursor_pagination_walks_all_pages(self):
+        self.give_permissions(model=Movie)
+        for index in range(25):
+            MovieFactory(title=f'Movie {index % 7}')
+
+        url = reverse('movie-create-list')
+        response = self.client.get(url, {'pagination': 'cursor'})
+
+        seen_uuids = []
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            assert 'count' not in response.data, 'Cursor pagination must not count the queryset'
+            seen_uuids.extend(movie['uuid'] for movie in response.data['results'])
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+
+        expected_uuids = [str(uuid_) for uuid_ in Movie.objects.order_by('title', 'uuid').values_list('uuid', flat=True)]
+        assert seen_uuids == expected_uuids
+
+    def test_list_movies_cursor_pagination_previous_link(self):
+        self.give_permissions(model=Movie)
+        MovieFactory.create_batch(15)
+
+        url = reverse('movie-create-list')
+        first_page = self.client.get(url, {'pagination': 'cursor'})
+        assert first_page.data['previous'] is None
+
+        second_page = self.client.get(first_page.data['next'])
+        assert len(second_page.data['results']) == 5
+        assert second_page.data['next'] is None
+
+        previous_page = self.client.get(second_page.data['previous'])
+        assert [movie['uuid'] for movie in previous_page.data['results']] == [movie['uuid'] for movie in first_page.data['results']]
+
+    def test_list_movies_cursor_pagination_does_not_count(self):
+        self.give_permissions(model=Movie)
+        MovieFactory.create_batch(3)
+
+        url = reverse('movie-create-list')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {'pagination': 'cursor'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not [query for query in queries if 'COUNT(*)' in query['sql']]
+
+    def test_list_movies_invalid_cursor(self):
+        self.give_permissions(model=Movie)
+
+        url = reverse('movie-create-list')
+        response = self.client.get(url, {'cursor': 'not-a-cursor'})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     def test_list_movies_without_permissions(self):
         url = reverse('movie-create-list')
         response = self.client.get(url)
@@ -82,26 +180,33 @@ class TestMoviesAPI(BaseAPITest):
         assert response.status_code == status.HTTP_401_UNAUTHORIZED, f'Expected 401 Unauthorized for unauthenticated user, got {response.status_code}'
         assert not Movie.objects.filter(title=movie_data['title']).exists(), 'Movie should not be created in the database'
 
-    def test_create_movie_with_ai_description_generates_resume(self, movie_data):
+    def test_create_movie_with_ai_description_enqueues_job(self, movie_data, django_capture_on_commit_callbacks):
         self.give_permissions(model=Movie)
         expected_description = 'AI generated resume'
 
         url = reverse('movie-create-list')
-        with patch(
-            'apps.movies.views.MovieSuggestorDescriptionMixin.suggest_description',
-            return_value=expected_description,
-        ) as mock_suggest_description:
+        with patch('apps.movies.tasks.get_ai_adapter') as mock_get_ai_adapter:
+            mock_get_ai_adapter.return_value.answer.return_value = expected_description
             payload = movie_data.copy()
             payload['ai_description'] = True
-            response = self.client.post(url, payload)
+            with django_capture_on_commit_callbacks() as callbacks:
+                response = self.client.post(url, payload)
 
-        assert response.status_code == status.HTTP_201_CREATED
-        mock_suggest_description.assert_called_once()
+            assert response.status_code == status.HTTP_201_CREATED
+            assert response.data['description_job']['status'] == 'PENDING'
+            mock_get_ai_adapter.return_value.answer.assert_not_called()
+
+            for callback in callbacks:
+                callback()
 
         created_movie = Movie.objects.get(title=movie_data['title'])
-        created_movie.refresh_from_db()
         assert created_movie.resume == expected_description
-        assert response.data['description'] == expected_description
+
+        job_response = self.client.get(response.data['description_job']['status_url'])
+        assert job_response.status_code == status.HTTP_200_OK
+        assert job_response.data['id'] == response.data['description_job']['id']
+        assert job_response.data['status'] == 'SUCCESS'
+        assert job_response.data['description'] == expected_description
 
     def test_retrieve_movie_success(self, existing_movie):
         self.give_permissions(model=Movie)
@@ -113,6 +218,25 @@ class TestMoviesAPI(BaseAPITest):
         assert response.status_code == status.HTTP_200_OK, f'Expected 200 OK, got {response.status_code}'
         assert response.data['title'] == existing_movie.title, 'Response data should match the retrieved movie data'
 
+    def test_retrieve_movie_query_count_does_not_grow_with_actors(self, existing_movie):
+        self.give_permissions(model=Movie)
+        url = reverse('movie-detail-view', kwargs={'pk': existing_movie.uuid})
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as few_actors_queries:
+            self.client.get(url)
+
+        crowded_movie = MovieFactory(actors=[ActorFactory() for _ in range(10)])
+        ReviewFactory.create_batch(3, movie=crowded_movie)
+        url = reverse('movie-detail-view', kwargs={'pk': crowded_movie.uuid})
+
+        with CaptureQueriesContext(connection) as many_actors_queries:
+            response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['actors']) == 10
+        assert len(many_actors_queries) == len(few_actors_queries)
+
     def test_retrieve_movie_not_found(self):
         self.give_permissions(model=Movie)
 
@@ -133,6 +257,26 @@ class TestMoviesAPI(BaseAPITest):
         assert response.status_code == status.HTTP_200_OK, f'Expected 200 OK, got {response.status_code}'
         assert movie.title == updated_data['title'], 'Movie title should be updated in the database'
 
+    def test_update_movie_keeps_review_written_during_the_request(self, existing_movie):
+        # Arrange
+        self.give_permissions(model=Movie)
+        perform_update = MovieRetrieveUpdateDestroyView.perform_update
+
+        def perform_update_with_concurrent_review(view, serializer):
+            # Review gravada depois que a view carregou o filme e antes do save.
+            rating_service().apply_review_change(previous=None, current=(existing_movie.pk, 5))
+            perform_update(view, serializer)
+
+        # Act
+        url = reverse('movie-detail-view', kwargs={'pk': existing_movie.uuid})
+        with patch.object(MovieRetrieveUpdateDestroyView, 'perform_update', perform_update_with_concurrent_review):
+            response = self.client.patch(url, {'title': 'Updated Title'})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        movie = Movie.objects.get(pk=existing_movie.pk)
+        assert (movie.title, movie.review_count, movie.average_stars) == ('Updated Title', 1, 5.0)
+
     def test_update_movie_not_found(self):
         self.give_permissions(model=Movie)
 
@@ -163,23 +307,44 @@ class TestMoviesAPI(BaseAPITest):
         movie.refresh_from_db()
         assert movie.title == existing_movie.title, 'Movie title should not be updated in the database'
 
-    def test_update_movie_with_ai_description_overwrites_resume(self, existing_movie):
+    def test_update_movie_with_ai_description_enqueues_job(self, existing_movie, django_capture_on_commit_callbacks):
         self.give_permissions(model=Movie)
         expected_description = 'Updated by AI'
 
         url = reverse('movie-detail-view', kwargs={'pk': existing_movie.uuid})
-        with patch(
-            'apps.movies.views.MovieSuggestorDescriptionMixin.suggest_description',
-            return_value=expected_description,
-        ) as mock_suggest_description:
-            response = self.client.patch(url, {'ai_description': True})
+        with patch('apps.movies.tasks.get_ai_adapter') as mock_get_ai_adapter:
+            mock_get_ai_adapter.return_value.answer.return_value = expected_description
+            with django_capture_on_commit_callbacks(execute=True):
+                response = self.client.patch(url, {'ai_description': True})
 
         assert response.status_code == status.HTTP_200_OK
-        mock_suggest_description.assert_called_once()
+        assert 'id' in response.data['description_job']
+        mock_get_ai_adapter.return_value.answer.assert_called_once()
 
         existing_movie.refresh_from_db()
         assert existing_movie.resume == expected_description
-        assert response.data['resume'] == expected_description
+
+    def test_description_job_reports_failure(self):
+        self.give_permissions(model=Movie)
+        job_id = uuid.uuid4()
+
+        url = reverse('movie-description-job-view', kwargs={'job_id': job_id})
+        with patch('apps.movies.views.generate_movie_description.AsyncResult') as mock_async_result:
+            mock_async_result.return_value.status = 'FAILURE'
+            mock_async_result.return_value.successful.return_value = False
+            mock_async_result.return_value.failed.return_value = True
+            mock_async_result.return_value.result = Exception('AI provider unavailable')
+            response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {'id': str(job_id), 'status': 'FAILURE', 'error': 'The description could not be generated.'}
+        mock_async_result.assert_called_once_with(str(job_id))
+
+    def test_description_job_without_permissions(self):
+        url = reverse('movie-description-job-view', kwargs={'job_id': uuid.uuid4()})
+        response = self.client.get(url)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_delete_movie_success(self, existing_movie):
         self.give_permissions(model=Movie)
@@ -216,6 +381,207 @@ class TestMoviesAPI(BaseAPITest):
         assert Movie.objects.filter(uuid=movie.uuid).exists(), 'Movie should not be deleted from the database'
 
 
+@pytest.mark.django_db
+class TestMovieSearchAPI(BaseAPITest):
+    def test_search_movies_ranked_by_relevance(self):
+        self.give_permissions(model=Movie)
+        MovieFactory(title='Um capitão', resume='A rotina do BOPE no Rio.')
+        MovieFactory(title='Tropa de Elite', resume='A rotina de um capitão do BOPE.')
+        MovieFactory(title='Matrix', resume='Um programador descobre a simulação.')
+
+        url = reverse('movie-search-view')
+        response = self.client.get(url, {'q': 'capitão'})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert 'count' not in response.data, 'Search uses cursor pagination and must not count the matches'
+        assert [movie['title'] for movie in response.data['results']] == ['Um capitão', 'Tropa de Elite']
+
+    def test_search_movies_cursor_pagination_walks_all_matches(self):
+        self.give_permissions(model=Movie)
+        for index in range(23):
+            MovieFactory(title=f'Favela {index}' if index % 3 else f'Filme {index}', resume='Uma história na favela.')
+        MovieFactory(title='Matrix', resume='Um programador descobre a simulação.')
+
+        url = reverse('movie-search-view')
+        response = self.client.get(url, {'q': 'favela'})
+
+        seen_uuids = []
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            seen_uuids.extend(movie['uuid'] for movie in response.data['results'])
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+
+        assert len(seen_uuids) == 23
+        assert len(set(seen_uuids)) == 23
+
+    def test_search_movies_query_is_required(self):
+        self.give_permissions(model=Movie)
+
+        url = reverse('movie-search-view')
+        response = self.client.get(url, {'q': '  '})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'q' in response.data
+
+    def test_search_movies_without_permissions(self):
+        url = reverse('movie-search-view')
+        response = self.client.get(url, {'q': 'matrix'})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_search_movies_user_not_authenticated(self):
+        self.client.logout()
+
+        url = reverse('movie-search-view')
+        response = self.client.get(url, {'q': 'matrix'})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestMovieListFiltersAPI(BaseAPITest):
+    def setup_method(self):
+        super().setup_method()
+        self.give_permissions(model=Movie)
+        self.url = reverse('movie-create-list')
+
+    def test_filter_movies_by_genre(self):
+        # Arrange
+        movie = MovieFactory(title='Tropa de Elite')
+        MovieFactory(title='Matrix')
+
+        # Act
+        response = self.client.get(self.url, {'genre': movie.genre_id})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert [movie['title'] for movie in response.data['results']] == ['Tropa de Elite']
+
+    def test_filter_movies_by_actor_keeps_the_whole_cast(self):
+        # Arrange
+        actor = ActorFactory()
+        MovieFactory(title='Tropa de Elite', actors=[actor, ActorFactory()])
+        MovieFactory(title='Tropa de Elite 2', actors=[actor])
+        MovieFactory(title='Matrix')
+
+        # Act
+        response = self.client.get(self.url, {'actor': actor.uuid})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 2
+        assert [movie['title'] for movie in response.data['results']] == ['Tropa de Elite', 'Tropa de Elite 2']
+        assert len(response.data['results'][0]['actors']) == 2
+
+    def test_filter_movies_by_release_year_range_includes_both_years(self):
+        # Arrange
+        MovieFactory(title='Cidade de Deus', release_date='2002-08-30')
+        MovieFactory(title='Tropa de Elite', release_date='2007-10-05')
+        MovieFactory(title='Tropa de Elite 2', release_date='2010-12-31')
+        MovieFactory(title='Bacurau', release_date='2019-08-29')
+
+        # Act
+        response = self.client.get(self.url, {'min_release_year': 2007, 'max_release_year': 2010})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert [movie['title'] for movie in response.data['results']] == ['Tropa de Elite', 'Tropa de Elite 2']
+
+    def test_filter_movies_by_min_rate_skips_unrated_movies(self):
+        # Arrange
+        for title, average_stars in (('Bacurau', 4.5), ('Matrix', 4.0), ('Tropa de Elite', 3.9), ('Cidade de Deus', None)):
+            Movie.objects.filter(pk=MovieFactory(title=title).pk).update(average_stars=average_stars)
+
+        # Act
+        response = self.client.get(self.url, {'min_rate': 4})
+
+        # Assert
+        assert response.status_code == status.HTTP_200_OK
+        assert [movie['title'] for movie in response.data['results']] == ['Bacurau', 'Matrix']
+
+    def test_combined_filters_with_cursor_pagination_walk_all_matches_in_order(self):
+        # Arrange
+        actor = ActorFactory()
+        genre = MovieFactory(title='Outro gênero', actors=[actor], release_date='2005-01-01').genre
+        for index in range(13):
+            MovieFactory(title=f'Filme {index % 4}', genre=genre, actors=[actor], release_date=f'200{index % 10}-06-01')
+        MovieFactory(title='Sem o ator', genre=genre, release_date='2005-01-01')
+        filters = {'genre': genre.uuid, 'actor': actor.uuid, 'min_release_year': 2002}
+
+        # Act
+        response = self.client.get(self.url, {**filters, 'pagination': 'cursor', 'page_size': 3})
+        seen_titles = []
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            seen_titles.extend(movie['title'] for movie in response.data['results'])
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+
+        # Assert
+        expected = Movie.objects.filter(genre=genre, actors=actor, release_date__year__gte=2002).order_by('title', 'uuid')
+        assert len(seen_titles) == 10
+        assert seen_titles == [movie.title for movie in expected]
+
+    @pytest.mark.parametrize(
+        'params',
+        [
+            {'genre': 'not-a-uuid'},
+            {'min_rate': 6},
+            {'min_release_year': 2010, 'max_release_year': 2000},
+        ],
+    )
+    def test_invalid_filters(self, params):
+        # Act
+        response = self.client.get(self.url, params)
+
+        # Assert
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert set(response.data) & set(params)
+
+    @pytest.mark.parametrize(
+        ('filter_name', 'index_name'),
+        [
+            ('genre', 'movie_genre_title_uuid_idx'),
+            ('actor', 'movies_movie_actors_actor_id_'),
+            ('min_release_year', 'movie_release_date_idx'),
+            ('max_release_year', 'movie_release_date_idx'),
+            ('min_rate', 'movie_average_stars_idx'),
+        ],
+    )
+    def test_each_filter_uses_an_index(self, filter_name, index_name):
+        # Arrange
+        movie = MovieFactory(release_date='2010-01-01')
+        # Elenco grande: um ator é uma fração pequena de movies_movie_actors, como na tabela cheia.
+        movie.actors.add(*Actor.objects.bulk_create([Actor(name=f'Actor {index}') for index in range(500)]))
+        values = {
+            'genre': movie.genre_id,
+            'actor': movie.actors.first().uuid,
+            'min_release_year': 2000,
+            'max_release_year': 2020,
+            'min_rate': 4,
+        }
+
+        # Act
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {filter_name: values[filter_name]})
+        assert response.status_code == status.HTTP_200_OK
+
+        # Um punhado de linhas cabe em uma página: sem enable_seqscan o planejador mostra o índice que usaria na tabela cheia.
+        # O ANALYZE troca as estatísticas deixadas pelos testes anteriores (desfeitos) pelas das linhas deste teste.
+        count_sql = next(query['sql'] for query in queries if query['sql'].startswith('SELECT COUNT(*)') and '"movies_movie"' in query['sql'])
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE movies_movie, movies_movie_actors')
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute(f'EXPLAIN {count_sql}')
+            plan = '\n'.join(row[0] for row in cursor.fetchall())
+
+        # Assert
+        assert index_name in plan, plan
+
+
 @pytest.mark.django_db
 class TestMovieStatsAPI(BaseAPITest):
     def test_movie_stats_success(self):
@@ -13,6 +13,11 @@ urlpatterns = [
         views.MovieRetrieveUpdateDestroyView.as_view(),
         name='movie-detail-view',
     ),
+    path(
+        'movies/search/',
+        views.MovieSearchView.as_view(),
+        name='movie-search-view',
+    ),
     path(
         'movies/stats/',
         views.MovieStatsView.as_view(),
@@ -23,4 +28,9 @@ urlpatterns = [
         views.MovieSuggestorDescriptionView.as_view(),
         name='movie-suggestor-description-view',
     ),
+    path(
+        'movies/suggest-description/jobs/<uuid:job_id>/',
+        views.MovieDescriptionJobView.as_view(),
+        name='movie-description-job-view',
+    ),
 ]
@@ -2,28 +2,40 @@ from rest_framework import generics, response, status, views
 from rest_framework.permissions import IsAuthenticated
 
 from app.decorators import log_request
+from app.pagination import KeysetPagination
 from app.permissions import GlobalDefaultPermission
-from apps.core.adapters.ai_adapters.open_ai_adapter import OpenAIAdapter
+from app.settings import logger
+from apps.core.adapters.ai_adapters.factory import get_ai_adapter
 from apps.movies.models import Movie
 from apps.movies.serializers import (
     MovieDescriptionSerializer,
     MovieListDetailSerializer,
     MovieModelSerializer,
+    MovieSearchSerializer,
     MovieStatsSerializer,
 )
 
+from .mixins.movie_description_job_mixin import MovieDescriptionJobMixin
+from .mixins.movie_list_detail_queryset_mixin import MovieListDetailQuerysetMixin
+from .mixins.movie_list_filter_queryset_mixin import MovieListFilterQuerysetMixin
 from .mixins.movie_suggestor_description_mixin import MovieSuggestorDescriptionMixin
+from .services.search_service import search_service
 from .services.stats_service import stats_service
+from .services.stats_snapshot_store import movie_stats_snapshot_store
+from .tasks import generate_movie_description
 
 
 class BaseMovieAI:
-    ai_adapter = OpenAIAdapter()
+    @property
+    def ai_adapter(self):
+        return get_ai_adapter()
 
 
 class MovieCreateListView(
+    MovieListFilterQuerysetMixin,
+    MovieListDetailQuerysetMixin,
     generics.ListCreateAPIView,
-    MovieSuggestorDescriptionMixin,
-    BaseMovieAI,
+    MovieDescriptionJobMixin,
 ):
     created_instance = None
     permission_classes = (
@@ -49,17 +61,16 @@ class MovieCreateListView(
         response = super().create(request, *args, **kwargs)
         movie = self.created_instance
         if request.data.get('ai_description', False) and movie:
-            description = self.suggest_description(movie)
-            self.apply_description(movie, description)
-            response.data['description'] = description
+            job_id = self.enqueue_description(movie)
+            response.data['description_job'] = self.build_description_job_data(job_id)
 
         return response
 
 
 class MovieRetrieveUpdateDestroyView(
+    MovieListDetailQuerysetMixin,
     generics.RetrieveUpdateDestroyAPIView,
-    MovieSuggestorDescriptionMixin,
-    BaseMovieAI,
+    MovieDescriptionJobMixin,
 ):
     updated_instance = None
     permission_classes = (
@@ -86,9 +97,8 @@ class MovieRetrieveUpdateDestroyView(
         movie = self.updated_instance or self.get_object()
 
         if request.data.get('ai_description', False):
-            description = self.suggest_description(movie)
-            self.apply_description(movie, description)
-            response.data['resume'] = description
+            job_id = self.enqueue_description(movie)
+            response.data['description_job'] = self.build_description_job_data(job_id)
 
         return response
 
@@ -97,6 +107,28 @@ class MovieRetrieveUpdateDestroyView(
         return super().destroy(request, *args, **kwargs)
 
 
+class MovieSearchView(MovieListDetailQuerysetMixin, generics.ListAPIView):
+    permission_classes = (
+        IsAuthenticated,
+        GlobalDefaultPermission,
+    )
+    queryset = Movie.objects.all()
+    serializer_class = MovieListDetailSerializer
+    # Resultados por relevância; o cursor guarda (rank, uuid) do último filme da página.
+    pagination_class = KeysetPagination
+    keyset_ordering = ('-rank', 'uuid')
+
+    def get_queryset(self):
+        serializer = MovieSearchSerializer(data=self.request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        return search_service().search(serializer.validated_data['q'], queryset=super().get_queryset())
+
+    @log_request
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+
 class MovieStatsView(views.APIView):
     permission_classes = (
         IsAuthenticated,
@@ -105,8 +137,7 @@ class MovieStatsView(views.APIView):
     pagination_class = None  # Disable pagination for stats endpoint
     queryset = Movie.objects.all()
 
-    @log_request
-    def get(self, request):
+    def __build_stats(self) -> dict:
         service = stats_service(queryset=self.queryset)
 
         data = service.build_data()
@@ -114,7 +145,13 @@ class MovieStatsView(views.APIView):
         serializer = MovieStatsSerializer(data=data)
         serializer.is_valid(raise_exception=True)
 
-        return response.Response(data=serializer.validated_data, status=status.HTTP_200_OK)
+        return serializer.validated_data
+
+    @log_request
+    def get(self, request):
+        data = movie_stats_snapshot_store.get(builder=self.__build_stats)
+
+        return response.Response(data=data, status=status.HTTP_200_OK)
 
 
 class MovieSuggestorDescriptionView(views.APIView, MovieSuggestorDescriptionMixin, BaseMovieAI):
@@ -128,3 +165,26 @@ class MovieSuggestorDescriptionView(views.APIView, MovieSuggestorDescriptionMixi
 
         description = self.suggest_description(movie)
         return response.Response(data={'description': description}, status=status.HTTP_200_OK)
+
+
+class MovieDescriptionJobView(views.APIView):
+    permission_classes = (
+        IsAuthenticated,
+        GlobalDefaultPermission,
+    )
+    pagination_class = None
+    queryset = Movie.objects.all()
+    job_error_message = 'The description could not be generated.'
+
+    def get(self, request, job_id):
+        result = generate_movie_description.AsyncResult(str(job_id))
+
+        data = {'id': str(job_id), 'status': result.status}
+        if result.successful():
+            data['description'] = result.result['description']
+        elif result.failed():
+            # O erro do provedor de IA fica só no log: a mensagem pode trazer detalhes internos da integração.
+            logger.error({'view': 'MovieDescriptionJobView', 'job_id': str(job_id), 'error_message': repr(result.result)})
+            data['error'] = self.job_error_message
+
+        return response.Response(data=data, status=status.HTTP_200_OK)
@@ -6,4 +6,4 @@ class ReviewsConfig(AppConfig):
     name = 'apps.reviews'
 
     def ready(self):
-        pass
+        import apps.reviews.signals  # noqa: F401, PLC0415
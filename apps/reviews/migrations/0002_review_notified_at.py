@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:21
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_existing_reviews_as_notified(apps, schema_editor):
+    # Reviews anteriores ao digest já foram notificadas no fluxo imediato.
+    Review = apps.get_model('reviews', 'Review')
+    Review.objects.filter(notified_at__isnull=True).update(notified_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0002_movie_rating_aggregates'),
+        ('reviews', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='notified_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('notified_at__isnull', True)), fields=['created_at'], name='review_pending_notify_idx'),
+        ),
+        migrations.RunPython(mark_existing_reviews_as_notified, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0003_list_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='notification_status',
+            field=models.CharField(
+                blank=True,
+                choices=[('claimed', 'Claimed'), ('sent', 'Sent'), ('failed', 'Failed'), ('skipped', 'Skipped')],
+                editable=False,
+                max_length=16,
+                null=True,
+            ),
+        ),
+    ]
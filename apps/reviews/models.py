@@ -1,8 +1,23 @@
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
 
+from apps.core.constants import (
+    REVIEW_NOTIFICATION_STATUS_CLAIMED,
+    REVIEW_NOTIFICATION_STATUS_FAILED,
+    REVIEW_NOTIFICATION_STATUS_SENT,
+    REVIEW_NOTIFICATION_STATUS_SKIPPED,
+)
 from apps.core.models import BaseModel
 from apps.movies.models import Movie
+from apps.movies.services.rating_service import MovieRatingService
+
+NOTIFICATION_STATUS_CHOICES = (
+    # (valor armazenado, valor exibido)
+    (REVIEW_NOTIFICATION_STATUS_CLAIMED, 'Claimed'),
+    (REVIEW_NOTIFICATION_STATUS_SENT, 'Sent'),
+    (REVIEW_NOTIFICATION_STATUS_FAILED, 'Failed'),
+    (REVIEW_NOTIFICATION_STATUS_SKIPPED, 'Skipped'),
+)
 
 
 class Review(BaseModel):
@@ -15,9 +30,40 @@ class Review(BaseModel):
         ]
     )
     comment = models.TextField(null=True, blank=True)
+    # Preenchido quando a review sai da fila de notificação (reservada, enviada, com falha ou sem destinatário);
+    # notification_status diz qual desses casos. Reviews antigas, notificadas antes do status existir, ficam com status nulo.
+    notified_at = models.DateTimeField(null=True, blank=True, editable=False)
+    notification_status = models.CharField(max_length=16, choices=NOTIFICATION_STATUS_CHOICES, null=True, blank=True, editable=False)
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Listagem das reviews mais recentes (a paginação por cursor desempata pelo uuid)
+            models.Index(fields=['-created_at', 'uuid'], name='review_created_at_uuid_idx'),
+            models.Index(
+                fields=['created_at'],
+                condition=models.Q(notified_at__isnull=True),
+                name='review_pending_notify_idx',
+            ),
+        ]
 
     def __str__(self):
         return f'{self.movie} - {self.stars} stars'
+
+    def __get_stored_rating(self):
+        # Bloqueia a linha para que escritas concorrentes da mesma review não apliquem deltas sobre valores antigos.
+        return Review.objects.select_for_update().filter(pk=self.pk).values_list('movie_id', 'stars').first()
+
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            previous = None if self._state.adding else self.__get_stored_rating()
+            super().save(*args, **kwargs)
+            MovieRatingService().apply_review_change(previous=previous, current=(self.movie_id, self.stars))
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            previous = self.__get_stored_rating()
+            deleted = super().delete(*args, **kwargs)
+            MovieRatingService().apply_review_change(previous=previous, current=None)
+
+        return deleted
@@ -1,3 +1,5 @@
+from typing import List
+
 from django.core.mail import EmailMessage
 from django.template.loader import render_to_string
 
@@ -10,33 +12,43 @@ class ReviewEmailNotificationService(EmailService):
     REVIEW_NOTIFICATION_SUBJECT = 'New Review Notification'
     REVIEW_NOTIFICATION_MESSAGE = 'A new review has been submitted for the movie {movie_title}.'
     REVIEW_NOTIFICATION_TEMPLATE = 'reviews/email/review_notification.html'
+    REVIEW_DIGEST_SUBJECT = 'New Reviews Digest'
+    REVIEW_DIGEST_MESSAGE = '{reviews_count} new review(s) have been submitted.'
+    REVIEW_DIGEST_TEMPLATE = 'reviews/email/review_notification_digest.html'
 
     def __init__(self, sender_email: EmailMessage) -> None:
         self.sender_email = sender_email
         super().__init__(subject=self.REVIEW_NOTIFICATION_SUBJECT, message=self.REVIEW_NOTIFICATION_MESSAGE)
 
     def __build_message(self, review: Review) -> str:
+        # Lê movie e created_by uma única vez; o chamador deve carregá-los com select_related.
+        movie_title = review.movie.title
+        author_email = review.created_by.email if review.created_by else None
+
         logger_data = {
             'service': 'ReviewEmailNotificationService',
             'method': 'send',
             'subject': self.subject,
             'message': self.message,
-            'movie_title': review.movie.title,
+            'movie_title': movie_title,
             'review_comment': review.comment,
             'review_stars': review.stars,
             'review_created_at': review.created_at,
             'review_updated_at': review.updated_at,
-            'review_created_by': review.created_by.email if review.created_by else None,
+            'review_created_by': author_email,
         }
         logger.info(logger_data)
 
-        self.to = [review.created_by.email]
+        if author_email is None:
+            raise ValueError(f'Review {review.uuid} has no author to notify')
+
+        self.to = [author_email]
 
         context = {
-            'movie_title': review.movie.title,
+            'movie_title': movie_title,
             'review_comment': review.comment,
             'review_stars': review.stars,
-            'template_message': self.REVIEW_NOTIFICATION_MESSAGE.format(movie_title=review.movie.title),
+            'template_message': self.REVIEW_NOTIFICATION_MESSAGE.format(movie_title=movie_title),
             'subject': self.REVIEW_NOTIFICATION_SUBJECT,
             'background_image_url': self.BACKGROUND_IMAGE,
         }
@@ -45,13 +57,52 @@ class ReviewEmailNotificationService(EmailService):
 
         return html_body
 
-    def send(self, review: Review) -> None:
-        html_body = self.__build_message(review)
-
-        email = self.sender_email(subject=self.REVIEW_NOTIFICATION_SUBJECT, body=html_body, from_email=self.FROM_EMAIL, to=self.to)
+    def __build_email(self, subject: str, html_body: str, to: List[str], connection=None) -> EmailMessage:
+        email = self.sender_email(subject=subject, body=html_body, from_email=self.FROM_EMAIL, to=to, connection=connection)
 
         email.attach_alternative(content=html_body, mimetype='text/html')
 
+        return email
+
+    def build_digest_email(self, recipient: str, reviews: List[Review], connection=None) -> EmailMessage:
+        """
+        Renders a single e-mail listing every pending review of the recipient.
+
+        The reviews must come with movie loaded (select_related) so the template does not query per review.
+        """
+        logger_data = {
+            'service': 'ReviewEmailNotificationService',
+            'method': 'build_digest_email',
+            'subject': self.REVIEW_DIGEST_SUBJECT,
+            'to': recipient,
+            'reviews_count': len(reviews),
+        }
+        logger.info(logger_data)
+
+        context = {
+            'reviews': [
+                {
+                    'movie_title': review.movie.title,
+                    'review_comment': review.comment,
+                    'review_stars': review.stars,
+                }
+                for review in reviews
+            ],
+            'template_message': self.REVIEW_DIGEST_MESSAGE.format(reviews_count=len(reviews)),
+            'subject': self.REVIEW_DIGEST_SUBJECT,
+            'background_image_url': self.BACKGROUND_IMAGE,
+        }
+
+        html_body = render_to_string(self.REVIEW_DIGEST_TEMPLATE, context)
+
+        return self.__build_email(self.REVIEW_DIGEST_SUBJECT, html_body, [recipient], connection=connection)
+
+    def send(self, review: Review, connection=None) -> None:
+        html_body = self.__build_message(review)
+
+        # Com connection, vários envios reaproveitam a mesma sessão SMTP.
+        email = self.__build_email(self.REVIEW_NOTIFICATION_SUBJECT, html_body, self.to, connection=connection)
+
         try:
             email.send()
             logger_data = {
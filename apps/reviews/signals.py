@@ -1,11 +1,76 @@
+from django.conf import settings
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+from apps.core.constants import REVIEW_NOTIFICATION_DELIVERY_DIGEST
 from apps.reviews.models import Review
-from apps.reviews.tasks import send_review_email_notification
+from apps.reviews.tasks import send_review_email_notification, send_review_email_notifications
+
+
+class ReviewNotificationBuffer:
+    """
+    Review ids created in the current transaction, published once it commits.
+
+    A single review goes to send_review_email_notification, as before; many
+    reviews (bulk creation, imports) go together to send_review_email_notifications
+    in one broker message. Reviews whose savepoint was rolled back after they
+    were buffered no longer exist when the transaction commits and are dropped.
+    """
+
+    CONNECTION_ATTRIBUTE = '_review_notification_buffer'
+
+    def __init__(self, connection) -> None:
+        self.connection = connection
+        self.review_ids: list[str] = []
+
+    @classmethod
+    def for_current_transaction(cls):
+        connection = transaction.get_connection()
+        buffer = getattr(connection, cls.CONNECTION_ATTRIBUTE, None)
+
+        # Se a transação anterior sofreu rollback o callback de commit foi descartado, então o buffer antigo não vale mais.
+        if buffer is None or not buffer.is_scheduled():
+            buffer = cls(connection)
+            setattr(connection, cls.CONNECTION_ATTRIBUTE, buffer)
+            transaction.on_commit(buffer.flush)
+
+        return buffer
+
+    def is_scheduled(self) -> bool:
+        return any(func == self.flush for _, func, _ in self.connection.run_on_commit)
+
+    def add(self, review_id: str) -> None:
+        self.review_ids.append(review_id)
+
+    def __get_committed_review_ids(self) -> list[str]:
+        # O flush fica registrado no savepoint da primeira review; reviews de savepoints desfeitos depois disso
+        # continuam no buffer, mas não existem mais no banco após o commit.
+        committed_ids = {str(review_id) for review_id in Review.objects.filter(uuid__in=self.review_ids).values_list('uuid', flat=True)}
+        return [review_id for review_id in self.review_ids if review_id in committed_ids]
+
+    def flush(self) -> None:
+        if getattr(self.connection, self.CONNECTION_ATTRIBUTE, None) is self:
+            setattr(self.connection, self.CONNECTION_ATTRIBUTE, None)
+
+        if not self.review_ids:
+            return
+
+        review_ids = self.__get_committed_review_ids()
+        if len(review_ids) == 1:
+            send_review_email_notification.delay(review_ids[0])
+        elif review_ids:
+            send_review_email_notifications.delay(review_ids)
 
 
 @receiver(post_save, sender=Review)
 def send_review_email_notification_signal(sender, instance, created, **kwargs):
-    if created:
-        send_review_email_notification.delay(str(instance.uuid))
+    if not created:
+        return
+
+    if settings.REVIEW_NOTIFICATION_DELIVERY == REVIEW_NOTIFICATION_DELIVERY_DIGEST:
+        # No modo digest a review fica pendente (notified_at nulo) até a próxima execução de send_review_notification_digest.
+        return
+
+    # Review.save sempre abre um bloco atômico, então o post_save roda dentro de uma transação.
+    ReviewNotificationBuffer.for_current_transaction().add(str(instance.uuid))
@@ -1,17 +1,52 @@
+from collections import defaultdict
+
 from celery import shared_task
-from django.core.mail import EmailMultiAlternatives
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.utils import timezone
 
 from app.settings import logger
+from apps.core.constants import (
+    REVIEW_NOTIFICATION_DELIVERY_DIGEST,
+    REVIEW_NOTIFICATION_DIGEST_BATCH_SIZE,
+    REVIEW_NOTIFICATION_STATUS_CLAIMED,
+    REVIEW_NOTIFICATION_STATUS_FAILED,
+    REVIEW_NOTIFICATION_STATUS_SENT,
+    REVIEW_NOTIFICATION_STATUS_SKIPPED,
+)
 from apps.reviews.models import Review
 from apps.reviews.services.review_email_notification_service import ReviewEmailNotificationService
 
 
+def mark_reviews_notification(review_ids, status):
+    # Qualquer status preenche notified_at, tirando a review do índice parcial de pendentes (review_pending_notify_idx).
+    if review_ids:
+        Review.objects.filter(uuid__in=review_ids).update(notified_at=timezone.now(), notification_status=status)
+
+
+def release_claimed_reviews(review_ids):
+    # Devolve à fila as reviews reservadas cujo envio falhou, para a próxima execução do digest tentar de novo.
+    if review_ids:
+        Review.objects.filter(uuid__in=review_ids, notification_status=REVIEW_NOTIFICATION_STATUS_CLAIMED).update(
+            notified_at=None, notification_status=None
+        )
+
+
+def log_review_without_author(task, review):
+    logger_data = {
+        'task': task,
+        'action': 'skipped',
+        'review_id': str(review.uuid),
+        'error_message': 'Review has no author to notify',
+    }
+    logger.warning(logger_data)
+
+
 @shared_task
 def send_review_email_notification(review_id):
     try:
-        review = Review.objects.get(uuid=review_id)
-        service = ReviewEmailNotificationService(EmailMultiAlternatives)
-        service.send(review)
+        review = Review.objects.select_related('movie', 'created_by').get(uuid=review_id)
     except Review.DoesNotExist:
         logger_data = {
             'task': 'send_review_email_notification',
@@ -20,6 +55,16 @@ def send_review_email_notification(review_id):
             'error_message': 'Review does not exist',
         }
         logger.error(logger_data)
+        return
+
+    if review.created_by is None:
+        log_review_without_author('send_review_email_notification', review)
+        mark_reviews_notification([review.uuid], REVIEW_NOTIFICATION_STATUS_SKIPPED)
+        return
+
+    try:
+        service = ReviewEmailNotificationService(EmailMultiAlternatives)
+        service.send(review)
     except Exception as e:
         logger_data = {
             'task': 'send_review_email_notification',
@@ -28,3 +73,122 @@ def send_review_email_notification(review_id):
             'error_message': str(e),
         }
         logger.error(logger_data, exc_info=True)
+        # Nada reenviaria a review no modo imediato: ela é marcada como falha em vez de ficar pendente para sempre.
+        mark_reviews_notification([review.uuid], REVIEW_NOTIFICATION_STATUS_FAILED)
+        return
+
+    mark_reviews_notification([review.uuid], REVIEW_NOTIFICATION_STATUS_SENT)
+
+
+@shared_task
+def send_review_email_notifications(review_ids):
+    service = ReviewEmailNotificationService(EmailMultiAlternatives)
+    reviews = Review.objects.filter(uuid__in=review_ids).select_related('movie', 'created_by')
+
+    sent_review_ids = []
+    failed_review_ids = []
+    skipped_review_ids = []
+    # Uma única sessão SMTP para todo o lote.
+    with get_connection() as connection:
+        for review in reviews:
+            if review.created_by is None:
+                log_review_without_author('send_review_email_notifications', review)
+                skipped_review_ids.append(review.uuid)
+                continue
+
+            try:
+                service.send(review, connection=connection)
+                sent_review_ids.append(review.uuid)
+            except Exception as e:
+                logger_data = {
+                    'task': 'send_review_email_notifications',
+                    'action': 'error',
+                    'review_id': str(review.uuid),
+                    'error_message': str(e),
+                }
+                logger.error(logger_data, exc_info=True)
+                failed_review_ids.append(review.uuid)
+
+    mark_reviews_notification(sent_review_ids, REVIEW_NOTIFICATION_STATUS_SENT)
+    mark_reviews_notification(failed_review_ids, REVIEW_NOTIFICATION_STATUS_FAILED)
+    mark_reviews_notification(skipped_review_ids, REVIEW_NOTIFICATION_STATUS_SKIPPED)
+
+    logger_data = {
+        'task': 'send_review_email_notifications',
+        'action': 'sent',
+        'requested_count': len(review_ids),
+        'sent_count': len(sent_review_ids),
+        'failed_count': len(failed_review_ids),
+        'skipped_count': len(skipped_review_ids),
+    }
+    logger.info(logger_data)
+
+
+@shared_task
+def send_review_notification_digest():
+    """
+    Sends one e-mail per recipient with every review still pending notification.
+
+    Runs periodically (CELERY_BEAT_SCHEDULE) and does nothing unless
+    REVIEW_NOTIFICATION_DELIVERY is 'digest'. Pending rows are claimed in a short
+    transaction (SELECT ... FOR UPDATE SKIP LOCKED, then marked 'claimed'), so
+    overlapping runs never notify the same review twice and no lock is held
+    during the SMTP session. Reviews without an author are marked 'skipped';
+    reviews of a recipient whose e-mail failed go back to pending for the next run.
+    """
+    if settings.REVIEW_NOTIFICATION_DELIVERY != REVIEW_NOTIFICATION_DELIVERY_DIGEST:
+        return
+
+    service = ReviewEmailNotificationService(EmailMultiAlternatives)
+
+    reviews_by_recipient = defaultdict(list)
+    skipped_review_ids = []
+    with transaction.atomic():
+        reviews = (
+            Review.objects.filter(notified_at__isnull=True)
+            .select_related('movie', 'created_by')
+            .select_for_update(skip_locked=True, of=('self',))
+            .order_by('created_at')[:REVIEW_NOTIFICATION_DIGEST_BATCH_SIZE]
+        )
+
+        for review in reviews:
+            if review.created_by is None:
+                skipped_review_ids.append(review.uuid)
+            else:
+                reviews_by_recipient[review.created_by.email].append(review)
+
+        mark_reviews_notification(skipped_review_ids, REVIEW_NOTIFICATION_STATUS_SKIPPED)
+        claimed_review_ids = [review.uuid for recipient_reviews in reviews_by_recipient.values() for review in recipient_reviews]
+        mark_reviews_notification(claimed_review_ids, REVIEW_NOTIFICATION_STATUS_CLAIMED)
+
+    # Os e-mails saem depois do commit: as linhas já estão reservadas e nenhum lock fica preso durante o SMTP.
+    sent_review_ids = []
+    failed_review_ids = []
+    with get_connection() as connection:
+        for recipient, recipient_reviews in reviews_by_recipient.items():
+            try:
+                service.build_digest_email(recipient, recipient_reviews, connection=connection).send()
+                sent_review_ids.extend(review.uuid for review in recipient_reviews)
+            except Exception as e:
+                logger_data = {
+                    'task': 'send_review_notification_digest',
+                    'action': 'error',
+                    'to': recipient,
+                    'reviews_count': len(recipient_reviews),
+                    'error_message': str(e),
+                }
+                logger.error(logger_data, exc_info=True)
+                failed_review_ids.extend(review.uuid for review in recipient_reviews)
+
+    mark_reviews_notification(sent_review_ids, REVIEW_NOTIFICATION_STATUS_SENT)
+    release_claimed_reviews(failed_review_ids)
+
+    logger_data = {
+        'task': 'send_review_notification_digest',
+        'action': 'sent',
+        'recipients_count': len(reviews_by_recipient),
+        'sent_count': len(sent_review_ids),
+        'failed_count': len(failed_review_ids),
+        'skipped_count': len(skipped_review_ids),
+    }
+    logger.info(logger_data)
@@ -0,0 +1,122 @@
+from unittest.mock import patch
+
+import pytest
+from django.db import transaction
+from django.test import override_settings
+
+from apps.reviews.tests.factories import ReviewFactory
+
+
+@pytest.mark.django_db
+class TestReviewNotificationSignal:
+    @pytest.fixture(autouse=True)
+    def mock_tasks(self):
+        with (
+            patch('apps.reviews.signals.send_review_email_notification') as mock_single_task,
+            patch('apps.reviews.signals.send_review_email_notifications') as mock_batch_task,
+        ):
+            self.mock_single_task = mock_single_task
+            self.mock_batch_task = mock_batch_task
+            yield
+
+    def test_enqueue_waits_for_commit(self, django_capture_on_commit_callbacks):
+        # Arrange / Act
+        with django_capture_on_commit_callbacks() as callbacks:
+            review = ReviewFactory()
+
+            # Assert
+            self.mock_single_task.delay.assert_not_called()
+
+        for callback in callbacks:
+            callback()
+
+        self.mock_single_task.delay.assert_called_once_with(str(review.uuid))
+        self.mock_batch_task.delay.assert_not_called()
+
+    def test_many_reviews_in_one_transaction_are_batched(self, django_capture_on_commit_callbacks):
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            reviews = ReviewFactory.create_batch(3)
+
+        # Assert
+        self.mock_single_task.delay.assert_not_called()
+        self.mock_batch_task.delay.assert_called_once_with([str(review.uuid) for review in reviews])
+
+    def test_rolled_back_reviews_are_not_notified(self, django_capture_on_commit_callbacks):
+        # Arrange
+        def create_review_and_rollback():
+            with transaction.atomic():
+                ReviewFactory()
+                raise RuntimeError('rollback')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            # Act
+            with pytest.raises(RuntimeError):
+                create_review_and_rollback()
+
+            review = ReviewFactory()
+
+        # Assert
+        self.mock_batch_task.delay.assert_not_called()
+        self.mock_single_task.delay.assert_called_once_with(str(review.uuid))
+
+    def test_review_rolled_back_after_the_first_one_is_not_notified(self, django_capture_on_commit_callbacks):
+        # Arrange
+        def create_review_and_rollback():
+            with transaction.atomic():
+                ReviewFactory()
+                raise RuntimeError('rollback')
+
+        with django_capture_on_commit_callbacks(execute=True):
+            # Act
+            # A primeira review registra o envio no seu savepoint, que é confirmado; o savepoint seguinte é desfeito.
+            first_review = ReviewFactory()
+            with pytest.raises(RuntimeError):
+                create_review_and_rollback()
+            last_review = ReviewFactory()
+
+        # Assert
+        self.mock_single_task.delay.assert_not_called()
+        self.mock_batch_task.delay.assert_called_once_with([str(first_review.uuid), str(last_review.uuid)])
+
+    def test_only_review_rolled_back_after_buffering_is_not_notified(self, django_capture_on_commit_callbacks):
+        # Arrange
+        def create_review_and_rollback():
+            with transaction.atomic():
+                ReviewFactory()
+                raise RuntimeError('rollback')
+
+        # Act
+        with django_capture_on_commit_callbacks(execute=True), transaction.atomic():
+            review = ReviewFactory()
+            with pytest.raises(RuntimeError):
+                create_review_and_rollback()
+
+        # Assert
+        self.mock_batch_task.delay.assert_not_called()
+        self.mock_single_task.delay.assert_called_once_with(str(review.uuid))
+
+    def test_updating_review_does_not_notify(self, django_capture_on_commit_callbacks):
+        # Arrange
+        review = ReviewFactory()
+
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            review.stars = 1
+            review.save()
+
+        # Assert
+        self.mock_single_task.delay.assert_not_called()
+        self.mock_batch_task.delay.assert_not_called()
+
+    @override_settings(REVIEW_NOTIFICATION_DELIVERY='digest')
+    def test_digest_mode_leaves_review_pending(self, django_capture_on_commit_callbacks):
+        # Act
+        with django_capture_on_commit_callbacks(execute=True):
+            review = ReviewFactory()
+
+        # Assert
+        self.mock_single_task.delay.assert_not_called()
+        self.mock_batch_task.delay.assert_not_called()
+        review.refresh_from_db()
+        assert review.notified_at is None
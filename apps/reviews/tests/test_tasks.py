@@ -0,0 +1,217 @@
+from unittest.mock import patch
+
+import pytest
+from django.core import mail
+from django.db import transaction
+from django.utils import timezone
+
+from apps.authentication.tests.factories import UserFactory
+from apps.reviews.models import Review
+from apps.reviews.tasks import send_review_email_notification, send_review_email_notifications, send_review_notification_digest
+from apps.reviews.tests.factories import ReviewFactory
+
+
+@pytest.mark.django_db
+class TestSendReviewEmailNotification:
+    def test_loads_review_movie_and_author_in_one_query(self, django_assert_num_queries):
+        # Arrange
+        review = ReviewFactory(created_by=UserFactory(password='password'))
+
+        # Act / Assert
+        # Um SELECT com movie e created_by (select_related) e o UPDATE de notified_at.
+        with django_assert_num_queries(2):
+            send_review_email_notification(str(review.uuid))
+
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == [review.created_by.email]
+        assert review.movie.title in mail.outbox[0].body
+
+    def test_review_without_author_is_skipped(self):
+        # Arrange
+        review = ReviewFactory(created_by=None)
+
+        # Act
+        send_review_email_notification(str(review.uuid))
+
+        # Assert
+        review.refresh_from_db()
+        assert mail.outbox == []
+        assert review.notified_at is not None
+        assert review.notification_status == 'skipped'
+
+    def test_failed_send_leaves_the_pending_queue(self):
+        # Arrange
+        review = ReviewFactory(created_by=UserFactory(password='password'))
+
+        # Act
+        with patch('django.core.mail.backends.locmem.EmailBackend.send_messages', side_effect=RuntimeError('SMTP down')):
+            send_review_email_notification(str(review.uuid))
+
+        # Assert
+        review.refresh_from_db()
+        assert review.notified_at is not None
+        assert review.notification_status == 'failed'
+        assert not Review.objects.filter(notified_at__isnull=True).exists()
+
+
+@pytest.mark.django_db
+class TestSendReviewEmailNotifications:
+    def test_sends_one_email_per_review(self):
+        # Arrange
+        reviews = [ReviewFactory(created_by=UserFactory(password='password')) for _ in range(3)]
+
+        # Act
+        send_review_email_notifications([str(review.uuid) for review in reviews])
+
+        # Assert
+        assert len(mail.outbox) == 3
+        assert {message.to[0] for message in mail.outbox} == {review.created_by.email for review in reviews}
+        assert not Review.objects.filter(notified_at__isnull=True).exists()
+
+    def test_queries_do_not_grow_with_reviews(self, django_assert_num_queries):
+        # Arrange
+        reviews = [ReviewFactory(created_by=UserFactory(password='password')) for _ in range(3)]
+
+        # Act / Assert
+        with django_assert_num_queries(2):
+            send_review_email_notifications([str(review.uuid) for review in reviews])
+
+    def test_batch_reuses_a_single_connection(self):
+        # Arrange
+        reviews = [ReviewFactory(created_by=UserFactory(password='password')) for _ in range(3)]
+
+        # Act
+        with patch('apps.reviews.tasks.get_connection', wraps=mail.get_connection) as mock_get_connection:
+            send_review_email_notifications([str(review.uuid) for review in reviews])
+
+        # Assert
+        mock_get_connection.assert_called_once_with()
+        assert len(mail.outbox) == 3
+
+    def test_failing_review_does_not_stop_the_batch(self):
+        # Arrange
+        review_without_author = ReviewFactory(created_by=None)
+        review = ReviewFactory(created_by=UserFactory(password='password'))
+
+        # Act
+        send_review_email_notifications([str(review_without_author.uuid), str(review.uuid)])
+
+        # Assert
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == [review.created_by.email]
+        assert Review.objects.get(uuid=review_without_author.uuid).notification_status == 'skipped'
+        assert Review.objects.get(uuid=review.uuid).notification_status == 'sent'
+
+
+@pytest.mark.django_db
+class TestSendReviewNotificationDigest:
+    @pytest.fixture(autouse=True)
+    def digest_delivery(self, settings):
+        settings.REVIEW_NOTIFICATION_DELIVERY = 'digest'
+
+    def setup_method(self):
+        self.user = UserFactory(password='password')
+        self.other_user = UserFactory(password='password')
+
+    def test_groups_pending_reviews_per_recipient(self):
+        # Arrange
+        user_reviews = ReviewFactory.create_batch(3, created_by=self.user)
+        other_user_review = ReviewFactory(created_by=self.other_user)
+
+        # Act
+        with patch('apps.reviews.tasks.get_connection', wraps=mail.get_connection) as mock_get_connection:
+            send_review_notification_digest()
+
+        # Assert
+        mock_get_connection.assert_called_once_with()
+        assert len(mail.outbox) == 2
+        messages_by_recipient = {message.to[0]: message for message in mail.outbox}
+        user_message = messages_by_recipient[self.user.email]
+        assert user_message.subject == 'New Reviews Digest'
+        assert all(review.movie.title in user_message.body for review in user_reviews)
+        assert other_user_review.movie.title in messages_by_recipient[self.other_user.email].body
+        assert not Review.objects.filter(notified_at__isnull=True).exists()
+        assert set(Review.objects.values_list('notification_status', flat=True)) == {'sent'}
+
+    def test_sends_after_the_claim_transaction(self):
+        # Arrange
+        review = ReviewFactory(created_by=self.user)
+        connection = transaction.get_connection()
+        savepoints_before = list(connection.savepoint_ids)
+        state_during_send = {}
+
+        def send_messages(messages):
+            state_during_send['savepoints'] = list(connection.savepoint_ids)
+            state_during_send['status'] = Review.objects.get(uuid=review.uuid).notification_status
+            return len(messages)
+
+        # Act
+        with patch('django.core.mail.backends.locmem.EmailBackend.send_messages', side_effect=send_messages):
+            send_review_notification_digest()
+
+        # Assert
+        # O bloco atômico da reserva já terminou quando o SMTP é chamado, com a review marcada como reservada.
+        assert state_during_send == {'savepoints': savepoints_before, 'status': 'claimed'}
+        assert Review.objects.get(uuid=review.uuid).notification_status == 'sent'
+
+    def test_review_without_author_leaves_the_pending_queue(self):
+        # Arrange
+        review = ReviewFactory(created_by=None)
+
+        # Act
+        send_review_notification_digest()
+
+        # Assert
+        review.refresh_from_db()
+        assert mail.outbox == []
+        assert review.notified_at is not None
+        assert review.notification_status == 'skipped'
+
+    def test_notified_reviews_are_not_sent_again(self):
+        # Arrange
+        ReviewFactory(created_by=self.user)
+        send_review_notification_digest()
+        mail.outbox.clear()
+
+        # Act
+        send_review_notification_digest()
+
+        # Assert
+        assert mail.outbox == []
+
+    def test_queries_do_not_grow_with_reviews(self, django_assert_max_num_queries):
+        # Arrange
+        for _ in range(5):
+            ReviewFactory(created_by=UserFactory(password='password'))
+
+        # Act / Assert
+        with django_assert_max_num_queries(5):
+            send_review_notification_digest()
+
+        assert len(mail.outbox) == 5
+
+    def test_failed_recipient_stays_pending(self):
+        # Arrange
+        review = ReviewFactory(created_by=self.user)
+        notified_at = timezone.now()
+        ReviewFactory(created_by=self.other_user, notified_at=notified_at)
+
+        # Act
+        with patch('django.core.mail.backends.locmem.EmailBackend.send_messages', side_effect=RuntimeError('SMTP down')):
+            send_review_notification_digest()
+
+        # Assert
+        review.refresh_from_db()
+        assert review.notified_at is None
+        assert review.notification_status is None
+
+    def test_does_nothing_in_immediate_mode(self, settings):
+        # Arrange
+        settings.REVIEW_NOTIFICATION_DELIVERY = 'immediate'
+        ReviewFactory(created_by=self.user)
+
+        # Act
+        send_review_notification_digest()
+
+        # Assert
+        assert mail.outbox == []
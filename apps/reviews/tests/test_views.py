@@ -38,6 +38,24 @@ class TestReviewAPI(BaseAPITest):
         assert response.status_code == status.HTTP_200_OK
         assert response.data['count'] == Review.objects.count()
 
+    def test_list_reviews_cursor_pagination_follows_created_at_ordering(self, existing_review):
+        self.give_permissions(model=Review)
+        ReviewFactory.create_batch(12)
+
+        url = reverse('review-create-list')
+        response = self.client.get(url, {'pagination': 'cursor', 'page_size': 5})
+
+        seen_uuids = []
+        while True:
+            assert response.status_code == status.HTTP_200_OK
+            seen_uuids.extend(review['uuid'] for review in response.data['results'])
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+
+        expected_uuids = [str(uuid_) for uuid_ in Review.objects.order_by('-created_at', 'uuid').values_list('uuid', flat=True)]
+        assert seen_uuids == expected_uuids
+
     def test_list_reviews_without_permissions(self, existing_review):
         url = reverse('review-create-list')
         response = self.client.get(url, format='json')
@@ -116,6 +134,22 @@ class TestReviewAPI(BaseAPITest):
         existing_review.refresh_from_db()
         assert existing_review.stars == updated_data['stars']
 
+    def test_update_review_moving_movie_updates_ratings(self, existing_review):
+        self.give_permissions(model=Review)
+        old_movie = existing_review.movie
+        new_movie = MovieFactory()
+
+        url = reverse('review-detail-view', kwargs={'pk': existing_review.pk})
+        response = self.client.patch(url, {'movie': str(new_movie.uuid), 'stars': 3}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        old_movie.refresh_from_db()
+        new_movie.refresh_from_db()
+        assert old_movie.review_count == 0
+        assert old_movie.average_stars is None
+        assert new_movie.review_count == 1
+        assert new_movie.average_stars == 3.0
+
     def test_update_review_without_permissions(self, existing_review):
         updated_data = {'stars': 4, 'comment': 'Updated comment'}
         url = reverse('review-detail-view', kwargs={'pk': existing_review.pk})
@@ -0,0 +1,102 @@
+"""
+Mede a vazão dos caminhos de descrição com IA sem acessar a rede.
+
+Usa o adapter `local` (AI_ADAPTER=local), com latência sintética configurável,
+e roda tudo dentro de uma transação desfeita ao final, então o banco não é
+alterado. Cenários:
+
+- suggest: POST /movies/suggest-description/ em sequência (latência por requisição)
+- backfill: MovieDescriptionBackfillService com N workers sobre os filmes criados
+
+Uso (com as variáveis do .env carregadas):
+
+    python benchmarks/ai_description_throughput.py --movies 200 --latency 0.2 --workers 8
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def setup_django(latency: float) -> None:
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+    os.environ['AI_ADAPTER'] = 'local'
+    os.environ['AI_LOCAL_LATENCY'] = str(latency)
+    # Sem cache de respostas: cada chamada paga a latência do adapter.
+    os.environ['AI_RESPONSE_CACHE_TTL'] = '0'
+
+    import django  # noqa: PLC0415
+
+    django.setup()
+
+
+def percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100)[percent - 1] if len(values) > 1 else values[0]
+
+
+def run_suggest(client, movies) -> None:
+    from django.urls import reverse  # noqa: PLC0415
+
+    url = reverse('movie-suggestor-description-view')
+    durations = []
+    started_at = time.perf_counter()
+    for movie in movies:
+        request_started_at = time.perf_counter()
+        response = client.post(url, {'movie_uuid': str(movie.uuid)}, format='json')
+        durations.append(time.perf_counter() - request_started_at)
+        assert response.status_code == 200, response.data  # noqa: PLR2004
+
+    elapsed = time.perf_counter() - started_at
+    print(
+        f'suggest   requests={len(movies)} throughput={len(movies) / elapsed:.1f} req/s '
+        f'p50={percentile(durations, 50) * 1000:.0f}ms p95={percentile(durations, 95) * 1000:.0f}ms'
+    )
+
+
+def run_backfill(workers: int) -> None:
+    from apps.core.adapters.ai_adapters.factory import get_ai_adapter  # noqa: PLC0415
+    from apps.movies.services.description_backfill_service import MovieDescriptionBackfillService  # noqa: PLC0415
+
+    result = MovieDescriptionBackfillService(ai_adapter=get_ai_adapter(), workers=workers, rate_limit=0).backfill()
+    print(
+        f'backfill  movies={result["processed_count"]} workers={workers} throughput={result["throughput"]} movies/s failures={result["failed_count"]}'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--movies', type=int, default=50)
+    parser.add_argument('--latency', type=float, default=0.1)
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    setup_django(args.latency)
+
+    from django.contrib.auth import get_user_model  # noqa: PLC0415
+    from django.db import transaction  # noqa: PLC0415
+    from rest_framework.test import APIClient  # noqa: PLC0415
+
+    from apps.genres.models import Genre  # noqa: PLC0415
+    from apps.movies.models import Movie  # noqa: PLC0415
+
+    with transaction.atomic():
+        user = get_user_model().objects.create_user(username='ai-benchmark', password='ai-benchmark')
+        genre = Genre.objects.create(name='AI benchmark')
+        movies = Movie.objects.bulk_create([Movie(title=f'Benchmark movie {index}', genre=genre) for index in range(args.movies)])
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        run_suggest(client, movies)
+        run_backfill(args.workers)
+
+        transaction.set_rollback(True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""
+Mede a latência por requisição com e sem reaproveitamento de conexões do PostgreSQL.
+
+Cada cenário roda em um processo novo, com as variáveis POSTGRES_* aplicadas
+antes de carregar os settings, e faz N requisições sequenciais a
+GET /api/v1/movies/ pelo WSGIHandler do Django (o mesmo caminho de um worker
+do gunicorn, incluindo os sinais request_started/request_finished que abrem e
+fecham conexões):
+
+- sem-persistencia: POSTGRES_CONN_MAX_AGE=0 (uma conexão nova por requisição)
+- persistente: POSTGRES_CONN_MAX_AGE=60 com CONN_HEALTH_CHECKS
+- pool: POSTGRES_POOL=true (pool do psycopg 3)
+
+Antes das medições cria um usuário e N filmes com prefixo próprio, removidos ao final.
+
+Uso (com as variáveis do .env carregadas e o banco migrado):
+
+    python benchmarks/db_connections.py --requests 500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+BENCHMARK_PREFIX = 'db-connections-benchmark'
+
+SCENARIOS = {
+    'sem-persistencia': {'POSTGRES_CONN_MAX_AGE': '0', 'POSTGRES_POOL': 'False'},
+    'persistente': {'POSTGRES_CONN_MAX_AGE': '60', 'POSTGRES_CONN_HEALTH_CHECKS': 'True', 'POSTGRES_POOL': 'False'},
+    'pool': {'POSTGRES_POOL': 'True'},
+}
+
+SCENARIO_CODE = """
+import io, json, os, sys, time
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+import django
+django.setup()
+from django.contrib.auth import get_user_model
+from django.core.handlers.wsgi import WSGIHandler
+from django.db.backends.signals import connection_created
+from rest_framework_simplejwt.tokens import AccessToken
+
+created_connections = []
+connection_created.connect(lambda sender, connection, **kwargs: created_connections.append(connection), weak=False)
+
+token = str(AccessToken.for_user(get_user_model().objects.get(username=sys.argv[1])))
+handler = WSGIHandler()
+environ = {
+    'REQUEST_METHOD': 'GET', 'PATH_INFO': '/api/v1/movies/', 'QUERY_STRING': '', 'SERVER_NAME': 'localhost',
+    'SERVER_PORT': '80', 'wsgi.url_scheme': 'http', 'wsgi.input': io.BytesIO(), 'wsgi.errors': sys.stderr,
+    'HTTP_AUTHORIZATION': f'Bearer {token}',
+}
+
+def request():
+    started_at = time.perf_counter()
+    response = handler(dict(environ), lambda status, headers: None)
+    b''.join(response)
+    response.close()
+    return time.perf_counter() - started_at
+
+for _ in range(20):
+    request()
+created_connections.clear()
+
+durations = [request() for _ in range(int(sys.argv[2]))]
+
+# Com pool, connection_created dispara a cada conexão emprestada; as conexões reais vêm das estatísticas do pool.
+from django.db import connection
+pool = connection.pool
+connections = pool.get_stats().get('connections_num', 0) if pool else len(created_connections)
+print(json.dumps({'durations': durations, 'connections': connections}))
+"""
+
+
+def percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100)[percent - 1] if len(values) > 1 else values[0]
+
+
+def run_scenario(name: str, total_requests: int) -> None:
+    env = {**os.environ, **SCENARIOS[name], 'DJANGO_SETTINGS_MODULE': 'app.settings'}
+    result = subprocess.run(
+        [sys.executable, '-c', SCENARIO_CODE, BENCHMARK_PREFIX, str(total_requests)],
+        cwd=BASE_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    durations = data['durations']
+    print(
+        f'{name:<17} requests={total_requests} mean={statistics.mean(durations) * 1000:.2f}ms '
+        f'p50={percentile(durations, 50) * 1000:.2f}ms p95={percentile(durations, 95) * 1000:.2f}ms '
+        f'connections_opened={data["connections"]}'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--movies', type=int, default=25)
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+
+    import django  # noqa: PLC0415
+
+    django.setup()
+
+    from django.contrib.auth import get_user_model  # noqa: PLC0415
+
+    from apps.genres.models import Genre  # noqa: PLC0415
+    from apps.movies.models import Movie  # noqa: PLC0415
+
+    User = get_user_model()
+    user = User.objects.create_superuser(username=BENCHMARK_PREFIX, email=f'{BENCHMARK_PREFIX}@flix.com', password=BENCHMARK_PREFIX)
+    genre = Genre.objects.create(name=BENCHMARK_PREFIX)
+    Movie.objects.bulk_create([Movie(title=f'{BENCHMARK_PREFIX} {index}', genre=genre) for index in range(args.movies)])
+
+    try:
+        for name in args.scenarios:
+            run_scenario(name, args.requests)
+    finally:
+        Movie.objects.filter(genre=genre).delete()
+        genre.delete()
+        user.delete()
+
+
+if __name__ == '__main__':
+    main()
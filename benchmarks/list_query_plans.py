@@ -0,0 +1,182 @@
+"""
+Mostra o plano de execução das listagens com e sem os índices de ordenação.
+
+Gera uma massa sintética (por padrão 1 milhão de linhas em filmes, atores,
+gêneros e reviews) dentro de uma transação desfeita ao final, chama os
+endpoints de listagem e roda EXPLAIN ANALYZE na consulta paginada que cada um
+executou:
+
+- page: paginação por número de página (padrão), primeira página
+- cursor: paginação por cursor (keyset) a partir do meio da tabela
+- lower: busca de gênero/ator por nome sem diferenciar maiúsculas (lower(name))
+
+Cada consulta é medida com os índices das migrations e depois com eles
+removidos (DROP INDEX também é desfeito pelo rollback). Rode contra um banco de
+desenvolvimento: o DROP INDEX bloqueia as tabelas até o fim do script.
+
+Uso (com as variáveis do .env carregadas e o banco migrado):
+
+    python benchmarks/list_query_plans.py --rows 1000000
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+INDEXES = {
+    'movies_movie': ['movie_title_uuid_idx'],
+    'actors_actor': ['actor_name_uuid_idx', 'actor_name_lower_idx'],
+    'genres_genre': ['genre_name_uuid_idx', 'genre_name_lower_unique'],
+    'reviews_review': ['review_created_at_uuid_idx'],
+}
+
+SEED_SQL = [
+    """
+    INSERT INTO genres_genre (uuid, name, created_at, updated_at)
+    SELECT gen_random_uuid(), md5(i::text), now(), now() FROM generate_series(1, %(rows)s) i
+    """,
+    """
+    INSERT INTO actors_actor (uuid, name, created_at, updated_at)
+    SELECT gen_random_uuid(), md5(i::text), now(), now() FROM generate_series(1, %(rows)s) i
+    """,
+    """
+    INSERT INTO movies_movie (uuid, title, genre_id, review_count, stars_sum, created_at, updated_at)
+    SELECT gen_random_uuid(), md5(i::text), (SELECT uuid FROM genres_genre LIMIT 1), 0, 0, now(), now()
+    FROM generate_series(1, %(rows)s) i
+    """,
+    """
+    INSERT INTO reviews_review (uuid, movie_id, stars, created_at, updated_at, notified_at)
+    SELECT gen_random_uuid(), (SELECT uuid FROM movies_movie LIMIT 1), 1 + i %% 5,
+           now() - make_interval(secs => i), now(), now()
+    FROM generate_series(1, %(rows)s) i
+    """,
+]
+
+
+def explain(cursor, sql: str) -> tuple[str, float]:
+    cursor.execute(f'EXPLAIN (ANALYZE, FORMAT TEXT) {sql}')
+    lines = [row[0] for row in cursor.fetchall()]
+    plan = '\n'.join(lines)
+
+    # Nó de acesso à tabela principal: o primeiro scan do plano.
+    access = re.search(r'(Index Only Scan|Index Scan|Bitmap Heap Scan|Seq Scan)(?: using (\S+))?', plan)
+    sort = re.search(r'(Incremental )?Sort  ', plan)
+    execution_time = float(re.search(r'Execution Time: ([\d.]+) ms', plan).group(1))
+
+    label = ' '.join(part for part in access.groups() if part) if access else '?'
+    if sort:
+        label = f'Sort + {label}'
+    return label, execution_time
+
+
+def capture_list_query(client, url: str, table: str) -> str:
+    from django.db import connection  # noqa: PLC0415
+    from django.test.utils import CaptureQueriesContext  # noqa: PLC0415
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200, response.content  # noqa: PLR2004
+
+    for query in queries:
+        sql = query['sql']
+        if f'FROM "{table}"' in sql and 'LIMIT' in sql:
+            return sql
+    raise RuntimeError(f'No paginated query on {table} for {url}')
+
+
+def build_cursor_url(model, path: str, offset: int) -> str:
+    from app.pagination import KeysetPagination  # noqa: PLC0415
+
+    paginator = KeysetPagination()
+    paginator.base_url = f'http://testserver{path}'
+    paginator.ordering = paginator.get_ordering(model.objects.all(), view=None)
+    instance = model.objects.order_by(*paginator.ordering)[offset]
+    return paginator.encode_cursor(instance, reverse=False)
+
+
+def build_scenarios(rows: int) -> list[tuple[str, str, str]]:
+    from apps.actors.models import Actor  # noqa: PLC0415
+    from apps.genres.models import Genre  # noqa: PLC0415
+    from apps.movies.models import Movie  # noqa: PLC0415
+    from apps.reviews.models import Review  # noqa: PLC0415
+
+    middle = rows // 2
+    scenarios = []
+    for model, path in ((Movie, '/api/v1/movies/'), (Actor, '/api/v1/actors/'), (Genre, '/api/v1/genres/'), (Review, '/api/v1/reviews/')):
+        table = model._meta.db_table
+        scenarios.append((f'{table} page', table, f'{path}?page=1'))
+        scenarios.append((f'{table} cursor', table, build_cursor_url(model, path, middle)))
+    return scenarios
+
+
+def lower_lookup_sql(model) -> str:
+    from django.db import connection  # noqa: PLC0415
+    from django.db.models.functions import Lower  # noqa: PLC0415
+
+    # Mesma consulta da validação de nome do gênero: lower(name) IN (...)
+    name = model.objects.values_list('name', flat=True).first()
+    queryset = model.objects.annotate(name_lower=Lower('name')).filter(name_lower__in=[name.lower()])
+    sql, params = queryset.query.sql_with_params()
+
+    with connection.cursor() as cursor:
+        return cursor.mogrify(sql, params)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+
+    import django  # noqa: PLC0415
+
+    django.setup()
+
+    from django.contrib.auth import get_user_model  # noqa: PLC0415
+    from django.db import connection, transaction  # noqa: PLC0415
+    from rest_framework.test import APIClient  # noqa: PLC0415
+
+    from apps.actors.models import Actor  # noqa: PLC0415
+    from apps.genres.models import Genre  # noqa: PLC0415
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        started_at = time.perf_counter()
+        for sql in SEED_SQL:
+            cursor.execute(sql, {'rows': args.rows})
+        for table in INDEXES:
+            cursor.execute(f'ANALYZE {table}')
+        print(f'seed: {args.rows} rows per table in {time.perf_counter() - started_at:.1f}s\n')
+
+        user = get_user_model().objects.create_superuser(username='list-plans-benchmark', password='list-plans-benchmark')
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        queries = [(name, capture_list_query(client, url, table)) for name, table, url in build_scenarios(args.rows)]
+        queries += [(f'{model._meta.db_table} lower', lower_lookup_sql(model)) for model in (Genre, Actor)]
+
+        with_indexes = {name: explain(cursor, sql) for name, sql in queries}
+
+        for table, indexes in INDEXES.items():
+            for index in indexes:
+                cursor.execute(f'DROP INDEX {index}')
+            cursor.execute(f'ANALYZE {table}')
+
+        without_indexes = {name: explain(cursor, sql) for name, sql in queries}
+
+        print(f'{"query":<22} {"with indexes":<52} {"without indexes"}')
+        for name, _ in queries:
+            plan, elapsed = with_indexes[name]
+            plan_without, elapsed_without = without_indexes[name]
+            print(f'{name:<22} {f"{plan} {elapsed:.2f}ms":<52} {plan_without} {elapsed_without:.2f}ms')
+
+        transaction.set_rollback(True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""
+Mostra o plano de execução dos filtros da listagem de filmes com e sem os índices.
+
+Gera uma massa sintética (por padrão 1 milhão de filmes em 50 gêneros, com
+datas de lançamento entre 1950 e 2024, notas médias e 2 atores por filme de um
+elenco de 100 mil atores) dentro de uma transação desfeita ao final, chama
+GET /api/v1/movies/ com cada filtro e roda EXPLAIN ANALYZE na consulta da
+página e no COUNT(*) da paginação por número de página:
+
+- genre: movie_genre_title_uuid_idx (genre_id, title, uuid)
+- actor: índice de actor_id da tabela movies_movie_actors
+- release_year: movie_release_date_idx (intervalo de 2 anos)
+- min_rate: movie_average_stars_idx (nota média >= 4.9)
+- combinados: genre + release_year + min_rate (nota média >= 4.5)
+
+Cada consulta é medida com os índices e depois com eles removidos (DROP INDEX
+também é desfeito pelo rollback). Rode contra um banco de desenvolvimento: o
+DROP INDEX bloqueia as tabelas até o fim do script.
+
+Uso (com as variáveis do .env carregadas e o banco migrado):
+
+    python benchmarks/movie_list_filters.py --rows 1000000
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+GENRES = 50
+ACTORS = 100_000
+
+INDEXES = ['movie_genre_title_uuid_idx', 'movie_release_date_idx', 'movie_average_stars_idx']
+# Índice de actor_id criado pelo Django para a tabela do M2M (nome com hash).
+ACTOR_INDEX_SQL = "SELECT indexname FROM pg_indexes WHERE tablename = 'movies_movie_actors' AND indexdef LIKE '%(actor_id)'"
+
+SEED_SQL = [
+    f"""
+    INSERT INTO genres_genre (uuid, name, created_at, updated_at)
+    SELECT gen_random_uuid(), 'movie-filters-benchmark ' || i, now(), now() FROM generate_series(1, {GENRES}) i
+    """,
+    f"""
+    INSERT INTO actors_actor (uuid, name, created_at, updated_at)
+    SELECT gen_random_uuid(), md5(i::text), now(), now() FROM generate_series(1, {ACTORS}) i
+    """,
+    """
+    INSERT INTO movies_movie (uuid, title, genre_id, release_date, average_stars, review_count, stars_sum, created_at, updated_at)
+    SELECT gen_random_uuid(), md5(i::text), genres.uuid[1 + i %% array_length(genres.uuid, 1)],
+           date '1950-01-01' + (i::bigint * 7919 %% 27375)::int, CASE WHEN i %% 4 = 0 THEN NULL ELSE 1 + (i * 31 %% 401) / 100.0 END,
+           0, 0, now(), now()
+    FROM generate_series(1, %(rows)s) i,
+         (SELECT array_agg(uuid) AS uuid FROM genres_genre WHERE name LIKE 'movie-filters-benchmark %%') genres
+    """,
+    """
+    INSERT INTO movies_movie_actors (movie_id, actor_id)
+    SELECT movies.uuid, actors.uuid[1 + (movies.n * slots.k * 7) %% array_length(actors.uuid, 1)]
+    FROM (SELECT uuid, row_number() OVER () AS n FROM movies_movie) movies,
+         (SELECT array_agg(uuid) AS uuid FROM actors_actor) actors,
+         generate_series(1, 2) slots(k)
+    ON CONFLICT DO NOTHING
+    """,
+]
+
+
+def explain(cursor, sql: str) -> tuple[str, float]:
+    cursor.execute(f'EXPLAIN (ANALYZE, FORMAT TEXT) {sql}')
+    plan = '\n'.join(row[0] for row in cursor.fetchall())
+
+    # Nós de acesso às tabelas filtradas (o gênero do select_related também aparece no plano).
+    accesses = re.findall(r'(Index Only Scan|Index Scan|Bitmap Index Scan|Seq Scan)(?: using| on) (movie\w+)', plan)
+    sort = re.search(r'(Incremental )?Sort  ', plan)
+    execution_time = float(re.search(r'Execution Time: ([\d.]+) ms', plan).group(1))
+
+    label = ' + '.join(dict.fromkeys(f'{node} {name}' for node, name in accesses)) or '?'
+    if sort:
+        label = f'Sort + {label}'
+    return label, execution_time
+
+
+def capture_list_queries(client, params: dict) -> tuple[str, str]:
+    from django.db import connection  # noqa: PLC0415
+    from django.test.utils import CaptureQueriesContext  # noqa: PLC0415
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get('/api/v1/movies/', params)
+    assert response.status_code == 200, response.content  # noqa: PLR2004
+
+    movie_queries = [query['sql'] for query in queries if 'FROM "movies_movie"' in query['sql']]
+    page_sql = next(sql for sql in movie_queries if 'LIMIT' in sql)
+    count_sql = next(sql for sql in movie_queries if sql.startswith('SELECT COUNT(*)'))
+    return page_sql, count_sql
+
+
+def build_scenarios() -> list[tuple[str, dict]]:
+    from apps.genres.models import Genre  # noqa: PLC0415
+    from apps.movies.models import Movie  # noqa: PLC0415
+
+    genre = Genre.objects.filter(name__startswith='movie-filters-benchmark').order_by('name').first()
+    actor_id = Movie.actors.through.objects.values_list('actor_id', flat=True).first()
+    release_years = {'min_release_year': 2001, 'max_release_year': 2002}
+
+    return [
+        ('genre', {'genre': genre.uuid}),
+        ('actor', {'actor': actor_id}),
+        ('release_year', release_years),
+        ('min_rate', {'min_rate': 4.9}),
+        ('combinados', {'genre': genre.uuid, 'min_rate': 4.5, **release_years}),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+
+    import django  # noqa: PLC0415
+
+    django.setup()
+
+    from django.contrib.auth import get_user_model  # noqa: PLC0415
+    from django.db import connection, transaction  # noqa: PLC0415
+    from rest_framework.test import APIClient  # noqa: PLC0415
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        started_at = time.perf_counter()
+        for sql in SEED_SQL:
+            cursor.execute(sql, {'rows': args.rows})
+        cursor.execute('ANALYZE movies_movie')
+        cursor.execute('ANALYZE movies_movie_actors')
+        print(f'seed: {args.rows} movies in {time.perf_counter() - started_at:.1f}s\n')
+
+        user = get_user_model().objects.create_superuser(username='movie-filters-benchmark', password='movie-filters-benchmark')
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        queries = []
+        for name, params in build_scenarios():
+            page_sql, count_sql = capture_list_queries(client, params)
+            queries += [(f'{name} page', page_sql), (f'{name} count', count_sql)]
+
+        with_indexes = {name: explain(cursor, sql) for name, sql in queries}
+
+        cursor.execute(ACTOR_INDEX_SQL)
+        for index in INDEXES + [row[0] for row in cursor.fetchall()]:
+            cursor.execute(f'DROP INDEX {index}')
+        cursor.execute('ANALYZE movies_movie')
+        cursor.execute('ANALYZE movies_movie_actors')
+
+        without_indexes = {name: explain(cursor, sql) for name, sql in queries}
+
+        print(f'{"query":<20} {"with indexes":<100} {"without indexes"}')
+        for name, _ in queries:
+            plan, elapsed = with_indexes[name]
+            plan_without, elapsed_without = without_indexes[name]
+            print(f'{name:<20} {f"{plan} {elapsed:.2f}ms":<100} {plan_without} {elapsed_without:.2f}ms')
+
+        transaction.set_rollback(True)
+
+
+if __name__ == '__main__':
+    main()
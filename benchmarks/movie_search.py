@@ -0,0 +1,147 @@
+"""
+Mostra o plano de execução da busca textual de filmes com e sem o search_vector indexado.
+
+Gera uma massa sintética (por padrão 1 milhão de filmes, com títulos e resumos
+formados por palavras pseudo-aleatórias) dentro de uma transação desfeita ao
+final, preenche o search_vector com o MovieSearchService e roda EXPLAIN ANALYZE
+em três variantes da mesma busca:
+
+- gin: GET /api/v1/movies/search/?q= (search_vector armazenado + índice GIN)
+- sem-indice: a mesma consulta sem o índice movie_search_vector_idx
+- on-the-fly: to_tsvector(title || resume) calculado em toda consulta, sem coluna armazenada
+
+Cada variante é medida na primeira página e na página seguinte (cursor). Rode
+contra um banco de desenvolvimento: o DROP INDEX bloqueia a tabela até o fim do
+script.
+
+Uso (com as variáveis do .env carregadas e o banco migrado):
+
+    python benchmarks/movie_search.py --rows 1000000
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SEARCH_INDEX = 'movie_search_vector_idx'
+# Vocabulário de 5000 palavras: cada palavra aparece em poucos filmes a cada 1000.
+VOCABULARY_SIZE = 5000
+
+WORD_FUNCTION_SQL = f"""
+CREATE FUNCTION pg_temp.w(bigint) RETURNS text IMMUTABLE LANGUAGE sql
+AS $$ SELECT 'w' || substr(md5(($1 % {VOCABULARY_SIZE})::text), 1, 7) $$
+"""
+
+SEED_SQL = """
+INSERT INTO movies_movie (uuid, title, resume, genre_id, review_count, stars_sum, created_at, updated_at)
+SELECT gen_random_uuid(),
+       concat_ws(' ', pg_temp.w(i), pg_temp.w(i * 7), pg_temp.w(i * 13)),
+       concat_ws(' ', pg_temp.w(i * 3), pg_temp.w(i * 5), pg_temp.w(i * 11), pg_temp.w(i * 17), pg_temp.w(i * 19), pg_temp.w(i * 23)),
+       (SELECT uuid FROM genres_genre LIMIT 1), 0, 0, now(), now()
+FROM generate_series(1, %(rows)s) i
+"""
+
+
+def word(index: int) -> str:
+    # Mesma palavra gerada por pg_temp.w(index) no SQL.
+    return 'w' + hashlib.md5(str(index % VOCABULARY_SIZE).encode()).hexdigest()[:7]
+
+
+def explain(cursor, sql: str) -> tuple[str, float]:
+    cursor.execute(f'EXPLAIN (ANALYZE, FORMAT TEXT) {sql}')
+    plan = '\n'.join(row[0] for row in cursor.fetchall())
+
+    # Nó de acesso à tabela de filmes (o gênero do select_related também aparece no plano).
+    access = re.search(rf'(Bitmap Index Scan) on ({SEARCH_INDEX})|(Seq Scan) on (movies_movie)', plan)
+    execution_time = float(re.search(r'Execution Time: ([\d.]+) ms', plan).group(1))
+
+    return (' '.join(part for part in access.groups() if part) if access else '?'), execution_time
+
+
+def capture_search_queries(client, term: str) -> tuple[str, str]:
+    from django.db import connection  # noqa: PLC0415
+    from django.test.utils import CaptureQueriesContext  # noqa: PLC0415
+
+    def capture(url: str, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, params)
+        assert response.status_code == 200, response.content  # noqa: PLR2004
+        sql = next(query['sql'] for query in queries if 'FROM "movies_movie"' in query['sql'] and 'LIMIT' in query['sql'])
+        return sql, response
+
+    first_page, response = capture('/api/v1/movies/search/', {'q': term})
+    next_page, _ = capture(response.data['next'])
+    return first_page, next_page
+
+
+def on_the_fly_sql(queries: tuple[str, str]) -> tuple[str, str]:
+    # A mesma consulta trocando a coluna armazenada pelo to_tsvector das colunas (sem os nomes dos atores).
+    from django.conf import settings  # noqa: PLC0415
+
+    config = settings.MOVIE_SEARCH_CONFIG
+    expression = (
+        f"(setweight(to_tsvector('{config}'::regconfig, COALESCE(\"movies_movie\".\"title\", '')), 'A') || "
+        f"setweight(to_tsvector('{config}'::regconfig, COALESCE(\"movies_movie\".\"resume\", '')), 'B'))"
+    )
+    return tuple(sql.replace('"movies_movie"."search_vector"', expression) for sql in queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+
+    import django  # noqa: PLC0415
+
+    django.setup()
+
+    from django.contrib.auth import get_user_model  # noqa: PLC0415
+    from django.db import connection, transaction  # noqa: PLC0415
+    from rest_framework.test import APIClient  # noqa: PLC0415
+
+    from apps.genres.models import Genre  # noqa: PLC0415
+    from apps.movies.services.search_service import search_service  # noqa: PLC0415
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        started_at = time.perf_counter()
+        Genre.objects.create(name='movie-search-benchmark')
+        cursor.execute(WORD_FUNCTION_SQL)
+        cursor.execute(SEED_SQL, {'rows': args.rows})
+        search_service().refresh()
+        cursor.execute('ANALYZE movies_movie')
+        print(f'seed: {args.rows} movies with search vectors in {time.perf_counter() - started_at:.1f}s\n')
+
+        user = get_user_model().objects.create_superuser(username='movie-search-benchmark', password='movie-search-benchmark')
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        term = word(42)
+        queries = capture_search_queries(client, term)
+        results = {
+            'gin': [explain(cursor, sql) for sql in queries],
+            'on-the-fly': [explain(cursor, sql) for sql in on_the_fly_sql(queries)],
+        }
+
+        cursor.execute(f'DROP INDEX {SEARCH_INDEX}')
+        cursor.execute('ANALYZE movies_movie')
+        results['sem-indice'] = [explain(cursor, sql) for sql in queries]
+
+        print(f'term: {term} ({search_service().search(term).count()} matches)\n')
+        print(f'{"variant":<12} {"first page":<56} {"next page (cursor)"}')
+        for name in ('gin', 'sem-indice', 'on-the-fly'):
+            (plan, elapsed), (plan_next, elapsed_next) = results[name]
+            print(f'{name:<12} {f"{plan} {elapsed:.2f}ms":<56} {plan_next} {elapsed_next:.2f}ms')
+
+        transaction.set_rollback(True)
+
+
+if __name__ == '__main__':
+    main()
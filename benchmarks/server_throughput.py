@@ -0,0 +1,157 @@
+"""
+Compara requisições/segundo em GET /api/v1/movies/ entre os modos do servidor web.
+
+Cada modo sobe o servidor como o entrypoint faria, em um processo separado:
+
+- runserver: `manage.py runserver` (servidor de desenvolvimento)
+- wsgi: gunicorn com app.wsgi e infrastructure/gunicorn.conf.py
+- asgi: gunicorn com workers uvicorn e app.asgi
+
+Antes das medições cria um usuário e N filmes com prefixo próprio, removidos ao
+final. As requisições usam conexões keep-alive, uma por cliente concorrente.
+Workers, threads etc. do gunicorn seguem as variáveis GUNICORN_* do ambiente.
+
+Uso (com as variáveis do .env carregadas e o banco migrado):
+
+    python benchmarks/server_throughput.py --requests 2000 --concurrency 16 --modes runserver wsgi asgi
+"""
+
+import argparse
+import http.client
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BASE_DIR))
+
+BENCHMARK_PREFIX = 'server-benchmark'
+MOVIES_PATH = '/api/v1/movies/'
+
+
+def server_command(mode: str, port: int) -> list[str]:
+    if mode == 'runserver':
+        return [sys.executable, 'manage.py', 'runserver', f'127.0.0.1:{port}', '--noreload']
+
+    application = 'app.asgi:application' if mode == 'asgi' else 'app.wsgi:application'
+    return [sys.executable, '-m', 'gunicorn', application, '-c', 'infrastructure/gunicorn.conf.py']
+
+
+def wait_for_port(port: int, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket() as sock:
+            if sock.connect_ex(('127.0.0.1', port)) == 0:
+                return
+        time.sleep(0.2)
+    raise RuntimeError(f'Server did not start on port {port}')
+
+
+def obtain_token(port: int) -> str:
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    body = json.dumps({'username': BENCHMARK_PREFIX, 'password': BENCHMARK_PREFIX})
+    connection.request('POST', '/api/v1/authentication/token/', body=body, headers={'Content-Type': 'application/json'})
+    response = connection.getresponse()
+    data = json.loads(response.read())
+    connection.close()
+    return data['access']
+
+
+def percentile(values: list[float], percent: int) -> float:
+    return statistics.quantiles(values, n=100)[percent - 1] if len(values) > 1 else values[0]
+
+
+def run_load(port: int, token: str, total_requests: int, concurrency: int) -> tuple[float, list[float], int]:
+    headers = {'Authorization': f'Bearer {token}'}
+    local = threading.local()
+
+    def request(_) -> tuple[float, int]:
+        if not hasattr(local, 'connection'):
+            local.connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+
+        started_at = time.perf_counter()
+        try:
+            local.connection.request('GET', MOVIES_PATH, headers=headers)
+            response = local.connection.getresponse()
+            response.read()
+            status = response.status
+        except (http.client.HTTPException, OSError):
+            # O servidor pode fechar a conexão (ex.: runserver, max_requests); reabre na próxima.
+            local.connection.close()
+            del local.connection
+            status = 0
+        return time.perf_counter() - started_at, status
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(request, range(total_requests)))
+    elapsed = time.perf_counter() - started_at
+
+    durations = [duration for duration, _ in results]
+    errors = sum(1 for _, status in results if status != 200)  # noqa: PLR2004
+    return elapsed, durations, errors
+
+
+def benchmark_mode(mode: str, port: int, total_requests: int, concurrency: int) -> None:
+    env = {**os.environ, 'SERVER_MODE': mode, 'GUNICORN_BIND': f'127.0.0.1:{port}', 'GUNICORN_ACCESS_LOG': ''}
+    server = subprocess.Popen(server_command(mode, port), cwd=BASE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_for_port(port)
+        token = obtain_token(port)
+        # Aquecimento: conexões com o banco, caches de permissão e imports preguiçosos.
+        run_load(port, token, concurrency * 2, concurrency)
+        elapsed, durations, errors = run_load(port, token, total_requests, concurrency)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=30)
+
+    print(
+        f'{mode:<10} requests={total_requests} concurrency={concurrency} throughput={total_requests / elapsed:.1f} req/s '
+        f'p50={percentile(durations, 50) * 1000:.0f}ms p95={percentile(durations, 95) * 1000:.0f}ms errors={errors}'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modes', nargs='+', choices=['runserver', 'wsgi', 'asgi'], default=['runserver', 'wsgi', 'asgi'])
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--movies', type=int, default=100)
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+
+    import django  # noqa: PLC0415
+
+    django.setup()
+
+    from django.contrib.auth import get_user_model  # noqa: PLC0415
+
+    from apps.genres.models import Genre  # noqa: PLC0415
+    from apps.movies.models import Movie  # noqa: PLC0415
+
+    User = get_user_model()
+    user = User.objects.create_superuser(username=BENCHMARK_PREFIX, email=f'{BENCHMARK_PREFIX}@flix.com', password=BENCHMARK_PREFIX)
+    genre = Genre.objects.create(name=BENCHMARK_PREFIX)
+    Movie.objects.bulk_create([Movie(title=f'{BENCHMARK_PREFIX} {index}', genre=genre) for index in range(args.movies)])
+
+    try:
+        for mode in args.modes:
+            benchmark_mode(mode, args.port, args.requests, args.concurrency)
+    finally:
+        Movie.objects.filter(genre=genre).delete()
+        genre.delete()
+        user.delete()
+
+
+if __name__ == '__main__':
+    main()
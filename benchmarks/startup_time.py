@@ -0,0 +1,66 @@
+"""
+Mede o tempo de inicialização da aplicação em processos novos.
+
+Cada cenário roda em um interpretador limpo, várias vezes, e mostra a mediana
+em milissegundos e se o SDK da OpenAI acabou importado:
+
+- wsgi: get_wsgi_application() + carregamento das URLs (boot de um worker web)
+- manage: `manage.py check` (o que todo comando de gerenciamento paga)
+
+Uso (com as variáveis do .env carregadas):
+
+    python benchmarks/startup_time.py --runs 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    'wsgi': """
+import json, os, sys, time
+start = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+from django.urls import get_resolver
+get_resolver().url_patterns
+print(json.dumps({'elapsed': time.perf_counter() - start, 'openai': 'openai' in sys.modules}))
+""",
+    'manage': """
+import json, os, sys, time
+start = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'app.settings')
+from django.core.management import call_command
+import django
+django.setup()
+call_command('check', verbosity=0)
+print(json.dumps({'elapsed': time.perf_counter() - start, 'openai': 'openai' in sys.modules}))
+""",
+}
+
+
+def run_scenario(code: str) -> dict:
+    result = subprocess.run([sys.executable, '-c', code], cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    for name, code in SCENARIOS.items():
+        results = [run_scenario(code) for _ in range(args.runs)]
+        median = statistics.median(result['elapsed'] for result in results) * 1000
+        openai_loaded = any(result['openai'] for result in results)
+        print(f'{name:<8} median={median:.0f}ms runs={args.runs} openai_imported={openai_loaded}')
+
+
+if __name__ == '__main__':
+    main()
@@ -17,5 +17,22 @@ echo "✅ Redis ready! Starting migrations..."
 echo "🛠️ Running migrations..."
 python manage.py migrate --noinput
 
-echo "🚀 Starting Django server..."
-python manage.py runserver 0.0.0.0:8000
+# SERVER_MODE: runserver (desenvolvimento), wsgi (gunicorn) ou asgi (gunicorn + workers uvicorn)
+SERVER_MODE=${SERVER_MODE:-runserver}
+
+case "$SERVER_MODE" in
+  wsgi)
+    echo "🚀 Starting gunicorn (WSGI)..."
+    exec gunicorn app.wsgi:application -c infrastructure/gunicorn.conf.py
+    ;;
+  asgi)
+    # No ASGI as conexões persistentes não são reaproveitadas entre requisições; use POSTGRES_POOL=true.
+    export POSTGRES_CONN_MAX_AGE=${POSTGRES_CONN_MAX_AGE:-0}
+    echo "🚀 Starting gunicorn with uvicorn workers (ASGI)..."
+    exec gunicorn app.asgi:application -c infrastructure/gunicorn.conf.py
+    ;;
+  *)
+    echo "🚀 Starting Django server..."
+    exec python manage.py runserver 0.0.0.0:8000
+    ;;
+esac
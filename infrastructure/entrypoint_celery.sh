@@ -17,4 +17,5 @@ done
 echo "✅Redis ready! Starting Celery Worker..."
 
 # Run Celery Worker
-exec celery -A app worker --loglevel=info
+# --beat agenda as tasks periódicas (digest de notificações de reviews) no próprio worker
+exec celery -A app worker --beat --loglevel=info
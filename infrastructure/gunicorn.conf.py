@@ -0,0 +1,42 @@
+"""
+Configuração do gunicorn usada pelo entrypoint quando SERVER_MODE é wsgi ou asgi.
+
+Todos os valores vêm de variáveis de ambiente (veja .env.example):
+
+    gunicorn app.wsgi:application -c infrastructure/gunicorn.conf.py
+    SERVER_MODE=asgi gunicorn app.asgi:application -c infrastructure/gunicorn.conf.py
+"""
+
+import multiprocessing
+import os
+
+SERVER_MODE = os.environ.get('SERVER_MODE', 'wsgi')
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Padrão recomendado pelo gunicorn: (2 x CPUs) + 1 processos
+workers = int(os.environ.get('GUNICORN_WORKERS') or multiprocessing.cpu_count() * 2 + 1)
+# Com mais de uma thread por processo o worker síncrono vira gthread
+threads = int(os.environ.get('GUNICORN_THREADS', '1'))
+
+if SERVER_MODE == 'asgi':
+    worker_class = 'uvicorn.workers.UvicornWorker'
+else:
+    worker_class = 'gthread' if threads > 1 else 'sync'
+
+# Segundos que uma conexão ociosa fica aberta esperando a próxima requisição
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', '5'))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+
+# Recicla cada worker após N requisições (0 desativa); o jitter evita que todos reiniciem juntos
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', '1000'))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', '100'))
+
+# Carrega o Django uma vez no master antes do fork (menos memória, boot mais rápido)
+preload_app = os.environ.get('GUNICORN_PRELOAD_APP', 'False').lower() == 'true'
+
+# Vazio desativa o log de acesso
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-') or None
+errorlog = '-'
+loglevel = os.environ.get('GUNICORN_LOG_LEVEL', 'info')